@@ -0,0 +1,28 @@
+"""Add (user_id, created_at) index to watchlists
+
+Revision ID: a1c4e7f2b9d3
+Revises: e3f8a9c5b2d1
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1c4e7f2b9d3'
+down_revision: Union[str, None] = 'e3f8a9c5b2d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index watchlists for the per-user single-query watchlist read."""
+    op.create_index('idx_watchlist_user_created', 'watchlists', ['user_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the per-user watchlist index."""
+    op.drop_index('idx_watchlist_user_created', table_name='watchlists')
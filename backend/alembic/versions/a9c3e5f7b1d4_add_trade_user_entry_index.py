@@ -0,0 +1,28 @@
+"""Add trade user entry index
+
+Revision ID: a9c3e5f7b1d4
+Revises: f2a7d9e4b6c8
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9c3e5f7b1d4'
+down_revision: Union[str, None] = 'f2a7d9e4b6c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index trades by (user_id, entry_date, id) for cursor pagination and analytics."""
+    op.create_index('idx_trade_user_entry', 'trades', ['user_id', 'entry_date', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the trade user entry index."""
+    op.drop_index('idx_trade_user_entry', table_name='trades')
@@ -0,0 +1,55 @@
+"""Share analysis history across users
+
+Revision ID: b4d8f2a6c0e3
+Revises: a9c3e5f7b1d4
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4d8f2a6c0e3'
+down_revision: Union[str, None] = 'a9c3e5f7b1d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace per-user JSON history with one delta-encoded row per (symbol_id, analysis_date).
+
+    The old table was never written to, so it is recreated rather than migrated.
+    """
+    op.drop_index('ix_analysis_history_id', table_name='analysis_history')
+    op.drop_table('analysis_history')
+    op.create_table('analysis_history',
+    sa.Column('symbol_id', sa.Integer(), nullable=False),
+    sa.Column('analysis_date', sa.Date(), nullable=False),
+    sa.Column('is_keyframe', sa.Boolean(), nullable=False),
+    sa.Column('payload', sa.LargeBinary(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['symbol_id'], ['symbols.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('symbol_id', 'analysis_date')
+    )
+
+
+def downgrade() -> None:
+    """Restore the per-user JSON history table (stored history is discarded)."""
+    op.drop_table('analysis_history')
+    op.create_table('analysis_history',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('symbol_id', sa.Integer(), nullable=False),
+    sa.Column('analysis_date', sa.Date(), nullable=False),
+    sa.Column('market_state_snapshot', sa.JSON(), nullable=True),
+    sa.Column('indicators_snapshot', sa.JSON(), nullable=True),
+    sa.Column('recommendations', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['symbol_id'], ['symbols.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_analysis_history_id'), 'analysis_history', ['id'], unique=False)
@@ -0,0 +1,130 @@
+"""Add symbol_latest_snapshot table
+
+Revision ID: b7d2e5f8a1c6
+Revises: a1c4e7f2b9d3
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2e5f8a1c6'
+down_revision: Union[str, None] = 'a1c4e7f2b9d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the per-symbol latest snapshot table and backfill it from history tables."""
+    op.create_table('symbol_latest_snapshot',
+    sa.Column('symbol_id', sa.Integer(), nullable=False),
+    sa.Column('close', sa.Float(), nullable=True),
+    sa.Column('indicator_date', sa.Date(), nullable=True),
+    sa.Column('atr', sa.Float(), nullable=True),
+    sa.Column('atr_ratio', sa.Float(), nullable=True),
+    sa.Column('bb_upper', sa.Float(), nullable=True),
+    sa.Column('bb_middle', sa.Float(), nullable=True),
+    sa.Column('bb_lower', sa.Float(), nullable=True),
+    sa.Column('bb_width', sa.Float(), nullable=True),
+    sa.Column('bb_width_ratio', sa.Float(), nullable=True),
+    sa.Column('adx', sa.Float(), nullable=True),
+    sa.Column('plus_di', sa.Float(), nullable=True),
+    sa.Column('minus_di', sa.Float(), nullable=True),
+    sa.Column('std_dev', sa.Float(), nullable=True),
+    sa.Column('vix', sa.Float(), nullable=True),
+    sa.Column('market_state_date', sa.Date(), nullable=True),
+    sa.Column('trend_type', sa.String(), nullable=True),
+    sa.Column('volatility_level', sa.String(), nullable=True),
+    sa.Column('risk_level', sa.String(), nullable=True),
+    sa.Column('recommended_strategy', sa.String(), nullable=True),
+    sa.Column('position_sizing_ratio', sa.Float(), nullable=True),
+    sa.Column('f_score', sa.Integer(), nullable=True),
+    sa.Column('f_score_max', sa.Integer(), nullable=True),
+    sa.Column('f_score_calculated_at', sa.DateTime(), nullable=True),
+    sa.Column('signal_id', sa.Integer(), nullable=True),
+    sa.Column('signal_type', sa.String(length=20), nullable=True),
+    sa.Column('signal_strength', sa.String(length=20), nullable=True),
+    sa.Column('signal_price', sa.Float(), nullable=True),
+    sa.Column('signal_risk_level', sa.String(length=20), nullable=True),
+    sa.Column('signal_generated_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['symbol_id'], ['symbols.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('symbol_id')
+    )
+    op.create_index('idx_snapshot_signal_generated', 'symbol_latest_snapshot', ['signal_generated_at'], unique=False)
+    op.create_index('idx_snapshot_updated', 'symbol_latest_snapshot', ['updated_at'], unique=False)
+
+    # Backfill: one row per symbol, then the latest row of each history table
+    op.execute("""
+        INSERT INTO symbol_latest_snapshot (symbol_id, updated_at)
+        SELECT id, COALESCE(updated_at, created_at) FROM symbols
+    """)
+    op.execute("""
+        UPDATE symbol_latest_snapshot s
+        SET indicator_date = ti.date,
+            atr = ti.atr, atr_ratio = ti.atr_ratio,
+            bb_upper = ti.bb_upper, bb_middle = ti.bb_middle, bb_lower = ti.bb_lower,
+            bb_width = ti.bb_width, bb_width_ratio = ti.bb_width_ratio,
+            adx = ti.adx, plus_di = ti.plus_di, minus_di = ti.minus_di,
+            std_dev = ti.std_dev, vix = ti.vix
+        FROM (
+            SELECT DISTINCT ON (symbol_id) *
+            FROM technical_indicators
+            ORDER BY symbol_id, date DESC
+        ) ti
+        WHERE ti.symbol_id = s.symbol_id
+    """)
+    op.execute("""
+        UPDATE symbol_latest_snapshot s
+        SET market_state_date = ms.date,
+            trend_type = ms.trend_type,
+            volatility_level = ms.volatility_level,
+            risk_level = ms.risk_level,
+            recommended_strategy = ms.recommended_strategy,
+            position_sizing_ratio = ms.position_sizing_ratio
+        FROM (
+            SELECT DISTINCT ON (symbol_id) *
+            FROM market_states
+            ORDER BY symbol_id, date DESC
+        ) ms
+        WHERE ms.symbol_id = s.symbol_id
+    """)
+    op.execute("""
+        UPDATE symbol_latest_snapshot s
+        SET f_score = fs.f_score,
+            f_score_max = fs.max_score,
+            f_score_calculated_at = fs.calculated_at
+        FROM (
+            SELECT DISTINCT ON (symbol_id) *
+            FROM fundamental_scores
+            ORDER BY symbol_id, calculated_at DESC
+        ) fs
+        WHERE fs.symbol_id = s.symbol_id
+    """)
+    op.execute("""
+        UPDATE symbol_latest_snapshot s
+        SET signal_id = ts.id,
+            signal_type = ts.signal_type,
+            signal_strength = ts.signal_strength,
+            signal_price = ts.current_price,
+            signal_risk_level = ts.risk_level,
+            signal_generated_at = ts.generated_at,
+            close = ts.current_price
+        FROM (
+            SELECT DISTINCT ON (symbol_id) *
+            FROM trading_signals
+            ORDER BY symbol_id, generated_at DESC
+        ) ts
+        WHERE ts.symbol_id = s.symbol_id
+    """)
+
+
+def downgrade() -> None:
+    """Drop the per-symbol latest snapshot table."""
+    op.drop_index('idx_snapshot_updated', table_name='symbol_latest_snapshot')
+    op.drop_index('idx_snapshot_signal_generated', table_name='symbol_latest_snapshot')
+    op.drop_table('symbol_latest_snapshot')
@@ -0,0 +1,28 @@
+"""Add signal_bar_date to symbol_latest_snapshot
+
+Revision ID: c3e9f1a7d5b2
+Revises: d8a2f6c4e1b7
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e9f1a7d5b2'
+down_revision: Union[str, None] = 'd8a2f6c4e1b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Record the bar date each snapshot signal was generated from (used for ETags)."""
+    op.add_column('symbol_latest_snapshot', sa.Column('signal_bar_date', sa.Date(), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop signal_bar_date from symbol_latest_snapshot."""
+    op.drop_column('symbol_latest_snapshot', 'signal_bar_date')
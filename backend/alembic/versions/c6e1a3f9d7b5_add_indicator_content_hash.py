@@ -0,0 +1,31 @@
+"""Add indicator content hash
+
+Revision ID: c6e1a3f9d7b5
+Revises: b4d8f2a6c0e3
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6e1a3f9d7b5'
+down_revision: Union[str, None] = 'b4d8f2a6c0e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Store a per-row hash of indicator values so unchanged rows are skipped on upsert.
+
+    Existing rows keep a NULL hash and are rewritten once by the next refresh.
+    """
+    op.add_column('technical_indicators', sa.Column('content_hash', sa.BigInteger(), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop the indicator content hash column."""
+    op.drop_column('technical_indicators', 'content_hash')
@@ -0,0 +1,40 @@
+"""Add keyset pagination indexes
+
+Revision ID: d5f1b8c3e7a9
+Revises: c3e9f1a7d5b2
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5f1b8c3e7a9'
+down_revision: Union[str, None] = 'c3e9f1a7d5b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index the (sort key, id) pairs used by cursor pagination."""
+    op.create_index('idx_trading_signal_symbol_generated', 'trading_signals', ['symbol_id', 'generated_at', 'id'], unique=False)
+
+    op.drop_index('idx_snapshot_signal_generated', table_name='symbol_latest_snapshot')
+    op.create_index('idx_snapshot_signal_generated', 'symbol_latest_snapshot', ['signal_generated_at', 'symbol_id'], unique=False)
+
+    op.drop_index('idx_snapshot_updated', table_name='symbol_latest_snapshot')
+    op.create_index('idx_snapshot_updated', 'symbol_latest_snapshot', ['updated_at', 'symbol_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Restore the single-column snapshot indexes."""
+    op.drop_index('idx_snapshot_updated', table_name='symbol_latest_snapshot')
+    op.create_index('idx_snapshot_updated', 'symbol_latest_snapshot', ['updated_at'], unique=False)
+
+    op.drop_index('idx_snapshot_signal_generated', table_name='symbol_latest_snapshot')
+    op.create_index('idx_snapshot_signal_generated', 'symbol_latest_snapshot', ['signal_generated_at'], unique=False)
+
+    op.drop_index('idx_trading_signal_symbol_generated', table_name='trading_signals')
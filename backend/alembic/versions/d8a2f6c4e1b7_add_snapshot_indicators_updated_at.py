@@ -0,0 +1,35 @@
+"""Add indicators_updated_at to symbol_latest_snapshot
+
+Revision ID: d8a2f6c4e1b7
+Revises: b7d2e5f8a1c6
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8a2f6c4e1b7'
+down_revision: Union[str, None] = 'b7d2e5f8a1c6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Record when each snapshot's indicators were computed (used for session freshness).
+
+    updated_at also moves on signal/F-score writes, so it cannot tell whether the indicators are current.
+    Existing rows stay NULL and are treated as stale until their next refresh.
+    """
+    op.add_column(
+        'symbol_latest_snapshot',
+        sa.Column('indicators_updated_at', sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Drop indicators_updated_at from symbol_latest_snapshot."""
+    op.drop_column('symbol_latest_snapshot', 'indicators_updated_at')
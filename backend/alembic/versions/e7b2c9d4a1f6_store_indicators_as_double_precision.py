@@ -0,0 +1,60 @@
+"""Store indicators as double precision
+
+Revision ID: e7b2c9d4a1f6
+Revises: c6e1a3f9d7b5
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b2c9d4a1f6'
+down_revision: Union[str, None] = 'c6e1a3f9d7b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# column -> previous Numeric scale
+INDICATOR_COLUMNS = {
+    'atr': 4,
+    'atr_ratio': 6,
+    'bb_upper': 4,
+    'bb_middle': 4,
+    'bb_lower': 4,
+    'bb_width': 4,
+    'bb_width_ratio': 6,
+    'adx': 4,
+    'plus_di': 4,
+    'minus_di': 4,
+    'vix': 4,
+    'std_dev': 4,
+}
+
+
+def upgrade() -> None:
+    """Convert technical indicator columns from Numeric(10, 4/6) to double precision.
+
+    Values are read and written as native floats, and small ratios are no longer truncated.
+    All columns change in one ALTER TABLE so the table is rewritten only once.
+    """
+    op.execute(
+        'ALTER TABLE technical_indicators '
+        + ', '.join(
+            f'ALTER COLUMN {column} TYPE double precision USING {column}::double precision'
+            for column in INDICATOR_COLUMNS
+        )
+    )
+
+
+def downgrade() -> None:
+    """Convert technical indicator columns back to Numeric(10, 4/6) (values are rounded)."""
+    op.execute(
+        'ALTER TABLE technical_indicators '
+        + ', '.join(
+            f'ALTER COLUMN {column} TYPE numeric(10, {scale}) USING {column}::numeric(10, {scale})'
+            for column, scale in INDICATOR_COLUMNS.items()
+        )
+    )
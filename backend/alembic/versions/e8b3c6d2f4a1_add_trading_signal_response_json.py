@@ -0,0 +1,28 @@
+"""Add response_json to trading_signals
+
+Revision ID: e8b3c6d2f4a1
+Revises: d5f1b8c3e7a9
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8b3c6d2f4a1'
+down_revision: Union[str, None] = 'd5f1b8c3e7a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Store the pre-serialized API response alongside each signal."""
+    op.add_column('trading_signals', sa.Column('response_json', sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop the pre-serialized API response column."""
+    op.drop_column('trading_signals', 'response_json')
@@ -0,0 +1,137 @@
+"""Partition time series tables by month
+
+Revision ID: f1c8a5e3b9d2
+Revises: e7b2c9d4a1f6
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from datetime import date, timedelta
+from typing import Iterator, Sequence, Tuple, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c8a5e3b9d2'
+down_revision: Union[str, None] = 'e7b2c9d4a1f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> (symbols FK ondelete, [(index name, columns, unique)])
+TABLES = {
+    'technical_indicators': ('CASCADE', [
+        ('idx_symbol_date', ['symbol_id', 'date'], True),
+        ('ix_technical_indicators_id', ['id'], False),
+    ]),
+    'market_states': ('CASCADE', [
+        ('idx_market_state_symbol_date', ['symbol_id', 'date'], True),
+        ('ix_market_states_id', ['id'], False),
+    ]),
+    'fundamental_scores': (None, [
+        ('ix_fundamental_scores_date', ['date'], False),
+        ('ix_fundamental_scores_id', ['id'], False),
+    ]),
+    'trading_signals': (None, [
+        ('ix_trading_signals_date', ['date'], False),
+        ('ix_trading_signals_id', ['id'], False),
+        ('ix_trading_signals_signal_type', ['signal_type'], False),
+        ('idx_trading_signal_symbol_generated', ['symbol_id', 'generated_at', 'id'], False),
+    ]),
+}
+
+# Monthly partitions are created from one year back (the default retention) to three months ahead;
+# the daily create_partitions task keeps extending the range.
+RETENTION_DAYS = 365
+MONTHS_AHEAD = 3
+
+SIGNAL_SCORE_FK = 'trading_signals_fundamental_score_id_fkey'
+
+
+def _next_month(month: date) -> date:
+    return (month + timedelta(days=32)).replace(day=1)
+
+
+def _months(first: date, last: date) -> Iterator[Tuple[date, date]]:
+    month = first
+    while month <= last:
+        upper = _next_month(month)
+        yield month, upper
+        month = upper
+
+
+def _swap_table(table: str, old_name: str, partitioned: bool) -> None:
+    """Move table aside as old_name and recreate it empty with the same columns, PK and FK."""
+    ondelete, indexes = TABLES[table]
+    op.rename_table(table, old_name)
+    op.execute(f'ALTER TABLE {old_name} RENAME CONSTRAINT {table}_pkey TO {old_name}_pkey')
+    for name, _, _ in indexes:
+        op.drop_index(name, table_name=old_name)
+
+    partition_by = ' PARTITION BY RANGE (date)' if partitioned else ''
+    op.execute(f'CREATE TABLE {table} (LIKE {old_name} INCLUDING DEFAULTS){partition_by}')
+    op.execute(f'ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id')
+    op.create_primary_key(f'{table}_pkey', table, ['id', 'date'] if partitioned else ['id'])
+    op.create_foreign_key(
+        f'{table}_symbol_id_fkey', table, 'symbols', ['symbol_id'], ['id'], ondelete=ondelete
+    )
+
+
+def _copy_and_index(table: str, old_name: str) -> None:
+    """Copy rows back from old_name, drop it and rebuild the secondary indexes."""
+    _, indexes = TABLES[table]
+    op.execute(f'INSERT INTO {table} SELECT * FROM {old_name}')
+    op.drop_table(old_name)
+    for name, columns, unique in indexes:
+        op.create_index(name, table, columns, unique=unique)
+
+
+def upgrade() -> None:
+    """Convert the time series tables to monthly RANGE partitions on their date column.
+
+    Retention then detaches/drops whole partitions instead of running DELETE.
+    Primary keys become (id, date) because unique constraints must include the partition key,
+    so the trading_signals -> fundamental_scores foreign key on id alone is dropped.
+    """
+    conn = op.get_bind()
+    op.drop_constraint(SIGNAL_SCORE_FK, 'trading_signals', type_='foreignkey')
+
+    today = date.today()
+    first_month = (today - timedelta(days=RETENTION_DAYS)).replace(day=1)
+    last_month = today.replace(day=1)
+    for _ in range(MONTHS_AHEAD):
+        last_month = _next_month(last_month)
+
+    for table in TABLES:
+        old_name = f'{table}_unpartitioned'
+        _swap_table(table, old_name, partitioned=True)
+
+        oldest = conn.execute(sa.text(f'SELECT min(date) FROM {old_name}')).scalar()
+        start = first_month
+        if oldest is not None:
+            start = min(start, date(oldest.year, oldest.month, 1))
+        for month, upper in _months(start, last_month):
+            op.execute(
+                f"CREATE TABLE {table}_p{month:%Y_%m} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+            )
+        op.execute(f'CREATE TABLE {table}_default PARTITION OF {table} DEFAULT')
+
+        _copy_and_index(table, old_name)
+
+
+def downgrade() -> None:
+    """Merge the partitions back into plain tables (detached partitions are left untouched)."""
+    for table in TABLES:
+        old_name = f'{table}_partitioned'
+        _swap_table(table, old_name, partitioned=False)
+        _copy_and_index(table, old_name)
+
+    # Signals may point at fundamental scores whose partitions were already dropped
+    op.execute(
+        'UPDATE trading_signals SET fundamental_score_id = NULL '
+        'WHERE fundamental_score_id NOT IN (SELECT id FROM fundamental_scores)'
+    )
+    op.create_foreign_key(
+        SIGNAL_SCORE_FK, 'trading_signals', 'fundamental_scores', ['fundamental_score_id'], ['id']
+    )
@@ -0,0 +1,38 @@
+"""Add price_bars table
+
+Revision ID: f2a7d9e4b6c8
+Revises: e8b3c6d2f4a1
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a7d9e4b6c8'
+down_revision: Union[str, None] = 'e8b3c6d2f4a1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the daily price bar table used by the chart series endpoint."""
+    op.create_table('price_bars',
+    sa.Column('symbol_id', sa.Integer(), nullable=False),
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('open', sa.Float(), nullable=False),
+    sa.Column('high', sa.Float(), nullable=False),
+    sa.Column('low', sa.Float(), nullable=False),
+    sa.Column('close', sa.Float(), nullable=False),
+    sa.Column('volume', sa.BigInteger(), nullable=True),
+    sa.ForeignKeyConstraint(['symbol_id'], ['symbols.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('symbol_id', 'date')
+    )
+
+
+def downgrade() -> None:
+    """Drop the daily price bar table."""
+    op.drop_table('price_bars')
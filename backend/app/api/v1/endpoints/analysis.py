@@ -1,8 +1,68 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from datetime import date, timedelta
+from app.db.session import get_async_db
+from app.core.deps import get_current_user
+from app.core.executor import run_cpu_bound
+from app.core.responses import FastJSONResponse
+from app.models.user import User
+from app.models.symbol import Symbol
+from app.services.analysis_history import ANALYSIS_FIELDS, history_columns, history_range_query
 
 router = APIRouter()
 
+# 기간 미지정 시 기본 조회 기간 (일)
+DEFAULT_HISTORY_DAYS = 90
+
 
 @router.get("/history")
-async def get_analysis_history():
-    return {"message": "Get analysis history endpoint (구현 예정)"}
+async def get_analysis_history(
+    symbol: str = Query(..., description="종목 코드"),
+    fields: Optional[str] = Query(None, description="쉼표로 구분한 필드 (기본값: 전체)"),
+    from_date: Optional[date] = Query(None, alias="from"),
+    to_date: Optional[date] = Query(None, alias="to"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    종목의 일간 분석 이력 조회 (지표 + 시장 상태)
+
+    - **symbol**: 종목 코드
+    - **fields**: 조회할 필드 (예: adx,trend_type,risk_level)
+    - **from** / **to**: 조회 기간 (기본값: 최근 90일)
+
+    응답은 열 지향 형식입니다: {"date": [...], "values": {"adx": [...], ...}}
+    """
+    symbol = symbol.upper()
+    requested = ANALYSIS_FIELDS
+    if fields:
+        requested = tuple(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+        unknown = [f for f in requested if f not in ANALYSIS_FIELDS]
+        if not requested or unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+
+    to_date = to_date or date.today()
+    from_date = from_date or to_date - timedelta(days=DEFAULT_HISTORY_DAYS)
+    if from_date > to_date:
+        raise HTTPException(status_code=400, detail="from must not be after to")
+
+    symbol_id = await db.scalar(select(Symbol.id).where(Symbol.symbol == symbol))
+    if symbol_id is None:
+        raise HTTPException(status_code=404, detail=f"Symbol {symbol} not found")
+
+    rows = (await db.execute(history_range_query(symbol_id, from_date, to_date))).all()
+    history = await run_cpu_bound(
+        history_columns, [tuple(row) for row in rows], from_date, requested
+    )
+
+    return FastJSONResponse(
+        {
+            "symbol": symbol,
+            "from": from_date,
+            "to": to_date,
+            "fields": list(requested),
+            **history,
+        }
+    )
@@ -1,8 +1,214 @@
-from fastapi import APIRouter
+from datetime import date
+import json
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from redis.exceptions import RedisError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.deps import get_current_user, get_current_user_from_query
+from app.core.redis import get_async_redis
+from app.db.session import AsyncSessionLocal, get_async_db
+from app.models.symbol import Symbol
+from app.models.user import User
+from app.models.watchlist import Watchlist
+from app.schemas.data_update import DataUpdateProgress, DataUpdateRequest, DataUpdateResponse
+from app.services.export import (
+    EOS_MARKER,
+    EXPORT_CHUNK_ROWS,
+    EXPORT_DATASETS,
+    EXPORT_FORMATS,
+    ExportUnavailableError,
+    arrow_schema,
+    encode_arrow_chunk,
+    encode_csv_chunk,
+    export_columns,
+    export_query,
+)
+from app.services.refresh import create_refresh_job, get_refresh_job, job_channel, job_progress
 
 router = APIRouter()
 
+# SSE 연결 유지용 heartbeat 간격 (프록시 유휴 타임아웃 방지)
+STREAM_HEARTBEAT_SECONDS = 15
+
+
+async def _owned_job(job_id: str, user: User) -> dict:
+    """사용자 소유 갱신 작업의 진행률 해시 (없으면 404)"""
+    try:
+        fields = await get_refresh_job(job_id)
+    except RedisError:
+        raise HTTPException(status_code=503, detail="Progress tracking unavailable")
+    if not fields or fields.get("user_id") != str(user.id):
+        raise HTTPException(status_code=404, detail=f"Update job {job_id} not found")
+    return fields
+
+
+@router.post("/update", response_model=DataUpdateResponse, status_code=202)
+async def trigger_data_update(
+    update_request: Optional[DataUpdateRequest] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    데이터 수동 갱신 요청
+
+    - **symbols**: 갱신할 종목 목록 (생략 시 관심 종목 전체, 최대 200개)
+
+    종목별 Celery 갱신 작업을 예약하고 진행률 추적용 job을 반환합니다.
+    이미 예약/진행 중인 종목은 다시 예약하지 않고 그 갱신 완료를 기다립니다.
+    진행률은 GET /data/update/{job_id} (폴링) 또는 /data/update/{job_id}/stream (SSE)으로 조회합니다.
+    """
+    not_found = []
+    if update_request and update_request.symbols:
+        requested = list(dict.fromkeys(s.strip().upper() for s in update_request.symbols if s.strip()))
+        rows = (
+            await db.execute(select(Symbol.id, Symbol.symbol).where(Symbol.symbol.in_(requested)))
+        ).all()
+        found = {symbol: symbol_id for symbol_id, symbol in rows}
+        symbol_ids = [found[s] for s in requested if s in found]
+        not_found = [s for s in requested if s not in found]
+    else:
+        symbol_ids = list(
+            (
+                await db.scalars(
+                    select(Watchlist.symbol_id).where(Watchlist.user_id == current_user.id)
+                )
+            ).all()
+        )
+
+    try:
+        progress = await create_refresh_job(current_user.id, symbol_ids)
+    except RedisError:
+        raise HTTPException(status_code=503, detail="Update queue unavailable")
+
+    return DataUpdateResponse(**progress, not_found=not_found)
+
+
+@router.get("/update/{job_id}", response_model=DataUpdateProgress)
+async def get_data_update_progress(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+):
+    """갱신 작업 진행률 조회 (Redis 해시 1회 조회)"""
+    fields = await _owned_job(job_id, current_user)
+    return DataUpdateProgress(**job_progress(job_id, fields))
+
+
+@router.get("/update/{job_id}/stream")
+async def stream_data_update_progress(
+    job_id: str,
+    request: Request,
+    current_user: User = Depends(get_current_user_from_query),
+):
+    """
+    갱신 작업 진행률 구독 (Server-Sent Events)
+
+    - **token**: JWT 액세스 토큰 (쿼리 파라미터)
+
+    종목 하나가 끝날 때마다 `event: progress`를 전송하고, 작업이 끝나면 연결을 닫습니다.
+    """
+    await _owned_job(job_id, current_user)
+
+    async def _events():
+        pubsub = get_async_redis().pubsub()
+        try:
+            # 구독 후 현재 상태를 읽어야 그 사이 발행된 진행률을 놓치지 않음
+            await pubsub.subscribe(job_channel(job_id))
+            fields = await get_refresh_job(job_id)
+            if not fields:
+                return
+            progress = job_progress(job_id, fields)
+            yield f"event: progress\ndata: {json.dumps(progress)}\n\n"
+
+            while progress["status"] == "running" and not await request.is_disconnected():
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=STREAM_HEARTBEAT_SECONDS
+                )
+                if message is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                progress = json.loads(message["data"])
+                yield f"event: progress\ndata: {message['data']}\n\n"
+        finally:
+            await pubsub.aclose()
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        # Content-Encoding: identity — GZip 미들웨어가 이벤트를 버퍼링하지 않도록 압축 제외
+        headers={
+            "Cache-Control": "no-cache",
+            "Content-Encoding": "identity",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
+@router.get("/export/{dataset}")
+async def export_dataset(
+    dataset: str,
+    symbols: Optional[str] = Query(None, description="쉼표로 구분한 종목 목록 (생략 시 전체)"),
+    from_date: Optional[date] = Query(None, alias="from"),
+    to_date: Optional[date] = Query(None, alias="to"),
+    output_format: str = Query("csv", alias="format", description="csv 또는 arrow (Arrow IPC 스트림)"),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    데이터 일괄 내보내기 (스트리밍)
+
+    - **dataset**: bars, indicators, market_states, signals
+    - **symbols**: 종목 목록 (예: AAPL,MSFT)
+    - **from** / **to**: 기간 (YYYY-MM-DD)
+    - **format**: csv | arrow
+
+    서버 측 커서로 청크 단위로 읽어 바로 전송하므로 결과 크기와 관계없이 메모리 사용량이 일정합니다.
+    전체 종목 덤프는 API 대신 `python export_data.py` CLI 사용을 권장합니다.
+    """
+    if dataset not in EXPORT_DATASETS:
+        raise HTTPException(status_code=404, detail=f"Unknown dataset: {dataset}")
+    if output_format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unsupported format: {output_format}")
+
+    schema = None
+    if output_format == "arrow":
+        try:
+            schema = arrow_schema(dataset)
+        except ExportUnavailableError as e:
+            raise HTTPException(status_code=501, detail=str(e))
+
+    symbol_list = [s.strip() for s in symbols.split(",") if s.strip()] if symbols else None
+    query = export_query(dataset, symbol_list, from_date, to_date)
+    header = export_columns(dataset)
+
+    def _encode(rows, first: bool) -> bytes:
+        if schema is not None:
+            return encode_arrow_chunk(rows, schema, with_schema=first)
+        return encode_csv_chunk(rows, header if first else None)
+
+    async def _stream():
+        # 요청 세션은 응답 전송 전에 닫히므로 스트림 전용 세션 사용
+        async with AsyncSessionLocal() as db:
+            result = await db.stream(query.execution_options(yield_per=EXPORT_CHUNK_ROWS))
+            first = True
+            async for partition in result.partitions(EXPORT_CHUNK_ROWS):
+                rows = [tuple(row) for row in partition]
+                yield await run_in_threadpool(_encode, rows, first)
+                first = False
+
+            if first:
+                # 결과가 없어도 헤더/스키마는 전송
+                yield _encode([], True)
+            if schema is not None:
+                yield EOS_MARKER
 
-@router.post("/update")
-async def trigger_data_update():
-    return {"message": "Trigger data update endpoint (구현 예정)"}
+    extension = "arrows" if schema is not None else "csv"
+    filename = f"{dataset}_{from_date or 'start'}_{to_date or 'end'}.{extension}"
+    return StreamingResponse(
+        _stream(),
+        media_type="application/vnd.apache.arrow.stream" if schema is not None else "text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -2,28 +2,50 @@
 Trading Signals API Endpoints
 """
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import List
-from datetime import datetime, timedelta
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, List, Optional
+from datetime import date, datetime, timedelta
 
 from app.core import deps
-from app.models import Symbol, FundamentalScore, TradingSignal
+from app.core.executor import ExecutorSaturatedError, run_cpu_bound
+from app.core.cache import TTLCache
+from app.core.pagination import keyset_page, split_page
+from app.core.responses import dumps, json_bytes_response
+from app.core.http_cache import apply_cache_headers, compute_etag, etag_matches, not_modified
+from app.core.profiling import StageTimer, request_timer, use_timer
+from app.core.rate_limit import (
+    COST_CACHED_READ,
+    COST_COLD_SIGNAL,
+    RateLimitExceeded,
+    rate_limited,
+    rate_limiter,
+)
+from app.db.session import AsyncSessionLocal
+from app.models import Symbol, FundamentalScore, TradingSignal, SymbolLatestSnapshot
 from app.services.fmp_client import fmp_client
 from app.services.fundamental_analysis import fundamental_service
-from app.services.indicators import TechnicalIndicators
-from app.services.hybrid_signal import hybrid_signal_generator
-from app.services.multi_timeframe import multi_timeframe_analyzer
-import pandas as pd
+from app.services.market_session import is_fresh
+from app.services.snapshot import f_score_values, signal_values, snapshot_upsert
+from app.services.updates import SIGNAL_DIFF_FIELDS, diff_values, publish_symbol_update_async
+from app.schemas.signal import SignalBatchRequest
+import asyncio
 import math
 
 router = APIRouter()
 
+# 배치 시그널 생성 시 동시에 처리할 최대 종목 수
+BATCH_CONCURRENCY = 8
+
+# (종목, 최신 봉 날짜, 봉 개수) -> (지표 데이터프레임, 다중 타임프레임 분석)
+_analysis_cache: TTLCache[tuple] = TTLCache(ttl_seconds=300, maxsize=512, name="signal_analysis")
+
 
 def _safe_float(value) -> float | None:
-    """pandas/numpy float을 Python float으로 안전하게 변환 (NaN/Inf는 None으로)"""
-    if pd.isna(value):
+    """pandas/numpy float을 Python float으로 안전하게 변환 (None/NaN/NaT/Inf는 None으로)"""
+    if value is None:
         return None
     try:
         val = float(value)
@@ -34,55 +56,160 @@ def _safe_float(value) -> float | None:
         return None
 
 
-@router.get("/{symbol}")
-async def get_trading_signal(
-    symbol: str,
-    db: Session = Depends(deps.get_db),
-    current_user=Depends(deps.get_current_user),
-):
+def _signal_etag(symbol_upper: str, bar_date: date | None, signal_id: int) -> str:
+    """시그널 응답 ETag (종목, 최신 봉 날짜, 시그널 ID)"""
+    return compute_etag("signal", symbol_upper, bar_date, signal_id)
+
+
+async def _none() -> None:
+    """asyncio.gather에서 생략된 단계를 대신하는 no-op"""
+    return None
+
+
+# 아래 워커 함수는 pandas/numpy 기반 분석 모듈을 첫 분석 시 import합니다 (API 기동 시간 단축).
+
+
+def _calculate_indicators(price_data: List[dict]):
+    """기술적 지표 계산 (CPU 연산)"""
+    from app.services.indicators import TechnicalIndicators
+
+    return TechnicalIndicators.calculate_all_indicators(price_data)
+
+
+def _analyze_timeframes(price_data: List[dict]) -> dict:
+    """다중 타임프레임 분석 + 진입점 최적화 분석 (CPU 연산)"""
+    from app.services.multi_timeframe import multi_timeframe_analyzer
+
+    timeframe_analysis = multi_timeframe_analyzer.analyze_price_data(
+        price_data, trading_style="swing_trading"
+    )
+    timeframe_analysis["entry_analysis"] = multi_timeframe_analyzer.get_optimal_entry_analysis(
+        timeframe_analysis
+    )
+    return timeframe_analysis
+
+
+def _generate_hybrid_signal(**kwargs) -> dict:
+    """F-Score + 기술적 지표 + 타임프레임 분석 기반 하이브리드 시그널 생성 (CPU 연산)"""
+    from app.services.hybrid_signal import hybrid_signal_generator
+
+    return hybrid_signal_generator.generate_signal(**kwargs)
+
+
+def _analysis_cache_key(symbol: str, price_data: List[dict]) -> tuple:
+    return (symbol, price_data[0]["date"], len(price_data))
+
+
+def _is_analysis_cached(symbol_upper: str) -> bool:
+    """가격 데이터와 지표 분석이 모두 캐시에 있으면 True (시그널 생성 시 가격 조회/지표 계산 없음)"""
+    price_data = fmp_client.cached_historical_prices(symbol_upper)
+    return bool(price_data) and (
+        _analysis_cache.peek(_analysis_cache_key(symbol_upper, price_data)) is not None
+    )
+
+
+async def _compute_analysis(symbol: str, price_data: List[dict], timer: StageTimer):
     """
-    종목의 최신 매매 시그널 조회 (또는 생성)
+    기술적 지표 + 다중 타임프레임 분석 (워커 풀, 같은 가격 데이터에 대해서는 캐시 재사용)
+    """
+    cache_key = _analysis_cache_key(symbol, price_data)
+    cached = _analysis_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    result = await asyncio.gather(
+        timer.track(
+            "compute_indicators",
+            run_cpu_bound(_calculate_indicators, price_data),
+        ),
+        timer.track("compute_timeframes", run_cpu_bound(_analyze_timeframes, price_data)),
+    )
+    _analysis_cache.set(cache_key, tuple(result))
+    return tuple(result)
+
+
+async def _load_symbol_state(db: AsyncSession, symbol_upper: str):
+    """저장된 심볼 및 최신 F-Score 조회 (24시간 이내)"""
+    db_symbol = await db.scalar(select(Symbol).where(Symbol.symbol == symbol_upper))
+    recent_f_score = None
+    if db_symbol:
+        recent_f_score = await db.scalar(
+            select(FundamentalScore)
+            .where(FundamentalScore.symbol_id == db_symbol.id)
+            .where(FundamentalScore.calculated_at >= datetime.utcnow() - timedelta(hours=24))
+            .order_by(FundamentalScore.calculated_at.desc())
+            .limit(1)
+        )
+    return db_symbol, recent_f_score
 
-    하이브리드 매매 시그널:
-    - Piotroski F-Score (재무 건전성)
-    - 기술적 지표 (RSI, ADX, 이동평균선, 볼륨)
-    - Golden/Death Cross
-    - 매매 추천 및 리스크 평가
+
+async def _fresh_signal_bodies(db: AsyncSession, symbols: List[str]) -> Dict[str, bytes]:
     """
+    저장된 최신 시그널이 현재 장 세션 기준으로 신선한 종목의 직렬화 응답 (종목 수와 관계없이 2회 조회)
 
-    # 1. 심볼 조회 또는 생성
-    symbol_upper = symbol.upper()
-    db_symbol = db.query(Symbol).filter(Symbol.symbol == symbol_upper).first()
+    GET /signals/{symbol}의 저장 응답 경로와 같은 기준을 사용합니다.
+    """
+    rows = (
+        await db.execute(
+            select(
+                Symbol.symbol,
+                SymbolLatestSnapshot.signal_id,
+                SymbolLatestSnapshot.signal_bar_date,
+                SymbolLatestSnapshot.signal_generated_at,
+            )
+            .join(Symbol, SymbolLatestSnapshot.symbol_id == Symbol.id)
+            .where(Symbol.symbol.in_(symbols))
+        )
+    ).all()
+    fresh = {
+        signal_id: symbol
+        for symbol, signal_id, bar_date, generated_at in rows
+        if signal_id and is_fresh(bar_date, generated_at)
+    }
+    if not fresh:
+        return {}
 
-    if not db_symbol:
-        # 새로운 심볼 생성
-        symbol_info = await fmp_client.get_company_profile(symbol_upper)
-        if not symbol_info:
-            raise HTTPException(status_code=404, detail="Symbol not found")
+    bodies = await db.execute(
+        select(TradingSignal.id, TradingSignal.response_json).where(TradingSignal.id.in_(fresh))
+    )
+    return {fresh[signal_id]: body for signal_id, body in bodies if body}
+
+
+def _batch_line(symbol_upper: str, body: bytes) -> bytes:
+    """직렬화된 시그널 응답을 그대로 감싸서 재직렬화 생략"""
+    return b'{"symbol":' + dumps(symbol_upper) + b',"status":"ok","data":' + body + b"}"
+
+
+async def _save_signal(
+    db: AsyncSession,
+    symbol_upper: str,
+    db_symbol: Symbol | None,
+    symbol_info: dict | None,
+    recent_f_score: FundamentalScore | None,
+    f_score_data: dict,
+    signal_data: dict,
+    timeframe_analysis: dict,
+    bar_date: date,
+    analysis_payload: dict,
+) -> tuple[dict, bytes]:
+    """
+    심볼, F-Score, 시그널 DB 저장 후 응답 데이터와 직렬화된 JSON 반환
 
+    직렬화된 응답은 시그널 행(response_json)에 함께 저장되어, 같은 시그널을 다시
+    조회할 때 재계산/재직렬화 없이 그대로 반환됩니다.
+    """
+    if not db_symbol:
         db_symbol = Symbol(
             symbol=symbol_upper,
             name=symbol_info.get("name", symbol_upper),
             exchange=symbol_info.get("exchange", "Unknown"),
         )
         db.add(db_symbol)
-        db.commit()
-        db.refresh(db_symbol)
-
-    # 2. 최신 F-Score 확인 (24시간 이내)
-    recent_f_score = (
-        db.query(FundamentalScore)
-        .filter(FundamentalScore.symbol_id == db_symbol.id)
-        .filter(FundamentalScore.calculated_at >= datetime.utcnow() - timedelta(hours=24))
-        .order_by(FundamentalScore.calculated_at.desc())
-        .first()
-    )
-
-    if not recent_f_score:
-        # F-Score 계산
-        f_score_data = await fundamental_service.get_f_score(symbol_upper)
+        await db.flush()
 
-        # DB에 저장
+    if recent_f_score:
+        db_f_score = recent_f_score
+    else:
         fundamentals = f_score_data.get("fundamentals", {})
         db_f_score = FundamentalScore(
             symbol_id=db_symbol.id,
@@ -101,50 +228,8 @@ async def get_trading_signal(
             gross_margin=fundamentals.get("gross_margin"),
         )
         db.add(db_f_score)
-        db.commit()
-        db.refresh(db_f_score)
-    else:
-        db_f_score = recent_f_score
-        f_score_data = {
-            "f_score": db_f_score.f_score,
-            "max_score": db_f_score.max_score,
-            "details": db_f_score.score_details,
-        }
-
-    # 3. 최신 가격 데이터 조회 (200일치 - 이동평균선 계산용)
-    price_data = await fmp_client.get_historical_prices(
-        symbol=symbol_upper, from_date=None, to_date=None
-    )
-
-    if not price_data or len(price_data) < 50:
-        raise HTTPException(
-            status_code=400,
-            detail="Insufficient price data for signal generation (need at least 50 days)",
-        )
-
-    # 4. 기술적 지표 계산
-    df = TechnicalIndicators.calculate_all_indicators(price_data)
-
-    # 5. 다중 타임프레임 분석 수행
-    timeframe_analysis = await multi_timeframe_analyzer.analyze_multiple_timeframes(
-        symbol=symbol_upper, trading_style="swing_trading"
-    )
-
-    # 진입점 최적화 분석 추가
-    timeframe_analysis["entry_analysis"] = multi_timeframe_analyzer.get_optimal_entry_analysis(
-        timeframe_analysis
-    )
-
-    # 6. 하이브리드 시그널 생성 (타임프레임 분석 포함)
-    current_price = _safe_float(df.iloc[-1]["close"]) or 0.0
-    signal_data = hybrid_signal_generator.generate_signal(
-        f_score_data=f_score_data,
-        technical_data=df,
-        current_price=current_price,
-        timeframe_analysis=timeframe_analysis,
-    )
+        await db.flush()
 
-    # 7. 시그널 DB 저장 (타임프레임 분석 포함)
     db_signal = TradingSignal(
         symbol_id=db_symbol.id,
         fundamental_score_id=db_f_score.id,
@@ -158,11 +243,9 @@ async def get_trading_signal(
         timeframe_analysis=timeframe_analysis,  # 타임프레임 분석 결과 저장
     )
     db.add(db_signal)
-    db.commit()
-    db.refresh(db_signal)
+    await db.flush()
 
-    # 8. 응답 데이터 구성 (타임프레임 분석 포함)
-    return {
+    payload = {
         "symbol": {
             "symbol": db_symbol.symbol,
             "name": db_symbol.name,
@@ -174,6 +257,7 @@ async def get_trading_signal(
             "signal_strength": db_signal.signal_strength,
             "current_price": db_signal.current_price,
             "generated_at": db_signal.generated_at.isoformat(),
+            "bar_date": bar_date.isoformat(),
         },
         "f_score": {
             "score": db_f_score.f_score,
@@ -181,50 +265,351 @@ async def get_trading_signal(
             "details": db_f_score.score_details,
             "calculated_at": db_f_score.calculated_at.isoformat(),
         },
+        **analysis_payload,
+    }
+    body = dumps(payload)
+    db_signal.response_json = body
+
+    # 최신 스냅샷 갱신 (같은 트랜잭션), 이전 스냅샷 대비 시그널 변경분 계산
+    new_signal_values = signal_values(db_signal, bar_date)
+    previous_snapshot = await db.get(SymbolLatestSnapshot, db_symbol.id)
+    signal_changes = diff_values(previous_snapshot, new_signal_values, SIGNAL_DIFF_FIELDS)
+
+    await db.execute(
+        snapshot_upsert(db_symbol.id, f_score_values(db_f_score), new_signal_values)
+    )
+    await db.commit()
+
+    # 시그널이 바뀐 경우에만 구독자에게 변경분 발행
+    await publish_symbol_update_async(
+        "signal",
+        db_symbol.id,
+        db_symbol.symbol,
+        signal_changes,
+        as_of=bar_date,
+        signal_id=db_signal.id,
+    )
+
+    return payload, body
+
+
+async def _generate_signal(
+    symbol_upper: str, db: AsyncSession, timer: StageTimer
+) -> tuple[dict, bytes]:
+    """
+    종목의 매매 시그널 생성 및 저장 후 응답 데이터와 직렬화된 JSON 반환
+
+    서로 의존하지 않는 업스트림 조회(회사 프로필, F-Score, 가격 데이터)는 동시에 수행하고,
+    지표 계산 및 시그널 생성은 분석 워커 풀에서 실행하여 이벤트 루프를 막지 않습니다.
+    """
+    # 1. 저장된 심볼 및 최신 F-Score 확인 (24시간 이내)
+    db_symbol, recent_f_score = await timer.track(
+        "db_read", _load_symbol_state(db, symbol_upper)
+    )
+
+    # 2. 업스트림 동시 조회 (다중 타임프레임 분석은 같은 가격 데이터를 재사용)
+    symbol_info, fetched_f_score, price_data = await asyncio.gather(
+        timer.track("fetch_profile", fmp_client.get_company_profile(symbol_upper))
+        if not db_symbol
+        else _none(),
+        timer.track("fetch_f_score", fundamental_service.get_f_score(symbol_upper))
+        if not recent_f_score
+        else _none(),
+        # 최신 가격 데이터 조회 (이동평균선 계산용)
+        timer.track(
+            "fetch_prices",
+            fmp_client.get_historical_prices(symbol=symbol_upper, from_date=None, to_date=None),
+        ),
+    )
+
+    if not db_symbol and not symbol_info:
+        raise HTTPException(status_code=404, detail="Symbol not found")
+
+    if not price_data or len(price_data) < 50:
+        raise HTTPException(
+            status_code=400,
+            detail="Insufficient price data for signal generation (need at least 50 days)",
+        )
+
+    if recent_f_score:
+        f_score_data = {
+            "f_score": recent_f_score.f_score,
+            "max_score": recent_f_score.max_score,
+            "details": recent_f_score.score_details,
+        }
+    else:
+        f_score_data = fetched_f_score
+
+    # 3. 기술적 지표 계산 + 다중 타임프레임 분석 (워커 풀)
+    df, timeframe_analysis = await _compute_analysis(symbol_upper, price_data, timer)
+    latest = df.iloc[-1]
+
+    # 4. 하이브리드 시그널 생성 (타임프레임 분석 포함)
+    current_price = _safe_float(latest["close"]) or 0.0
+    signal_data = await timer.track(
+        "generate_signal",
+        run_cpu_bound(
+            _generate_hybrid_signal,
+            f_score_data=f_score_data,
+            technical_data=df,
+            current_price=current_price,
+            timeframe_analysis=timeframe_analysis,
+        ),
+    )
+
+    # 5. 응답 데이터 구성 (타임프레임 분석 포함)
+    analysis_payload = {
         "timeframe_analysis": timeframe_analysis,  # 다중 타임프레임 분석 결과
         "conditions": signal_data["conditions"],
         "recommendations": signal_data["recommendations"],
         "risk_assessment": signal_data["risk_assessment"],
         "technical_indicators": {
-            "rsi": _safe_float(df.iloc[-1]["rsi"]) if "rsi" in df.columns else None,
-            "adx": _safe_float(df.iloc[-1]["adx"]) if "adx" in df.columns else None,
-            "sma_50": _safe_float(df.iloc[-1]["sma_50"]) if "sma_50" in df.columns else None,
-            "sma_200": _safe_float(df.iloc[-1]["sma_200"])
-            if "sma_200" in df.columns
-            else None,
+            "rsi": _safe_float(latest["rsi"]) if "rsi" in df.columns else None,
+            "adx": _safe_float(latest["adx"]) if "adx" in df.columns else None,
+            "sma_50": _safe_float(latest["sma_50"]) if "sma_50" in df.columns else None,
+            "sma_200": _safe_float(latest["sma_200"]) if "sma_200" in df.columns else None,
         },
     }
 
+    # 6. 심볼, F-Score, 시그널 DB 저장 (직렬화된 응답 포함)
+    return await timer.track(
+        "db_write",
+        _save_signal(
+            db,
+            symbol_upper,
+            db_symbol,
+            symbol_info,
+            recent_f_score,
+            f_score_data,
+            signal_data,
+            timeframe_analysis,
+            latest["date"].date(),
+            analysis_payload,
+        ),
+    )
+
+
+@router.post("/batch")
+async def get_trading_signals_batch(
+    batch_request: SignalBatchRequest,
+    current_user=Depends(rate_limited(COST_CACHED_READ)),
+):
+    """
+    여러 종목의 매매 시그널 일괄 생성
+
+    종목별 결과를 완료되는 순서대로 NDJSON(한 줄에 하나의 JSON)으로 스트리밍합니다.
+    - 성공: {"symbol": ..., "status": "ok", "data": <GET /signals/{symbol} 응답>}
+    - 실패: {"symbol": ..., "status": "error", "status_code": ..., "detail": ...}
+
+    저장된 최신 시그널이 신선한 종목은 GET /signals/{symbol}과 같이 저장된 응답을 그대로 반환합니다.
+    종목마다 요청 제한 토큰을 소비하며 (저장 응답/캐시 적중은 조회 비용, 새로 분석하면 콜드 비용),
+    토큰이 부족한 종목은 status_code 429로 실패 처리됩니다.
+    토큰은 동시 처리 슬롯을 잡기 전에 소비하므로, 토큰을 기다리는 종목이 슬롯을 차지하지 않습니다.
+
+    Args:
+        symbols: 종목 코드 리스트 (최대 200개, 중복 제거)
+    """
+    symbols = list(dict.fromkeys(s.upper() for s in batch_request.symbols if s.strip()))
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    user_id = current_user.id
+
+    async def _charge(symbol_upper: str, cost: int) -> dict | None:
+        """토큰 소비 (부족하면 429 오류 항목 반환)"""
+        try:
+            await rate_limiter.acquire(user_id, cost)
+        except RateLimitExceeded as e:
+            return {
+                "symbol": symbol_upper,
+                "status": "error",
+                "status_code": 429,
+                "detail": str(e),
+            }
+        return None
+
+    async def _serve_stored(symbol_upper: str, body: bytes) -> dict | bytes:
+        return await _charge(symbol_upper, COST_CACHED_READ) or _batch_line(symbol_upper, body)
+
+    async def _process(symbol_upper: str) -> dict | bytes:
+        cost = COST_CACHED_READ if _is_analysis_cached(symbol_upper) else COST_COLD_SIGNAL
+        rejected = await _charge(symbol_upper, cost)
+        if rejected:
+            return rejected
+
+        async with semaphore:
+            timer = StageTimer("signals_batch_item")
+            # 업스트림/DB 단계도 항목별 타이머에 기록
+            with use_timer(timer):
+                async with AsyncSessionLocal() as db:
+                    try:
+                        _, body = await _generate_signal(symbol_upper, db, timer)
+                        timer.log(symbol=symbol_upper)
+                        return _batch_line(symbol_upper, body)
+                    except HTTPException as e:
+                        await db.rollback()
+                        return {
+                            "symbol": symbol_upper,
+                            "status": "error",
+                            "status_code": e.status_code,
+                            "detail": e.detail,
+                        }
+                    except ExecutorSaturatedError as e:
+                        await db.rollback()
+                        return {
+                            "symbol": symbol_upper,
+                            "status": "error",
+                            "status_code": 503,
+                            "detail": str(e),
+                        }
+                    except Exception as e:
+                        await db.rollback()
+                        return {
+                            "symbol": symbol_upper,
+                            "status": "error",
+                            "status_code": 500,
+                            "detail": f"Failed to generate signal: {str(e)}",
+                        }
+
+    async def _stream():
+        async with AsyncSessionLocal() as db:
+            stored = await _fresh_signal_bodies(db, symbols) if symbols else {}
+        tasks = [
+            asyncio.create_task(
+                _serve_stored(symbol_upper, stored[symbol_upper])
+                if symbol_upper in stored
+                else _process(symbol_upper)
+            )
+            for symbol_upper in symbols
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                yield (result if isinstance(result, bytes) else dumps(result)) + b"\n"
+        finally:
+            # 클라이언트 연결이 끊기면 남은 작업 취소
+            for task in tasks:
+                task.cancel()
+
+    # 스트리밍 응답은 GZip 버퍼링으로 지연되지 않도록 압축 제외
+    return StreamingResponse(
+        _stream(),
+        media_type="application/x-ndjson",
+        headers={"Content-Encoding": "identity"},
+    )
+
+
+@router.get("/{symbol}")
+async def get_trading_signal(
+    symbol: str,
+    request: Request,
+    refresh: bool = Query(False),
+    db: AsyncSession = Depends(deps.get_async_db),
+    current_user=Depends(rate_limited(COST_CACHED_READ)),
+):
+    """
+    종목의 최신 매매 시그널 조회 (또는 생성)
+
+    - **refresh**: True면 저장된 시그널을 무시하고 새로 생성
+
+    하이브리드 매매 시그널:
+    - Piotroski F-Score (재무 건전성)
+    - 기술적 지표 (RSI, ADX, 이동평균선, 볼륨)
+    - Golden/Death Cross
+    - 매매 추천 및 리스크 평가
+
+    저장된 최신 시그널이 현재 장 세션 기준으로 신선하면 업스트림 조회나 지표 계산 없이
+    If-None-Match가 ETag와 일치할 때 304를, 아니면 저장된 직렬화 응답을 그대로 반환합니다.
+    새로 생성하는 경우에는 콜드 분석 비용만큼 요청 제한 토큰을 추가로 소비합니다.
+    """
+    timer = request_timer("get_trading_signal")
+    symbol_upper = symbol.upper()
+
+    snapshot = await timer.track(
+        "db_read_snapshot",
+        db.scalar(
+            select(SymbolLatestSnapshot)
+            .join(Symbol, SymbolLatestSnapshot.symbol_id == Symbol.id)
+            .where(Symbol.symbol == symbol_upper)
+        ),
+    )
+    if (
+        not refresh
+        and snapshot
+        and snapshot.signal_id
+        and is_fresh(snapshot.signal_bar_date, snapshot.signal_generated_at)
+    ):
+        etag = _signal_etag(symbol_upper, snapshot.signal_bar_date, snapshot.signal_id)
+        if etag_matches(request, etag):
+            timer.annotate(symbol=symbol_upper, not_modified=True)
+            return not_modified(etag)
+
+        body = await timer.track(
+            "db_read_payload",
+            db.scalar(
+                select(TradingSignal.response_json).where(
+                    TradingSignal.id == snapshot.signal_id
+                )
+            ),
+        )
+        if body:
+            response = json_bytes_response(body)
+            apply_cache_headers(response, etag)
+            timer.annotate(symbol=symbol_upper, stored=True)
+            return response
+
+    await rate_limiter.charge(request, current_user.id, COST_COLD_SIGNAL)
+    data, body = await _generate_signal(symbol_upper, db, timer)
+    response = json_bytes_response(body)
+    apply_cache_headers(
+        response,
+        _signal_etag(
+            symbol_upper,
+            date.fromisoformat(data["signal"]["bar_date"]),
+            data["signal"]["id"],
+        ),
+    )
+    timer.annotate(symbol=symbol_upper)
+    return response
+
 
 @router.get("/{symbol}/history")
 async def get_signal_history(
     symbol: str,
-    limit: int = 30,
-    db: Session = Depends(deps.get_db),
+    cursor: Optional[str] = None,
+    limit: int = Query(30, ge=1, le=200),
+    db: AsyncSession = Depends(deps.get_async_db),
     current_user=Depends(deps.get_current_user),
 ):
     """
-    종목의 과거 시그널 이력 조회
+    종목의 과거 시그널 이력 조회 (최신순)
 
     Args:
         symbol: 종목 코드
-        limit: 조회할 최대 개수 (기본값: 30)
+        cursor: 다음 페이지 커서 (이전 응답의 next_cursor, 첫 페이지는 생략)
+        limit: 페이지 크기 (기본값: 30)
+
+    (symbol_id, generated_at, id) 인덱스 기반 keyset 페이지네이션입니다.
     """
 
     symbol_upper = symbol.upper()
-    db_symbol = db.query(Symbol).filter(Symbol.symbol == symbol_upper).first()
+    db_symbol = await db.scalar(select(Symbol).where(Symbol.symbol == symbol_upper))
 
     if not db_symbol:
         raise HTTPException(status_code=404, detail="Symbol not found")
 
     # 시그널 이력 조회
-    signals = (
-        db.query(TradingSignal)
-        .filter(TradingSignal.symbol_id == db_symbol.id)
-        .order_by(TradingSignal.generated_at.desc())
-        .limit(limit)
-        .all()
-    )
+    rows = (
+        await db.scalars(
+            keyset_page(
+                select(TradingSignal).where(TradingSignal.symbol_id == db_symbol.id),
+                (TradingSignal.generated_at, TradingSignal.id),
+                cursor,
+                (datetime, int),
+                limit,
+            )
+        )
+    ).all()
+    signals, next_cursor = split_page(rows, limit, key=lambda s: (s.generated_at, s.id))
 
     return {
         "symbol": {
@@ -243,48 +628,54 @@ async def get_signal_history(
             }
             for signal in signals
         ],
+        "next_cursor": next_cursor,
     }
 
 
 @router.get("/")
 async def get_all_signals(
     signal_type: str = None,
-    limit: int = 50,
-    db: Session = Depends(deps.get_db),
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(deps.get_async_db),
     current_user=Depends(deps.get_current_user),
 ):
     """
-    전체 종목의 최신 시그널 조회
+    전체 종목의 최신 시그널 조회 (최신순)
 
     Args:
         signal_type: 시그널 타입 필터 (strong_buy, buy, hold, warning, sell, strong_sell)
-        limit: 조회할 최대 개수 (기본값: 50)
+        cursor: 다음 페이지 커서 (이전 응답의 next_cursor, 첫 페이지는 생략)
+        limit: 페이지 크기 (기본값: 50)
     """
 
-    # 각 심볼별 최신 시그널만 조회
-    subquery = (
-        db.query(
-            TradingSignal.symbol_id,
-            func.max(TradingSignal.generated_at).label("max_date"),
-        )
-        .group_by(TradingSignal.symbol_id)
-        .subquery()
-    )
-
+    # 각 심볼별 최신 시그널은 symbol_latest_snapshot에서 조회
     query = (
-        db.query(TradingSignal, Symbol)
-        .join(subquery, TradingSignal.symbol_id == subquery.c.symbol_id)
-        .filter(TradingSignal.generated_at == subquery.c.max_date)
-        .join(Symbol, TradingSignal.symbol_id == Symbol.id)
+        select(SymbolLatestSnapshot, Symbol)
+        .join(Symbol, SymbolLatestSnapshot.symbol_id == Symbol.id)
+        .where(SymbolLatestSnapshot.signal_id.is_not(None))
     )
 
     if signal_type:
-        query = query.filter(TradingSignal.signal_type == signal_type)
-
-    signals = query.order_by(TradingSignal.generated_at.desc()).limit(limit).all()
+        query = query.where(SymbolLatestSnapshot.signal_type == signal_type)
+
+    rows = (
+        await db.execute(
+            keyset_page(
+                query,
+                (SymbolLatestSnapshot.signal_generated_at, SymbolLatestSnapshot.symbol_id),
+                cursor,
+                (datetime, int),
+                limit,
+            )
+        )
+    ).all()
+    rows, next_cursor = split_page(
+        rows, limit, key=lambda row: (row[0].signal_generated_at, row[0].symbol_id)
+    )
 
     return {
-        "total_count": len(signals),
+        "total_count": len(rows),
         "signals": [
             {
                 "symbol": {
@@ -292,14 +683,15 @@ async def get_all_signals(
                     "name": symbol.name,
                 },
                 "signal": {
-                    "id": signal.id,
-                    "signal_type": signal.signal_type,
-                    "signal_strength": signal.signal_strength,
-                    "current_price": signal.current_price,
-                    "risk_level": signal.risk_level,
-                    "generated_at": signal.generated_at.isoformat(),
+                    "id": snapshot.signal_id,
+                    "signal_type": snapshot.signal_type,
+                    "signal_strength": snapshot.signal_strength,
+                    "current_price": snapshot.signal_price,
+                    "risk_level": snapshot.signal_risk_level,
+                    "generated_at": snapshot.signal_generated_at.isoformat(),
                 },
             }
-            for signal, symbol in signals
+            for snapshot, symbol in rows
         ],
+        "next_cursor": next_cursor,
     }
@@ -1,27 +1,63 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import Float, and_, cast, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from datetime import datetime, date, timedelta
-from app.db.session import get_db
+from datetime import datetime, date, timedelta, timezone
+from app.db.session import get_async_db
 from app.core.deps import get_current_user
+from app.core.executor import ExecutorSaturatedError, run_cpu_bound
+from app.core.http_cache import apply_cache_headers, compute_etag, etag_matches, not_modified
+from app.core.pagination import keyset_page, split_page
+from app.core.profiling import track
+from app.core.rate_limit import COST_CACHED_READ, COST_COLD_SYMBOL, rate_limited, rate_limiter
+from app.core.responses import FastJSONResponse
 from app.models.user import User
 from app.models.symbol import Symbol
 from app.models.technical_indicator import TechnicalIndicator
 from app.models.market_state import MarketState
+from app.models.symbol_latest_snapshot import SymbolLatestSnapshot
+from app.models.price_bar import PriceBar
 from app.schemas.symbol import (
     SymbolResponse,
+    SymbolListResponse,
     SymbolDetailResponse,
     SymbolSearchResponse,
+    FreshnessInfo,
     TechnicalIndicatorResponse,
     MarketStateResponse,
 )
+from app.services.analysis_history import analysis_state, history_chain_query, history_upsert
+from app.services.analysis_store import (
+    PRICE_LOOKBACK_DAYS,
+    indicator_rows,
+    indicators_upsert,
+    market_state_row,
+    market_states_upsert,
+)
 from app.services.fmp_client import fmp_client
-from app.services.indicators import TechnicalIndicators
 from app.services.market_classifier import MarketClassifier
-from decimal import Decimal
+from app.services.market_session import is_fresh
+from app.services.price_bars import price_bar_rows, price_bars_upsert
+from app.services.refresh import enqueue_symbol_refresh
+from app.services.snapshot import (
+    INDICATOR_FIELDS,
+    indicator_values,
+    market_state_values,
+    snapshot_upsert,
+)
+from app.services.updates import (
+    MARKET_STATE_DIFF_FIELDS,
+    diff_values,
+    publish_symbol_update_async,
+)
+import asyncio
 
 router = APIRouter()
 
+# 시계열 조회 가능 필드
+BAR_SERIES_FIELDS = ("open", "high", "low", "close", "volume")
+INDICATOR_SERIES_FIELDS = INDICATOR_FIELDS + ("vix",)
+
 
 @router.get("/search", response_model=List[SymbolSearchResponse])
 async def search_symbols(
@@ -51,24 +87,264 @@ async def search_symbols(
         raise HTTPException(status_code=500, detail=f"Failed to search symbols: {str(e)}")
 
 
+def _symbol_etag(
+    symbol: str,
+    bar_date: Optional[date],
+    updated_at: Optional[datetime],
+    signal_id: Optional[int],
+) -> str:
+    """
+    종목 상세 응답 ETag (종목, 최신 봉 날짜, 시그널 ID)
+
+    장중에는 같은 날짜의 봉이 갱신되므로 스냅샷 갱신 시각도 포함합니다.
+    """
+    return compute_etag("symbol", symbol, bar_date, updated_at, signal_id)
+
+
+def _analyze_latest(symbol_id: int, price_data: List[dict], vix_by_date: dict):
+    """기술적 지표 계산 후 최신 행, 시장 상태 분류 결과, 저장할 지표 행 목록 반환 (CPU 연산)"""
+    # pandas 기반 지표 모듈은 첫 분석 시 import (API 기동 시간 단축)
+    from app.services.indicators import TechnicalIndicators
+
+    indicators_df = TechnicalIndicators.calculate_all_indicators(price_data)
+    latest_row = indicators_df.iloc[-1]
+    window_rows = indicator_rows(symbol_id, indicators_df, vix_by_date)
+
+    # 저장할 최신 행의 지표 값으로 분류 입력 생성 (None 지표/VIX 처리 포함)
+    indicators_dict = MarketClassifier.classifier_inputs(window_rows[-1], latest_row["close"])
+
+    classification = MarketClassifier.classify_market_state(indicators_dict)
+    return latest_row, classification, window_rows
+
+
+async def _get_or_create_symbol(
+    db: AsyncSession, symbol: str, profile: Optional[dict]
+) -> Optional[Symbol]:
+    """심볼 조회, 없고 프로필이 주어지면 생성"""
+    db_symbol = await db.scalar(select(Symbol).where(Symbol.symbol == symbol))
+    if db_symbol or not profile:
+        return db_symbol
+
+    db_symbol = Symbol(
+        symbol=symbol,
+        name=profile.get("companyName", symbol),
+        exchange=profile.get("exchangeShortName", ""),
+    )
+    db.add(db_symbol)
+    await db.flush()
+    await db.execute(snapshot_upsert(db_symbol.id))
+    await db.commit()
+    await db.refresh(db_symbol)
+    return db_symbol
+
+
+async def _persist_analysis(
+    db: AsyncSession,
+    db_symbol: Symbol,
+    price_data: List[dict],
+    latest_row,
+    window_rows: List[dict],
+    classification: dict,
+) -> tuple[SymbolDetailResponse, str]:
+    """일봉, 지표 계산 구간 및 최신 시장 상태 저장 후 응답과 ETag 생성"""
+    latest_date = latest_row["date"].date()
+
+    # 일봉 저장 (차트 시계열용)
+    bars_stmt = price_bars_upsert(price_bar_rows(db_symbol.id, price_data))
+    if bars_stmt is not None:
+        await db.execute(bars_stmt)
+
+    # TechnicalIndicator는 계산 구간 전체 upsert (내용 해시가 바뀐 행만 갱신),
+    # MarketState는 최신 행 upsert (저장된 행을 응답에 사용)
+    snapshot_indicators = indicator_values(latest_row, latest_date, window_rows[-1]["vix"])
+    state_values = market_state_values(classification, latest_date)
+
+    await db.execute(indicators_upsert(window_rows))
+    db_state = (
+        await db.execute(
+            market_states_upsert(
+                [market_state_row(db_symbol.id, latest_date, classification)]
+            ).returning(*MarketState.__table__.columns)
+        )
+    ).one()
+
+    # 최신 스냅샷 갱신 (같은 트랜잭션), 이전 스냅샷 대비 시장 상태 변경분 계산
+    previous_snapshot = await db.get(SymbolLatestSnapshot, db_symbol.id)
+    state_changes = diff_values(previous_snapshot, state_values, MARKET_STATE_DIFF_FIELDS)
+
+    snapshot_updated_at, signal_id = (
+        await db.execute(
+            snapshot_upsert(
+                db_symbol.id,
+                snapshot_indicators,
+                state_values,
+            ).returning(SymbolLatestSnapshot.updated_at, SymbolLatestSnapshot.signal_id)
+        )
+    ).one()
+
+    # 일간 분석 이력 (종목/날짜당 1행, 전날 대비 델타)
+    chain_rows = (await db.execute(history_chain_query(db_symbol.id, latest_date))).all()
+    history_stmt = history_upsert(
+        db_symbol.id,
+        latest_date,
+        analysis_state(snapshot_indicators, state_values),
+        chain_rows,
+    )
+    if history_stmt is not None:
+        await db.execute(history_stmt)
+
+    # Symbol의 last_updated 업데이트
+    db_symbol.last_updated = datetime.now()
+    await db.commit()
+
+    # 시장 상태가 바뀐 경우에만 구독자에게 변경분 발행
+    await publish_symbol_update_async(
+        "market_state", db_symbol.id, db_symbol.symbol, state_changes, as_of=latest_date
+    )
+
+    response = SymbolDetailResponse(
+        symbol=SymbolResponse(
+            id=db_symbol.id,
+            symbol=db_symbol.symbol,
+            name=db_symbol.name,
+            exchange=db_symbol.exchange,
+            last_updated=db_symbol.last_updated,
+        ),
+        current_price=float(latest_row["close"]),
+        latest_indicator=TechnicalIndicatorResponse(
+            date=latest_date,
+            atr=snapshot_indicators["atr"],
+            atr_ratio=snapshot_indicators["atr_ratio"],
+            bb_upper=snapshot_indicators["bb_upper"],
+            bb_middle=snapshot_indicators["bb_middle"],
+            bb_lower=snapshot_indicators["bb_lower"],
+            bb_width_ratio=snapshot_indicators["bb_width_ratio"],
+            adx=snapshot_indicators["adx"],
+            plus_di=snapshot_indicators["plus_di"],
+            minus_di=snapshot_indicators["minus_di"],
+            std_dev=snapshot_indicators["std_dev"],
+            vix=snapshot_indicators["vix"],
+        ),
+        latest_market_state=MarketStateResponse(
+            date=db_state.date,
+            trend_type=db_state.trend_type,
+            volatility_level=db_state.volatility_level,
+            risk_level=db_state.risk_level,
+            recommended_strategy=db_state.recommended_strategy,
+            position_sizing_ratio=float(db_state.position_sizing_ratio),
+        ),
+        freshness=FreshnessInfo(
+            source="live",
+            as_of=latest_date,
+            updated_at=snapshot_updated_at or datetime.now(timezone.utc),
+        ),
+    )
+    etag = _symbol_etag(db_symbol.symbol, latest_date, snapshot_updated_at, signal_id)
+    return response, etag
+
+
+def _snapshot_response(
+    db_symbol: Symbol, snapshot: SymbolLatestSnapshot, freshness: FreshnessInfo
+) -> SymbolDetailResponse:
+    """저장된 최신 스냅샷으로 응답 생성 (업스트림 조회/지표 계산 없음)"""
+    return SymbolDetailResponse(
+        symbol=SymbolResponse(
+            id=db_symbol.id,
+            symbol=db_symbol.symbol,
+            name=db_symbol.name,
+            exchange=db_symbol.exchange,
+            last_updated=snapshot.updated_at,
+        ),
+        current_price=snapshot.close,
+        latest_indicator=TechnicalIndicatorResponse(
+            date=snapshot.indicator_date,
+            atr=snapshot.atr,
+            atr_ratio=snapshot.atr_ratio,
+            bb_upper=snapshot.bb_upper,
+            bb_middle=snapshot.bb_middle,
+            bb_lower=snapshot.bb_lower,
+            bb_width_ratio=snapshot.bb_width_ratio,
+            adx=snapshot.adx,
+            plus_di=snapshot.plus_di,
+            minus_di=snapshot.minus_di,
+            std_dev=snapshot.std_dev,
+            vix=snapshot.vix,
+        ),
+        latest_market_state=MarketStateResponse(
+            date=snapshot.market_state_date,
+            trend_type=snapshot.trend_type,
+            volatility_level=snapshot.volatility_level,
+            risk_level=snapshot.risk_level,
+            recommended_strategy=snapshot.recommended_strategy,
+            position_sizing_ratio=snapshot.position_sizing_ratio,
+        ),
+        freshness=freshness,
+    )
+
+
 @router.get("/{symbol}", response_model=SymbolDetailResponse)
 async def get_symbol_detail(
     symbol: str,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    request: Request,
+    response: Response,
+    refresh: bool = Query(False),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(rate_limited(COST_CACHED_READ)),
 ):
     """
     종목 상세 정보 조회 (지표 + 시장 상태 분석 포함)
 
     - **symbol**: 종목 심볼 (예: AAPL, MSFT)
-
-    자동으로 FMP API에서 데이터를 가져와 분석하고 DB에 저장합니다.
+    - **refresh**: True면 저장된 결과를 무시하고 즉시 재계산
+
+    저장된 분석 결과가 있으면 바로 반환합니다 (stale-while-revalidate).
+    현재 장 세션 기준으로 오래된 결과라면 Celery 갱신 작업을 중복 없이 예약하고,
+    응답의 freshness 필드에 신선도 정보를 담습니다.
+    If-None-Match가 스냅샷 ETag와 일치하면 응답 본문 없이 304를 반환합니다.
+    저장된 결과가 없으면 FMP API에서 데이터를 가져와 분석하고 DB에 저장합니다.
+    지표 계산/분류는 분석 워커 풀에서 실행하여 이벤트 루프를 막지 않습니다.
+    새로 분석하는 경우에는 콜드 분석 비용만큼 요청 제한 토큰을 추가로 소비합니다.
     """
     symbol = symbol.upper()
 
+    if not refresh:
+        row = (
+            await db.execute(
+                select(Symbol, SymbolLatestSnapshot)
+                .join(SymbolLatestSnapshot, SymbolLatestSnapshot.symbol_id == Symbol.id)
+                .where(Symbol.symbol == symbol)
+            )
+        ).first()
+
+        if row and row[1].indicator_date and row[1].market_state_date:
+            db_symbol, snapshot = row
+            is_stale = not is_fresh(snapshot.indicator_date, snapshot.indicators_updated_at)
+            refresh_enqueued = await enqueue_symbol_refresh(db_symbol.id) if is_stale else False
+
+            etag = _symbol_etag(
+                symbol, snapshot.indicator_date, snapshot.updated_at, snapshot.signal_id
+            )
+            if etag_matches(request, etag):
+                return not_modified(etag)
+
+            apply_cache_headers(response, etag)
+            return _snapshot_response(
+                db_symbol,
+                snapshot,
+                FreshnessInfo(
+                    source="snapshot",
+                    as_of=snapshot.indicator_date,
+                    updated_at=snapshot.indicators_updated_at,
+                    is_stale=is_stale,
+                    refresh_enqueued=refresh_enqueued,
+                ),
+            )
+
+    await rate_limiter.charge(request, current_user.id, COST_COLD_SYMBOL)
+
     try:
         # 1. Symbol 정보 가져오기 또는 생성
-        db_symbol = db.query(Symbol).filter(Symbol.symbol == symbol).first()
+        db_symbol = await _get_or_create_symbol(db, symbol, None)
 
         if not db_symbol:
             # FMP에서 회사 프로필 가져오기
@@ -76,23 +352,19 @@ async def get_symbol_detail(
             if not profile:
                 raise HTTPException(status_code=404, detail=f"Symbol {symbol} not found")
 
-            db_symbol = Symbol(
-                symbol=symbol,
-                name=profile.get("companyName", symbol),
-                exchange=profile.get("exchangeShortName", ""),
-            )
-            db.add(db_symbol)
-            db.commit()
-            db.refresh(db_symbol)
+            db_symbol = await _get_or_create_symbol(db, symbol, profile)
 
-        # 2. 최근 90일 가격 데이터 가져오기
+        # 2. 지표 계산 기간의 가격 데이터 + 같은 기간의 날짜별 VIX 동시 조회
         to_date = datetime.now().strftime("%Y-%m-%d")
-        from_date = (datetime.now() - timedelta(days=90)).strftime("%Y-%m-%d")
+        from_date = (datetime.now() - timedelta(days=PRICE_LOOKBACK_DAYS)).strftime("%Y-%m-%d")
 
-        price_data = await fmp_client.get_historical_prices(
-            symbol=symbol,
-            from_date=from_date,
-            to_date=to_date
+        price_data, vix_by_date = await asyncio.gather(
+            fmp_client.get_historical_prices(
+                symbol=symbol,
+                from_date=from_date,
+                to_date=to_date
+            ),
+            fmp_client.get_vix_history(from_date=from_date, to_date=to_date),
         )
 
         if not price_data or len(price_data) < 30:
@@ -101,178 +373,186 @@ async def get_symbol_detail(
                 detail=f"Insufficient price data for {symbol}"
             )
 
-        # 3. 기술적 지표 계산
-        indicators_df = TechnicalIndicators.calculate_all_indicators(price_data)
+        # 3. 기술적 지표 계산 및 시장 상태 분류 (워커 풀)
+        latest_row, classification, window_rows = await track(
+            "compute_analysis",
+            run_cpu_bound(_analyze_latest, db_symbol.id, price_data, vix_by_date),
+        )
 
-        # 4. VIX 가져오기 (S&P 500 지수 종목인 경우)
-        vix_value = await fmp_client.get_vix()
+        # 4. 지표 구간/최신 데이터 저장 및 응답 생성
+        detail, etag = await track(
+            "db_write",
+            _persist_analysis(db, db_symbol, price_data, latest_row, window_rows, classification),
+        )
+        apply_cache_headers(response, etag)
+        return detail
 
-        # 5. 최신 데이터 저장 및 시장 상태 분류
-        latest_row = indicators_df.iloc[-1]
-        latest_date = latest_row["date"].date()
+    except HTTPException:
+        raise
+    except ExecutorSaturatedError:
+        raise
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=f"Failed to get symbol detail: {str(e)}")
 
-        # TechnicalIndicator 저장
-        existing_indicator = (
-            db.query(TechnicalIndicator)
-            .filter(
-                TechnicalIndicator.symbol_id == db_symbol.id,
-                TechnicalIndicator.date == latest_date,
-            )
-            .first()
-        )
 
-        if existing_indicator:
-            # 업데이트
-            for key in ["atr", "atr_ratio", "bb_upper", "bb_middle", "bb_lower",
-                       "bb_width", "bb_width_ratio", "adx", "plus_di", "minus_di", "std_dev"]:
-                if key in latest_row and not latest_row.isna()[key]:
-                    setattr(existing_indicator, key, Decimal(str(latest_row[key])))
-            existing_indicator.vix = Decimal(str(vix_value))
-            db_indicator = existing_indicator
-        else:
-            # 새로 생성
-            db_indicator = TechnicalIndicator(
-                symbol_id=db_symbol.id,
-                date=latest_date,
-                atr=Decimal(str(latest_row["atr"])),
-                atr_ratio=Decimal(str(latest_row["atr_ratio"])),
-                bb_upper=Decimal(str(latest_row["bb_upper"])),
-                bb_middle=Decimal(str(latest_row["bb_middle"])),
-                bb_lower=Decimal(str(latest_row["bb_lower"])),
-                bb_width=Decimal(str(latest_row["bb_width"])),
-                bb_width_ratio=Decimal(str(latest_row["bb_width_ratio"])),
-                adx=Decimal(str(latest_row["adx"])),
-                plus_di=Decimal(str(latest_row["plus_di"])),
-                minus_di=Decimal(str(latest_row["minus_di"])),
-                std_dev=Decimal(str(latest_row["std_dev"])),
-                vix=Decimal(str(vix_value)),
-            )
-            db.add(db_indicator)
-
-        db.commit()
-        db.refresh(db_indicator)
-
-        # 6. 시장 상태 분류
-        indicators_dict = {
-            "adx": float(latest_row["adx"]),
-            "plus_di": float(latest_row["plus_di"]),
-            "minus_di": float(latest_row["minus_di"]),
-            "atr_ratio": float(latest_row["atr_ratio"]),
-            "bb_width_ratio": float(latest_row["bb_width_ratio"]),
-            "std_dev": float(latest_row["std_dev"]),
-            "close": float(latest_row["close"]),
-            "vix": vix_value,
-        }
+def _build_series(rows: List[tuple], fields: List[str], max_points: int) -> dict:
+    """조회 결과를 열 단위 배열로 변환 후 LTTB 다운샘플링 (CPU 연산)"""
+    import numpy as np
 
-        classification = MarketClassifier.classify_market_state(indicators_dict)
+    from app.services.downsampling import downsample_columns
 
-        # MarketState 저장
-        existing_state = (
-            db.query(MarketState)
-            .filter(
-                MarketState.symbol_id == db_symbol.id,
-                MarketState.date == latest_date,
-            )
-            .first()
-        )
+    columns = list(zip(*rows)) if rows else [[] for _ in range(len(fields) + 1)]
+    dates = np.array(columns[0], dtype="datetime64[D]")
+    values = {
+        field: np.array(column, dtype=np.float64)
+        for field, column in zip(fields, columns[1:])
+    }
+    primary = "close" if "close" in values else None
+    sampled = downsample_columns(dates, values, max_points, primary=primary)
+    return {
+        "total_points": len(dates),
+        "returned_points": len(sampled["date"]),
+        "date": np.datetime_as_string(sampled["date"], unit="D").tolist(),
+        "series": {field: sampled[field] for field in fields},
+    }
+
+
+@router.get("/{symbol}/series")
+async def get_symbol_series(
+    symbol: str,
+    request: Request,
+    fields: str = Query("close", description="쉼표로 구분한 필드 목록 (예: close,adx,bb_upper)"),
+    from_date: Optional[date] = Query(None, alias="from"),
+    to_date: Optional[date] = Query(None, alias="to"),
+    max_points: int = Query(500, ge=3, le=5000),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    차트용 일봉/지표 시계열 조회 (저장된 데이터, 다운샘플링)
+
+    - **fields**: open, high, low, close, volume 및 기술적 지표 필드
+    - **from** / **to**: 조회 기간 (YYYY-MM-DD)
+    - **max_points**: 최대 점 개수 (초과 시 LTTB로 형태를 유지하며 축소)
 
-        if existing_state:
-            # 업데이트
-            existing_state.trend_type = classification["trend_type"]
-            existing_state.volatility_level = classification["volatility_level"]
-            existing_state.risk_level = classification["risk_level"]
-            existing_state.recommended_strategy = classification["recommended_strategy"]
-            existing_state.position_sizing_ratio = Decimal(str(classification["position_sizing_ratio"]))
-            db_state = existing_state
-        else:
-            # 새로 생성
-            db_state = MarketState(
-                symbol_id=db_symbol.id,
-                date=latest_date,
-                trend_type=classification["trend_type"],
-                volatility_level=classification["volatility_level"],
-                risk_level=classification["risk_level"],
-                recommended_strategy=classification["recommended_strategy"],
-                position_sizing_ratio=Decimal(str(classification["position_sizing_ratio"])),
+    필드별 배열로 구성된 열 지향 응답을 반환합니다:
+    {"symbol", "fields", "total_points", "returned_points", "date": [...], "series": {field: [...]}}
+    """
+    symbol = symbol.upper()
+    requested = list(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    unknown = [f for f in requested if f not in BAR_SERIES_FIELDS + INDICATOR_SERIES_FIELDS]
+    if not requested or unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+
+    row = (
+        await db.execute(
+            select(Symbol.id, SymbolLatestSnapshot.updated_at)
+            .outerjoin(SymbolLatestSnapshot, SymbolLatestSnapshot.symbol_id == Symbol.id)
+            .where(Symbol.symbol == symbol)
+        )
+    ).first()
+    if not row:
+        raise HTTPException(status_code=404, detail=f"Symbol {symbol} not found")
+    symbol_id, snapshot_updated_at = row
+
+    # 일봉/지표가 갱신되면 스냅샷 갱신 시각도 바뀜
+    etag = compute_etag(
+        "series", symbol, ",".join(requested), from_date, to_date, max_points, snapshot_updated_at
+    )
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    bar_fields = [f for f in requested if f in BAR_SERIES_FIELDS]
+    indicator_fields = [f for f in requested if f in INDICATOR_SERIES_FIELDS]
+    indicator_columns = [getattr(TechnicalIndicator, f) for f in indicator_fields]
+
+    if bar_fields:
+        date_column = PriceBar.date
+        query = select(
+            PriceBar.date,
+            *[cast(getattr(PriceBar, f), Float).label(f) for f in bar_fields],
+            *indicator_columns,
+        ).where(PriceBar.symbol_id == symbol_id)
+        if indicator_fields:
+            query = query.outerjoin(
+                TechnicalIndicator,
+                and_(
+                    TechnicalIndicator.symbol_id == PriceBar.symbol_id,
+                    TechnicalIndicator.date == PriceBar.date,
+                ),
             )
-            db.add(db_state)
-
-        db.commit()
-        db.refresh(db_state)
-
-        # 7. Symbol의 last_updated 업데이트
-        db_symbol.last_updated = datetime.now()
-        db.commit()
-
-        # 8. 응답 생성
-        return SymbolDetailResponse(
-            symbol=SymbolResponse(
-                id=db_symbol.id,
-                symbol=db_symbol.symbol,
-                name=db_symbol.name,
-                exchange=db_symbol.exchange,
-                last_updated=db_symbol.last_updated,
-            ),
-            current_price=float(latest_row["close"]),
-            latest_indicator=TechnicalIndicatorResponse(
-                date=db_indicator.date,
-                atr=float(db_indicator.atr) if db_indicator.atr else None,
-                atr_ratio=float(db_indicator.atr_ratio) if db_indicator.atr_ratio else None,
-                bb_upper=float(db_indicator.bb_upper) if db_indicator.bb_upper else None,
-                bb_middle=float(db_indicator.bb_middle) if db_indicator.bb_middle else None,
-                bb_lower=float(db_indicator.bb_lower) if db_indicator.bb_lower else None,
-                bb_width_ratio=float(db_indicator.bb_width_ratio) if db_indicator.bb_width_ratio else None,
-                adx=float(db_indicator.adx) if db_indicator.adx else None,
-                plus_di=float(db_indicator.plus_di) if db_indicator.plus_di else None,
-                minus_di=float(db_indicator.minus_di) if db_indicator.minus_di else None,
-                std_dev=float(db_indicator.std_dev) if db_indicator.std_dev else None,
-                vix=float(db_indicator.vix) if db_indicator.vix else None,
-            ),
-            latest_market_state=MarketStateResponse(
-                date=db_state.date,
-                trend_type=db_state.trend_type,
-                volatility_level=db_state.volatility_level,
-                risk_level=db_state.risk_level,
-                recommended_strategy=db_state.recommended_strategy,
-                position_sizing_ratio=float(db_state.position_sizing_ratio),
-            ),
+    else:
+        date_column = TechnicalIndicator.date
+        query = select(TechnicalIndicator.date, *indicator_columns).where(
+            TechnicalIndicator.symbol_id == symbol_id
         )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(status_code=500, detail=f"Failed to get symbol detail: {str(e)}")
+    if from_date:
+        query = query.where(date_column >= from_date)
+    if to_date:
+        query = query.where(date_column <= to_date)
+
+    rows = (await db.execute(query.order_by(date_column))).all()
+    ordered_fields = bar_fields + indicator_fields
+    series = await track(
+        "compute_series", run_cpu_bound(_build_series, rows, ordered_fields, max_points)
+    )
 
+    response = FastJSONResponse(
+        {
+            "symbol": symbol,
+            "fields": ordered_fields,
+            "from": from_date,
+            "to": to_date,
+            **series,
+        }
+    )
+    apply_cache_headers(response, etag)
+    return response
 
-@router.get("/", response_model=List[SymbolResponse])
+
+@router.get("/", response_model=SymbolListResponse)
 async def list_symbols(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
-    skip: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
     limit: int = Query(20, ge=1, le=100),
 ):
     """
-    저장된 종목 목록 조회
+    저장된 종목 목록 조회 (최근 갱신 순)
 
-    - **skip**: 건너뛸 개수 (페이징)
+    - **cursor**: 다음 페이지 커서 (첫 페이지는 생략)
     - **limit**: 조회할 개수 (기본값: 20, 최대: 100)
-    """
-    symbols = (
-        db.query(Symbol)
-        .order_by(Symbol.last_updated.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
 
-    return [
-        SymbolResponse(
-            id=s.id,
-            symbol=s.symbol,
-            name=s.name,
-            exchange=s.exchange,
-            last_updated=s.last_updated,
+    (updated_at, symbol_id) 인덱스 기반 keyset 페이지네이션으로, 페이지 깊이와 관계없이
+    일정한 비용으로 조회합니다.
+    """
+    rows = (
+        await db.execute(
+            keyset_page(
+                select(Symbol, SymbolLatestSnapshot.updated_at).join(
+                    SymbolLatestSnapshot, SymbolLatestSnapshot.symbol_id == Symbol.id
+                ),
+                (SymbolLatestSnapshot.updated_at, SymbolLatestSnapshot.symbol_id),
+                cursor,
+                (datetime, int),
+                limit,
+            )
         )
-        for s in symbols
-    ]
+    ).all()
+    page, next_cursor = split_page(rows, limit, key=lambda row: (row[1], row[0].id))
+
+    return SymbolListResponse(
+        items=[
+            SymbolResponse(
+                id=s.id,
+                symbol=s.symbol,
+                name=s.name,
+                exchange=s.exchange,
+                last_updated=last_updated,
+            )
+            for s, last_updated in page
+        ],
+        next_cursor=next_cursor,
+    )
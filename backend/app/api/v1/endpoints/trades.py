@@ -1,23 +1,231 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import Float, cast, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from datetime import date
+from app.db.session import get_async_db
+from app.core.deps import get_current_user
+from app.core.executor import run_cpu_bound
+from app.core.pagination import keyset_page, split_page
+from app.core.responses import FastJSONResponse
+from app.models.user import User
+from app.models.symbol import Symbol
+from app.models.trade import Trade
+from app.models.price_bar import PriceBar
+from app.schemas.trade import TradeCreate, TradeUpdate, TradeResponse, TradeListResponse
+from app.services.portfolio import (
+    compute_portfolio,
+    get_cached_portfolio,
+    invalidate_portfolio,
+    set_cached_portfolio,
+    trade_profit_loss,
+)
 
 router = APIRouter()
 
 
-@router.get("/")
-async def list_trades():
-    return {"message": "List trades endpoint (구현 예정)"}
+def _trade_response(trade: Trade, symbol: str) -> TradeResponse:
+    return TradeResponse(
+        id=trade.id,
+        user_id=trade.user_id,
+        symbol_id=trade.symbol_id,
+        symbol=symbol,
+        trade_type=trade.trade_type,
+        entry_date=trade.entry_date,
+        entry_price=float(trade.entry_price),
+        quantity=trade.quantity,
+        exit_date=trade.exit_date,
+        exit_price=float(trade.exit_price) if trade.exit_price is not None else None,
+        strategy_used=trade.strategy_used,
+        notes=trade.notes,
+        profit_loss=float(trade.profit_loss) if trade.profit_loss is not None else None,
+        profit_loss_percent=(
+            float(trade.profit_loss_percent) if trade.profit_loss_percent is not None else None
+        ),
+        created_at=trade.created_at,
+    )
 
 
-@router.post("/")
-async def create_trade():
-    return {"message": "Create trade endpoint (구현 예정)"}
+def _apply_profit_loss(trade: Trade) -> None:
+    """청산가가 있으면 손익/손익률 계산, 없으면 초기화"""
+    if (trade.exit_price is None) != (trade.exit_date is None):
+        raise HTTPException(
+            status_code=400, detail="exit_date and exit_price must be set together"
+        )
+    if trade.exit_date is not None and trade.exit_date < trade.entry_date:
+        raise HTTPException(status_code=400, detail="exit_date must not precede entry_date")
 
+    trade.profit_loss, trade.profit_loss_percent = trade_profit_loss(
+        trade.trade_type,
+        float(trade.entry_price),
+        float(trade.exit_price) if trade.exit_price is not None else None,
+        trade.quantity,
+    )
 
-@router.put("/{trade_id}")
-async def update_trade(trade_id: int):
-    return {"message": f"Update trade {trade_id} endpoint (구현 예정)"}
 
+async def _get_user_trade(db: AsyncSession, trade_id: int, user: User) -> tuple:
+    row = (
+        await db.execute(
+            select(Trade, Symbol.symbol)
+            .join(Symbol, Symbol.id == Trade.symbol_id)
+            .where(Trade.id == trade_id, Trade.user_id == user.id)
+        )
+    ).first()
+    if not row:
+        raise HTTPException(status_code=404, detail=f"Trade {trade_id} not found")
+    return row
 
-@router.delete("/{trade_id}")
-async def delete_trade(trade_id: int):
-    return {"message": f"Delete trade {trade_id} endpoint (구현 예정)"}
+
+@router.get("/", response_model=TradeListResponse)
+async def list_trades(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(50, ge=1, le=200),
+):
+    """
+    매매 기록 조회 (진입일 최신 순)
+
+    - **cursor**: 다음 페이지 커서 (첫 페이지는 생략)
+    - **limit**: 조회할 개수 (기본값: 50, 최대: 200)
+    """
+    rows = (
+        await db.execute(
+            keyset_page(
+                select(Trade, Symbol.symbol)
+                .join(Symbol, Symbol.id == Trade.symbol_id)
+                .where(Trade.user_id == current_user.id),
+                (Trade.entry_date, Trade.id),
+                cursor,
+                (date, int),
+                limit,
+            )
+        )
+    ).all()
+    page, next_cursor = split_page(rows, limit, key=lambda r: (r[0].entry_date, r[0].id))
+
+    return TradeListResponse(
+        items=[_trade_response(trade, symbol) for trade, symbol in page],
+        next_cursor=next_cursor,
+    )
+
+
+@router.get("/analytics")
+async def get_portfolio_analytics(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    포트폴리오 성과 분석
+
+    전체 매매 기록과 저장된 일봉(price_bars)으로 다음을 계산합니다.
+    - **summary**: 실현/미실현 손익, 승률, 평균 수익/손실, 손익비, 최대 낙폭
+    - **equity_curve**: 일별 실현/평가/합계 손익과 낙폭 (열 지향 배열)
+    - **by_strategy**: 전략(strategy_used)별 거래 수, 승률, 손익, 기여도
+
+    결과는 사용자별로 캐시되며 매매 기록 생성/수정/삭제 시 무효화됩니다.
+    """
+    cached = get_cached_portfolio(current_user.id)
+    if cached is not None:
+        return FastJSONResponse(cached)
+
+    trade_rows = (
+        await db.execute(
+            select(
+                Trade.id,
+                Trade.symbol_id,
+                Symbol.symbol,
+                Trade.trade_type,
+                Trade.entry_date,
+                cast(Trade.entry_price, Float),
+                Trade.exit_date,
+                cast(Trade.exit_price, Float),
+                Trade.quantity,
+                Trade.strategy_used,
+            )
+            .join(Symbol, Symbol.id == Trade.symbol_id)
+            .where(Trade.user_id == current_user.id)
+        )
+    ).all()
+
+    bar_rows = []
+    if trade_rows:
+        first_entry = min(row.entry_date for row in trade_rows)
+        symbol_ids = {row.symbol_id for row in trade_rows}
+        bar_rows = (
+            await db.execute(
+                select(PriceBar.symbol_id, PriceBar.date, PriceBar.close).where(
+                    PriceBar.symbol_id.in_(symbol_ids),
+                    PriceBar.date >= first_entry,
+                )
+            )
+        ).all()
+
+    result = await run_cpu_bound(
+        compute_portfolio,
+        [tuple(row) for row in trade_rows],
+        [tuple(row) for row in bar_rows],
+    )
+    set_cached_portfolio(current_user.id, result)
+    return FastJSONResponse(result)
+
+
+@router.post("/", response_model=TradeResponse, status_code=201)
+async def create_trade(
+    trade_in: TradeCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    """매매 기록 추가 (청산가가 있으면 손익 자동 계산)"""
+    symbol = (
+        await db.execute(select(Symbol.symbol).where(Symbol.id == trade_in.symbol_id))
+    ).scalar_one_or_none()
+    if symbol is None:
+        raise HTTPException(status_code=404, detail=f"Symbol {trade_in.symbol_id} not found")
+
+    trade = Trade(user_id=current_user.id, **trade_in.model_dump())
+    _apply_profit_loss(trade)
+
+    db.add(trade)
+    await db.commit()
+    await db.refresh(trade)
+    invalidate_portfolio(current_user.id)
+
+    return _trade_response(trade, symbol)
+
+
+@router.put("/{trade_id}", response_model=TradeResponse)
+async def update_trade(
+    trade_id: int,
+    trade_in: TradeUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    """매매 기록 수정 (전달된 필드만 변경, 손익 재계산)"""
+    trade, symbol = await _get_user_trade(db, trade_id, current_user)
+
+    for field, value in trade_in.model_dump(exclude_unset=True).items():
+        setattr(trade, field, value)
+    _apply_profit_loss(trade)
+
+    await db.commit()
+    await db.refresh(trade)
+    invalidate_portfolio(current_user.id)
+
+    return _trade_response(trade, symbol)
+
+
+@router.delete("/{trade_id}", status_code=204)
+async def delete_trade(
+    trade_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    """매매 기록 삭제"""
+    trade, _ = await _get_user_trade(db, trade_id, current_user)
+
+    await db.delete(trade)
+    await db.commit()
+    invalidate_portfolio(current_user.id)
+
+    return Response(status_code=204)
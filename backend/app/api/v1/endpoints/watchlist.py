@@ -1,129 +1,229 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Set
 from datetime import datetime
-from app.db.session import get_db
-from app.core.deps import get_current_user
+import json
+from app.db.session import AsyncSessionLocal, get_async_db
+from app.core.deps import get_current_user, get_current_user_from_query
+from app.core.redis import get_async_redis
+from app.core.responses import FastJSONResponse
+from app.core.http_cache import apply_cache_headers, compute_etag, etag_matches, not_modified
 from app.models.user import User
 from app.models.watchlist import Watchlist
 from app.models.symbol import Symbol
-from app.models.technical_indicator import TechnicalIndicator
-from app.models.market_state import MarketState
+from app.models.symbol_latest_snapshot import SymbolLatestSnapshot
 from app.schemas.watchlist import (
     WatchlistItemResponse,
     WatchlistItemCreate,
     WatchlistItemUpdate,
     WatchlistItemDetailResponse,
 )
-from app.schemas.symbol import (
-    SymbolResponse,
-    TechnicalIndicatorResponse,
-    MarketStateResponse,
-)
+from app.services.updates import notify_watchlist_changed, symbol_channel, user_channel
 
 router = APIRouter()
 
+# SSE 연결 유지용 heartbeat 간격 (프록시 유휴 타임아웃 방지)
+STREAM_HEARTBEAT_SECONDS = 15
+
+
+def watchlist_detail_query(user_id) -> Select:
+    """
+    관심 종목 + 심볼 + 최신 스냅샷(종가, 지표, 시장 상태)을 한 번에 조회하는 쿼리
+
+    symbol_latest_snapshot을 기본 키로 조인하므로 지표/시장 상태 이력 길이와
+    관심 종목 수에 관계없이 DB 왕복은 1회입니다.
+    """
+    return (
+        select(Watchlist, Symbol, SymbolLatestSnapshot)
+        .join(Symbol, Symbol.id == Watchlist.symbol_id)
+        .outerjoin(SymbolLatestSnapshot, SymbolLatestSnapshot.symbol_id == Watchlist.symbol_id)
+        .where(Watchlist.user_id == user_id)
+        .order_by(Watchlist.created_at.desc())
+    )
+
+
+def _watchlist_etag(rows) -> str:
+    """관심 종목 응답 ETag (구성 종목 + 종목별 최신 봉 날짜, 스냅샷 갱신 시각, 시그널 ID)"""
+    parts = []
+    for item, symbol, snapshot in rows:
+        parts.append(item.id)
+        parts.append(symbol.symbol)
+        if snapshot:
+            parts.extend(
+                [snapshot.indicator_date, snapshot.updated_at, snapshot.signal_id]
+            )
+    return compute_etag("watchlist", *parts)
+
+
+def _indicator_payload(snapshot: SymbolLatestSnapshot) -> dict:
+    """TechnicalIndicatorResponse 형태의 dict"""
+    return {
+        "date": snapshot.indicator_date,
+        "atr": snapshot.atr,
+        "atr_ratio": snapshot.atr_ratio,
+        "bb_upper": snapshot.bb_upper,
+        "bb_middle": snapshot.bb_middle,
+        "bb_lower": snapshot.bb_lower,
+        "bb_width_ratio": snapshot.bb_width_ratio,
+        "adx": snapshot.adx,
+        "plus_di": snapshot.plus_di,
+        "minus_di": snapshot.minus_di,
+        "std_dev": snapshot.std_dev,
+        "vix": snapshot.vix,
+    }
+
+
+def _market_state_payload(snapshot: SymbolLatestSnapshot) -> dict:
+    """MarketStateResponse 형태의 dict"""
+    return {
+        "date": snapshot.market_state_date,
+        "trend_type": snapshot.trend_type,
+        "volatility_level": snapshot.volatility_level,
+        "risk_level": snapshot.risk_level,
+        "recommended_strategy": snapshot.recommended_strategy,
+        "position_sizing_ratio": snapshot.position_sizing_ratio,
+    }
+
+
+def _watchlist_item_payload(item: Watchlist, symbol: Symbol, snapshot) -> dict:
+    """WatchlistItemDetailResponse 형태의 dict"""
+    return {
+        "id": item.id,
+        "user_id": item.user_id,
+        "added_at": item.created_at,
+        "notes": None,
+        "symbol": {
+            "id": symbol.id,
+            "symbol": symbol.symbol,
+            "name": symbol.name,
+            "exchange": symbol.exchange,
+            "last_updated": snapshot.updated_at if snapshot else None,
+        },
+        "current_price": snapshot.close if snapshot else None,
+        "latest_indicator": (
+            _indicator_payload(snapshot) if snapshot and snapshot.indicator_date else None
+        ),
+        "latest_market_state": (
+            _market_state_payload(snapshot) if snapshot and snapshot.market_state_date else None
+        ),
+    }
+
 
 @router.get("/", response_model=List[WatchlistItemDetailResponse])
 async def get_watchlist(
-    db: Session = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
     현재 사용자의 관심 종목 목록 조회
 
-    각 종목의 최신 지표 및 시장 상태 정보를 포함합니다.
+    각 종목의 최신 종가, 지표 및 시장 상태 정보를 포함합니다 (단일 쿼리).
+    If-None-Match가 ETag와 일치하면 응답 본문 없이 304를 반환합니다.
+
+    스냅샷 행에서 바로 dict를 만들어 orjson으로 직렬화합니다
+    (종목별 Pydantic 모델 생성/검증 및 jsonable_encoder 생략).
     """
-    watchlist_items = (
-        db.query(Watchlist)
-        .filter(Watchlist.user_id == current_user.id)
-        .order_by(Watchlist.added_at.desc())
-        .all()
+    rows = (await db.execute(watchlist_detail_query(current_user.id))).all()
+
+    etag = _watchlist_etag(rows)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    response = FastJSONResponse(
+        [_watchlist_item_payload(item, symbol, snapshot) for item, symbol, snapshot in rows]
     )
+    apply_cache_headers(response, etag)
+    return response
 
-    result = []
-    for item in watchlist_items:
-        symbol = db.query(Symbol).filter(Symbol.id == item.symbol_id).first()
-        if not symbol:
-            continue
-
-        # 최신 기술적 지표 조회
-        latest_indicator = (
-            db.query(TechnicalIndicator)
-            .filter(TechnicalIndicator.symbol_id == symbol.id)
-            .order_by(TechnicalIndicator.date.desc())
-            .first()
-        )
 
-        # 최신 시장 상태 조회
-        latest_market_state = (
-            db.query(MarketState)
-            .filter(MarketState.symbol_id == symbol.id)
-            .order_by(MarketState.date.desc())
-            .first()
-        )
+def _sse(event: str, data: str) -> str:
+    """Server-Sent Events 메시지 포맷"""
+    return f"event: {event}\ndata: {data}\n\n"
 
-        # 현재 가격 (latest_indicator의 close 가격 사용)
-        current_price = None
-        if latest_indicator:
-            # TechnicalIndicator에는 close 가격이 없으므로, 별도로 조회하거나 생략
-            # 여기서는 None으로 설정 (실제로는 FMP API에서 실시간 가격 조회 가능)
-            current_price = None
-
-        result.append(
-            WatchlistItemDetailResponse(
-                id=item.id,
-                user_id=item.user_id,
-                added_at=item.added_at,
-                notes=item.notes,
-                symbol=SymbolResponse(
-                    id=symbol.id,
-                    symbol=symbol.symbol,
-                    name=symbol.name,
-                    exchange=symbol.exchange,
-                    last_updated=symbol.last_updated,
-                ),
-                current_price=current_price,
-                latest_indicator=(
-                    TechnicalIndicatorResponse(
-                        date=latest_indicator.date,
-                        atr=float(latest_indicator.atr) if latest_indicator.atr else None,
-                        atr_ratio=float(latest_indicator.atr_ratio) if latest_indicator.atr_ratio else None,
-                        bb_upper=float(latest_indicator.bb_upper) if latest_indicator.bb_upper else None,
-                        bb_middle=float(latest_indicator.bb_middle) if latest_indicator.bb_middle else None,
-                        bb_lower=float(latest_indicator.bb_lower) if latest_indicator.bb_lower else None,
-                        bb_width_ratio=float(latest_indicator.bb_width_ratio) if latest_indicator.bb_width_ratio else None,
-                        adx=float(latest_indicator.adx) if latest_indicator.adx else None,
-                        plus_di=float(latest_indicator.plus_di) if latest_indicator.plus_di else None,
-                        minus_di=float(latest_indicator.minus_di) if latest_indicator.minus_di else None,
-                        std_dev=float(latest_indicator.std_dev) if latest_indicator.std_dev else None,
-                        vix=float(latest_indicator.vix) if latest_indicator.vix else None,
-                    )
-                    if latest_indicator
-                    else None
-                ),
-                latest_market_state=(
-                    MarketStateResponse(
-                        date=latest_market_state.date,
-                        trend_type=latest_market_state.trend_type,
-                        volatility_level=latest_market_state.volatility_level,
-                        risk_level=latest_market_state.risk_level,
-                        recommended_strategy=latest_market_state.recommended_strategy,
-                        position_sizing_ratio=float(latest_market_state.position_sizing_ratio),
-                    )
-                    if latest_market_state
-                    else None
-                ),
-            )
+
+async def _watchlist_symbol_ids(user_id) -> Set[int]:
+    """사용자의 관심 종목 ID 집합 조회 (스트림 수명 동안 커넥션을 점유하지 않도록 짧은 세션 사용)"""
+    async with AsyncSessionLocal() as db:
+        return set(
+            (await db.scalars(select(Watchlist.symbol_id).where(Watchlist.user_id == user_id))).all()
         )
 
-    return result
+
+@router.get("/stream")
+async def stream_watchlist_updates(
+    request: Request,
+    current_user: User = Depends(get_current_user_from_query),
+):
+    """
+    관심 종목 변경 사항 구독 (Server-Sent Events)
+
+    - **token**: JWT 액세스 토큰 (EventSource는 헤더를 설정할 수 없으므로 쿼리 파라미터로 전달)
+
+    관심 종목의 시장 상태 또는 매매 시그널이 바뀌었을 때만 변경된 필드를 전송합니다.
+    - `event: ready` — 구독 중인 종목 ID 목록
+    - `event: market_state` / `event: signal` — {"symbol_id", "symbol", "as_of", "changes", ...}
+    - `event: watchlist` — 관심 종목 추가/삭제로 구독 대상이 바뀜
+    """
+    user_id = current_user.id
+    initial_symbol_ids = await _watchlist_symbol_ids(user_id)
+    control_channel = user_channel(user_id)
+
+    async def _events():
+        pubsub = get_async_redis().pubsub()
+        subscribed: Set[int] = set()
+
+        async def _resubscribe(symbol_ids: Set[int]) -> None:
+            added = symbol_ids - subscribed
+            removed = subscribed - symbol_ids
+            if added:
+                await pubsub.subscribe(*(symbol_channel(symbol_id) for symbol_id in added))
+            if removed:
+                await pubsub.unsubscribe(*(symbol_channel(symbol_id) for symbol_id in removed))
+            subscribed.clear()
+            subscribed.update(symbol_ids)
+
+        try:
+            await pubsub.subscribe(control_channel)
+            await _resubscribe(initial_symbol_ids)
+            yield _sse("ready", json.dumps({"symbol_ids": sorted(subscribed)}))
+
+            while not await request.is_disconnected():
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=STREAM_HEARTBEAT_SECONDS
+                )
+                if message is None:
+                    yield ": keep-alive\n\n"
+                    continue
+
+                if message["channel"] == control_channel:
+                    await _resubscribe(await _watchlist_symbol_ids(user_id))
+                    yield _sse("watchlist", json.dumps({"symbol_ids": sorted(subscribed)}))
+                    continue
+
+                payload = json.loads(message["data"])
+                yield _sse(payload.get("event", "update"), message["data"])
+        finally:
+            await pubsub.aclose()
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        # Content-Encoding: identity — GZip 미들웨어가 이벤트를 버퍼링하지 않도록 압축 제외
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+            "Content-Encoding": "identity",
+        },
+    )
 
 
 @router.post("/", response_model=WatchlistItemResponse, status_code=201)
 async def add_to_watchlist(
     watchlist_item: WatchlistItemCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -133,18 +233,16 @@ async def add_to_watchlist(
     - **notes**: 메모 (선택사항)
     """
     # 종목 존재 여부 확인
-    symbol = db.query(Symbol).filter(Symbol.id == watchlist_item.symbol_id).first()
+    symbol = await db.get(Symbol, watchlist_item.symbol_id)
     if not symbol:
         raise HTTPException(status_code=404, detail="Symbol not found")
 
     # 이미 관심 종목에 있는지 확인
-    existing = (
-        db.query(Watchlist)
-        .filter(
+    existing = await db.scalar(
+        select(Watchlist).where(
             Watchlist.user_id == current_user.id,
             Watchlist.symbol_id == watchlist_item.symbol_id,
         )
-        .first()
     )
 
     if existing:
@@ -158,8 +256,9 @@ async def add_to_watchlist(
     )
 
     db.add(new_item)
-    db.commit()
-    db.refresh(new_item)
+    await db.commit()
+    await db.refresh(new_item)
+    await notify_watchlist_changed(current_user.id)
 
     return WatchlistItemResponse(
         id=new_item.id,
@@ -174,7 +273,7 @@ async def add_to_watchlist(
 async def update_watchlist_item(
     watchlist_id: int,
     update_data: WatchlistItemUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -183,13 +282,11 @@ async def update_watchlist_item(
     - **watchlist_id**: 관심 종목 ID
     - **notes**: 새로운 메모 내용
     """
-    item = (
-        db.query(Watchlist)
-        .filter(
+    item = await db.scalar(
+        select(Watchlist).where(
             Watchlist.id == watchlist_id,
             Watchlist.user_id == current_user.id,
         )
-        .first()
     )
 
     if not item:
@@ -198,8 +295,8 @@ async def update_watchlist_item(
     if update_data.notes is not None:
         item.notes = update_data.notes
 
-    db.commit()
-    db.refresh(item)
+    await db.commit()
+    await db.refresh(item)
 
     return WatchlistItemResponse(
         id=item.id,
@@ -213,7 +310,7 @@ async def update_watchlist_item(
 @router.delete("/{watchlist_id}", status_code=204)
 async def remove_from_watchlist(
     watchlist_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -221,19 +318,18 @@ async def remove_from_watchlist(
 
     - **watchlist_id**: 제거할 관심 종목 ID
     """
-    item = (
-        db.query(Watchlist)
-        .filter(
+    item = await db.scalar(
+        select(Watchlist).where(
             Watchlist.id == watchlist_id,
             Watchlist.user_id == current_user.id,
         )
-        .first()
     )
 
     if not item:
         raise HTTPException(status_code=404, detail="Watchlist item not found")
 
-    db.delete(item)
-    db.commit()
+    await db.delete(item)
+    await db.commit()
+    await notify_watchlist_changed(current_user.id)
 
     return None
@@ -0,0 +1,82 @@
+"""
+In-process TTL Cache
+
+프로세스 내 단기 캐시 (가격 데이터, 지표 계산 결과 등 재사용)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+# 이름 있는 캐시 (지표 노출용, app.core.metrics 참고)
+_named_caches: Dict[str, "TTLCache"] = {}
+
+
+def named_caches() -> Dict[str, "TTLCache"]:
+    """이름으로 등록된 캐시 목록"""
+    return dict(_named_caches)
+
+
+class TTLCache(Generic[V]):
+    """만료 시간(TTL)과 최대 크기(LRU)를 가진 스레드 안전 캐시"""
+
+    def __init__(self, ttl_seconds: float, maxsize: int = 1024, name: Optional[str] = None):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+        if name is not None:
+            _named_caches[name] = self
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """캐시 조회 (없거나 만료되었으면 None)"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def peek(self, key: Hashable) -> Optional[V]:
+        """적중률/LRU 순서에 영향 없이 캐시 조회 (없거나 만료되었으면 None)"""
+        with self._lock:
+            entry = self._data.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return entry[1]
+
+    def set(self, key: Hashable, value: V) -> None:
+        """캐시 저장 (최대 크기 초과 시 가장 오래 사용되지 않은 항목 제거)"""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """특정 키 무효화"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """전체 무효화"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -26,6 +26,11 @@ celery_app.conf.beat_schedule = {
         "task": "app.tasks.data_update.update_all_watchlist_symbols",
         "schedule": 14400.0,  # 4시간마다 (초 단위)
     },
+    "create-partitions-daily": {
+        "task": "app.tasks.data_update.create_partitions",
+        "schedule": 86400.0,  # 24시간마다 (초 단위)
+        "options": {"expires": 3600},
+    },
     "cleanup-old-data-daily": {
         "task": "app.tasks.data_update.cleanup_old_data",
         "schedule": 86400.0,  # 24시간마다 (초 단위)
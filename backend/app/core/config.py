@@ -6,6 +6,12 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str
 
+    # Database connection pool (비동기 엔진)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+
     # Redis
     REDIS_URL: str
 
@@ -28,6 +34,32 @@ class Settings(BaseSettings):
     CELERY_BROKER_URL: str
     CELERY_RESULT_BACKEND: str
 
+    # Analytics executor (CPU-bound 지표/시그널 연산)
+    ANALYTICS_EXECUTOR_KIND: str = "thread"  # "thread" 또는 "process"
+    ANALYTICS_MAX_WORKERS: int = 4
+    ANALYTICS_MAX_PENDING: int = 32
+    ANALYTICS_QUEUE_TIMEOUT_SECONDS: float = 10.0
+
+    # 사용자별 요청 제한 (토큰 버킷, 비용은 app.core.rate_limit 참고)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_CAPACITY: int = 60
+    RATE_LIMIT_REFILL_PER_SECOND: float = 0.5
+    RATE_LIMIT_MAX_WAIT_SECONDS: float = 2.0
+
+    # 느린 요청 cProfile 덤프 (0이면 비활성화, app.core.profiling 참고)
+    PROFILE_SLOWEST_N: int = 0
+    PROFILE_SAMPLE_RATE: float = 0.1
+    PROFILE_DUMP_DIR: str = "profiles"
+
+    # Celery 워커 Prometheus 지표 HTTP 서버 포트 (0이면 비활성화, app.core.metrics 참고)
+    CELERY_METRICS_PORT: int = 0
+    # API GET /metrics Bearer 토큰 (비어 있으면 /metrics 비활성화)
+    METRICS_TOKEN: str = ""
+
+    # 시계열 테이블 월 단위 파티션 (app.services.partitions 참고)
+    PARTITION_MONTHS_AHEAD: int = 3
+    PARTITION_DETACH_ONLY: bool = False  # True면 만료 파티션을 분리만 하고 삭제하지 않음
+
     class Config:
         env_file = ".env"
         case_sensitive = True
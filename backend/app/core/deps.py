@@ -1,20 +1,44 @@
+import uuid
 from typing import Generator
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
-from sqlalchemy.orm import Session
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.cache import TTLCache
 from app.core.config import settings
-from app.db.session import get_db
+from app.db.session import get_db, get_async_db
 from app.models.user import User
 from app.schemas.user import TokenPayload
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
+# 인증된 활성 사용자 캐시 (토큰 subject -> 세션에서 분리된 User)
+# 비활성화/삭제 시 즉시 무효화하며, 다른 프로세스에서의 변경은 TTL 이내에 반영됩니다.
+PRINCIPAL_CACHE_TTL_SECONDS = 60
+_principal_cache: TTLCache[User] = TTLCache(
+    ttl_seconds=PRINCIPAL_CACHE_TTL_SECONDS, maxsize=4096, name="principal"
+)
 
-def get_current_user(
-    db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
-) -> User:
-    """현재 인증된 사용자 조회"""
+
+def invalidate_user(user_id) -> None:
+    """캐시된 사용자 무효화 (비활성화, 삭제, 권한 변경 시 호출)"""
+    _principal_cache.invalidate(str(user_id))
+
+
+@event.listens_for(User.is_active, "set")
+def _on_user_active_changed(target: User, value, oldvalue, initiator):
+    if target.id is not None and value != oldvalue:
+        invalidate_user(target.id)
+
+
+@event.listens_for(User, "after_delete")
+def _on_user_deleted(mapper, connection, target: User):
+    invalidate_user(target.id)
+
+
+async def _authenticate(db: AsyncSession, token: str) -> User:
+    """JWT 토큰 검증 후 사용자 조회"""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -28,10 +52,17 @@ def get_current_user(
         if token_data.sub is None:
             raise credentials_exception
 
-    except JWTError:
+        user_id = uuid.UUID(token_data.sub)
+
+    except (JWTError, ValueError):
         raise credentials_exception
 
-    user = db.query(User).filter(User.id == token_data.sub).first()
+    cache_key = str(user_id)
+    user = _principal_cache.get(cache_key)
+    if user is not None:
+        return user
+
+    user = await db.scalar(select(User).where(User.id == user_id))
 
     if user is None:
         raise credentials_exception
@@ -39,9 +70,31 @@ def get_current_user(
     if not user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
 
+    # 요청 세션과 분리하여 다른 요청에서 공유 (컬럼은 모두 로드된 상태)
+    db.expunge(user)
+    _principal_cache.set(cache_key, user)
     return user
 
 
+async def get_current_user(
+    db: AsyncSession = Depends(get_async_db), token: str = Depends(oauth2_scheme)
+) -> User:
+    """현재 인증된 사용자 조회"""
+    return await _authenticate(db, token)
+
+
+async def get_current_user_from_query(
+    db: AsyncSession = Depends(get_async_db),
+    token: str = Query(..., description="JWT 액세스 토큰"),
+) -> User:
+    """
+    쿼리 파라미터(?token=)로 전달된 토큰으로 사용자 조회
+
+    Authorization 헤더를 설정할 수 없는 EventSource(SSE) 연결용입니다.
+    """
+    return await _authenticate(db, token)
+
+
 def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
     """활성 사용자 조회"""
     if not current_user.is_active:
@@ -0,0 +1,94 @@
+"""
+CPU-bound 분석 작업 실행기
+
+지표 계산, 시장 상태 분류, 시그널 생성 등 CPU 연산을 이벤트 루프 밖의 워커 풀에서 실행합니다.
+동시에 대기/실행 가능한 작업 수를 제한하여, 포화 시 요청을 무한정 쌓지 않고 503으로 거절합니다.
+"""
+
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional, TypeVar
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+
+class ExecutorSaturatedError(Exception):
+    """분석 워커 풀의 대기열이 가득 차 작업을 받을 수 없음"""
+
+
+class AnalyticsExecutor:
+    """
+    대기열 크기가 제한된 분석 작업 실행기
+
+    Args:
+        kind: "thread" 또는 "process" (process는 인자/결과가 pickle 가능해야 함)
+        max_workers: 워커 수
+        max_pending: 실행 중 + 대기 중인 최대 작업 수
+        queue_timeout: 대기열 자리가 날 때까지 기다리는 최대 시간 (초)
+    """
+
+    def __init__(self, kind: str, max_workers: int, max_pending: int, queue_timeout: float):
+        self.kind = kind
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.queue_timeout = queue_timeout
+        self._pool: Optional[Executor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._in_flight = 0
+
+    @property
+    def pool(self) -> Executor:
+        if self._pool is None:
+            if self.kind == "process":
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="analytics"
+                )
+        return self._pool
+
+    @property
+    def in_flight(self) -> int:
+        """실행 중 + 대기 중인 작업 수"""
+        return self._in_flight
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """작업을 워커 풀에서 실행하고 결과를 기다림 (대기열 포화 시 ExecutorSaturatedError)"""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_pending)
+
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise ExecutorSaturatedError(
+                f"Analytics executor saturated ({self.max_pending} pending tasks)"
+            )
+
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.pool, partial(func, *args, **kwargs))
+        finally:
+            self._in_flight -= 1
+            self._slots.release()
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+analytics_executor = AnalyticsExecutor(
+    kind=settings.ANALYTICS_EXECUTOR_KIND,
+    max_workers=settings.ANALYTICS_MAX_WORKERS,
+    max_pending=settings.ANALYTICS_MAX_PENDING,
+    queue_timeout=settings.ANALYTICS_QUEUE_TIMEOUT_SECONDS,
+)
+
+
+async def run_cpu_bound(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """CPU 연산을 분석 워커 풀에서 실행하고 결과를 기다림"""
+    return await analytics_executor.run(func, *args, **kwargs)
@@ -0,0 +1,65 @@
+"""
+HTTP Conditional GET 지원
+
+- ETag 계산 및 If-None-Match 비교 (일치하면 304로 조기 응답)
+- 장 세션에 맞춘 Cache-Control 헤더
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+from app.services.market_session import is_market_open, next_bar_change_at
+
+# 장중에는 일봉이 계속 갱신되므로 짧게 캐시
+INTRADAY_MAX_AGE_SECONDS = 60
+# 장외 시간에도 장 마감 후 갱신 작업이 반영될 수 있도록 상한을 둠
+OFF_HOURS_MAX_AGE_SECONDS = 900
+
+
+def compute_etag(*parts: Any) -> str:
+    """구성 요소(종목, 최신 봉 날짜, 시그널 ID 등)로부터 약한 ETag 생성"""
+    raw = "|".join("" if part is None else str(part) for part in parts)
+    return 'W/"' + hashlib.sha1(raw.encode()).hexdigest()[:20] + '"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 (약한 비교)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+
+    def _opaque(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+
+    target = _opaque(etag)
+    return any(_opaque(candidate) == target for candidate in header.split(","))
+
+
+def cache_control(now: Optional[datetime] = None) -> str:
+    """장 세션에 맞춘 Cache-Control 값 (장외 시간에는 다음 장 시작까지, 상한 적용)"""
+    now = now or datetime.now(timezone.utc)
+    if is_market_open(now):
+        max_age = INTRADAY_MAX_AGE_SECONDS
+    else:
+        remaining = int((next_bar_change_at(now) - now).total_seconds())
+        max_age = max(0, min(OFF_HOURS_MAX_AGE_SECONDS, remaining))
+    return f"private, max-age={max_age}"
+
+
+def apply_cache_headers(response: Response, etag: str) -> None:
+    """응답에 ETag 및 Cache-Control 헤더 설정"""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control()
+
+
+def not_modified(etag: str) -> Response:
+    """304 Not Modified 응답"""
+    response = Response(status_code=304)
+    apply_cache_headers(response, etag)
+    return response
@@ -0,0 +1,341 @@
+"""
+Prometheus Metrics
+
+API/Celery/업스트림 지표를 Prometheus 형식으로 노출합니다.
+
+- http_request_duration_seconds   — 라우트(경로 템플릿)/메서드/상태 코드별 요청 처리 시간
+- upstream_request_duration_seconds / upstream_requests_total
+                                  — 업스트림 제공자(yfinance) 메서드별 호출 시간, 성공/실패 건수
+- cache_hits_total / cache_misses_total / cache_entries
+                                  — 이름 있는 TTLCache별 적중/미스 (적중률은 PromQL에서 계산)
+- celery_task_duration_seconds / celery_tasks_total
+                                  — Celery 태스크별 실행 시간, 종료 상태별 건수
+- celery_queue_length             — 브로커 대기열 길이 (스크레이프 시 조회)
+- symbol_refresh_lag_seconds      — 전체 종목의 마지막 지표 갱신 후 경과 시간 분위수 (스크레이프 시 조회)
+- db_pool_* / analytics_executor_* — DB 커넥션 풀, 분석 워커 풀 포화도 (스크레이프 시 조회)
+
+API 프로세스는 GET /metrics로 (METRICS_TOKEN Bearer 인증, 비어 있으면 비활성화),
+Celery 워커는 CELERY_METRICS_PORT의 HTTP 서버로 노출합니다.
+prefork 워커는 PROMETHEUS_MULTIPROC_DIR을 설정해야 자식 프로세스의 지표가 합산됩니다.
+"""
+
+import logging
+import os
+import secrets
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from celery.signals import task_postrun, task_prerun, worker_ready
+from fastapi import Header, HTTPException, status
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    start_http_server,
+)
+from prometheus_client.core import REGISTRY, CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.multiprocess import MultiProcessCollector
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+from sqlalchemy import func, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import named_caches
+from app.core.celery_app import celery_app
+from app.core.config import settings
+from app.core.executor import analytics_executor
+from app.db.session import async_engine
+from app.models.symbol_latest_snapshot import SymbolLatestSnapshot
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 라우트에 매칭되지 않은 요청(404 스캔 등)의 라벨 (경로별로 흩어지지 않도록)
+UNMATCHED_ROUTE = "<unmatched>"
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+UPSTREAM_LATENCY = Histogram(
+    "upstream_request_duration_seconds",
+    "Upstream provider call latency",
+    ["provider", "method"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+
+UPSTREAM_REQUESTS = Counter(
+    "upstream_requests_total",
+    "Upstream provider calls by outcome",
+    ["provider", "method", "outcome"],
+)
+
+CELERY_TASK_DURATION = Histogram(
+    "celery_task_duration_seconds",
+    "Celery task execution time",
+    ["task"],
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 900.0, 3600.0),
+)
+
+CELERY_TASKS = Counter(
+    "celery_tasks_total",
+    "Celery tasks finished by state",
+    ["task", "state"],
+)
+
+CELERY_QUEUE_LENGTH = Gauge(
+    "celery_queue_length",
+    "Messages waiting in the Celery broker queue",
+    ["queue"],
+    multiprocess_mode="livemax",
+)
+
+# 종목별 시계열 대신 전체 종목 분위수만 노출 (종목 목록 비노출, 시계열 수 고정)
+REFRESH_LAG_QUANTILES = (0.5, 0.9, 1.0)
+
+SYMBOL_REFRESH_LAG = Gauge(
+    "symbol_refresh_lag_seconds",
+    "Seconds since symbol indicators were last refreshed, quantile across symbols",
+    ["quantile"],
+    multiprocess_mode="livemax",
+)
+
+
+# ---------------------------------------------------------------------------
+# HTTP 요청
+# ---------------------------------------------------------------------------
+
+_route_templates: Dict[Callable, str] = {}
+
+
+def route_template(scope) -> str:
+    """라우팅된 엔드포인트의 경로 템플릿 (예: /api/v1/symbols/{symbol})"""
+    endpoint = scope.get("endpoint")
+    if endpoint is None:
+        return UNMATCHED_ROUTE
+
+    if not _route_templates:
+        for route in scope["app"].routes:
+            if getattr(route, "endpoint", None) is not None:
+                _route_templates.setdefault(route.endpoint, route.path)
+    return _route_templates.get(endpoint, UNMATCHED_ROUTE)
+
+
+class MetricsMiddleware:
+    """요청 처리 시간을 라우트별 히스토그램으로 기록 (ASGI, 응답 본문 전송 완료까지 측정)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def _send(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, _send)
+        finally:
+            REQUEST_LATENCY.labels(
+                method=scope["method"], route=route_template(scope), status=str(status_code)
+            ).observe(time.perf_counter() - started)
+
+
+# ---------------------------------------------------------------------------
+# 업스트림 제공자
+# ---------------------------------------------------------------------------
+
+
+async def observe_upstream(provider: str, method: str, awaitable: Awaitable[T]) -> T:
+    """업스트림 호출 시간과 성공/실패 건수 기록 (예외는 그대로 전파)"""
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        result = await awaitable
+        outcome = "success"
+        return result
+    finally:
+        UPSTREAM_LATENCY.labels(provider, method).observe(time.perf_counter() - started)
+        UPSTREAM_REQUESTS.labels(provider, method, outcome).inc()
+
+
+# ---------------------------------------------------------------------------
+# 스크레이프 시점 수집 (캐시, DB 풀, 분석 워커 풀)
+# ---------------------------------------------------------------------------
+
+
+class CacheCollector:
+    """이름 있는 TTLCache의 적중/미스/항목 수"""
+
+    def collect(self):
+        hits = CounterMetricFamily("cache_hits", "In-process cache hits", labels=["cache"])
+        misses = CounterMetricFamily("cache_misses", "In-process cache misses", labels=["cache"])
+        entries = GaugeMetricFamily("cache_entries", "In-process cache entries", labels=["cache"])
+        for name, cache in named_caches().items():
+            hits.add_metric([name], cache.hits)
+            misses.add_metric([name], cache.misses)
+            entries.add_metric([name], len(cache))
+        yield hits
+        yield misses
+        yield entries
+
+
+class PoolCollector:
+    """비동기 DB 커넥션 풀과 분석 워커 풀의 사용량"""
+
+    def collect(self):
+        pool = async_engine.pool
+        for name, doc, value in (
+            ("db_pool_size", "Configured DB pool size", pool.size()),
+            ("db_pool_checked_out", "DB connections currently in use", pool.checkedout()),
+            ("db_pool_overflow", "DB connections opened beyond pool_size", max(pool.overflow(), 0)),
+            ("db_pool_max_overflow", "Configured DB max overflow", settings.DB_MAX_OVERFLOW),
+            (
+                "analytics_executor_in_flight",
+                "Analytics tasks running or waiting for a worker",
+                analytics_executor.in_flight,
+            ),
+            (
+                "analytics_executor_max_pending",
+                "Analytics tasks accepted before rejecting with 503",
+                analytics_executor.max_pending,
+            ),
+        ):
+            yield GaugeMetricFamily(name, doc, value=value)
+
+
+def register_api_collectors() -> None:
+    """API 프로세스 전용 수집기 등록 (main.py에서 한 번 호출)"""
+    REGISTRY.register(CacheCollector())
+    REGISTRY.register(PoolCollector())
+
+
+_broker_redis = None
+
+
+def _get_broker_redis():
+    global _broker_redis
+    if _broker_redis is None:
+        _broker_redis = aioredis.Redis.from_url(settings.CELERY_BROKER_URL)
+    return _broker_redis
+
+
+async def _update_queue_lengths() -> None:
+    if not settings.CELERY_BROKER_URL.startswith(("redis://", "rediss://")):
+        return
+    queue = celery_app.conf.task_default_queue
+    try:
+        length = await _get_broker_redis().llen(queue)
+    except RedisError as e:
+        logger.warning("failed to read celery queue length: %s", e)
+        return
+    CELERY_QUEUE_LENGTH.labels(queue).set(length)
+
+
+async def _update_refresh_lag(db: AsyncSession) -> None:
+    # 경과 시간의 q 분위수 = 갱신 시각의 (1 - q) 분위수 (DB에서 한 행으로 집계)
+    refreshed_at = SymbolLatestSnapshot.indicators_updated_at
+    try:
+        row = (
+            await db.execute(
+                select(
+                    *(
+                        func.percentile_disc(1 - quantile).within_group(refreshed_at)
+                        for quantile in REFRESH_LAG_QUANTILES
+                    )
+                )
+            )
+        ).one()
+    except (SQLAlchemyError, OSError) as e:
+        # 지표 노출은 DB 장애 중에도 유지 (풀/지연 지표가 가장 필요한 시점)
+        logger.warning("failed to read symbol refresh lag: %s", e)
+        return
+
+    now = datetime.now(timezone.utc)
+    SYMBOL_REFRESH_LAG.clear()  # 갱신된 종목이 없으면 노출하지 않음
+    for quantile, updated_at in zip(REFRESH_LAG_QUANTILES, row):
+        if updated_at is None:
+            continue
+        if updated_at.tzinfo is None:
+            updated_at = updated_at.replace(tzinfo=timezone.utc)
+        SYMBOL_REFRESH_LAG.labels(str(quantile)).set((now - updated_at).total_seconds())
+
+
+def require_metrics_token(authorization: Optional[str] = Header(None)) -> None:
+    """
+    GET /metrics 접근 검사 (Authorization: Bearer <METRICS_TOKEN>)
+
+    METRICS_TOKEN이 비어 있으면 엔드포인트가 없는 것처럼 404를 반환합니다.
+    """
+    if not settings.METRICS_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not secrets.compare_digest(
+        token.encode(), settings.METRICS_TOKEN.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+async def render_metrics(db: AsyncSession) -> tuple[bytes, str]:
+    """스크레이프 시점 지표 갱신 후 노출 형식으로 직렬화 (본문, Content-Type)"""
+    await _update_queue_lengths()
+    await _update_refresh_lag(db)
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+# ---------------------------------------------------------------------------
+# Celery 워커
+# ---------------------------------------------------------------------------
+
+_task_started: Dict[str, float] = {}
+
+
+@task_prerun.connect
+def _on_task_prerun(task_id: str = None, **kwargs: Any) -> None:
+    _task_started[task_id] = time.perf_counter()
+
+
+@task_postrun.connect
+def _on_task_postrun(task_id: str = None, task=None, state: Optional[str] = None, **kwargs: Any) -> None:
+    started = _task_started.pop(task_id, None)
+    if started is None or task is None:
+        return
+    CELERY_TASK_DURATION.labels(task.name).observe(time.perf_counter() - started)
+    CELERY_TASKS.labels(task.name, state or "UNKNOWN").inc()
+
+
+@worker_ready.connect
+def _start_worker_metrics_server(**kwargs: Any) -> None:
+    """워커 메인 프로세스에서 지표 HTTP 서버 시작 (CELERY_METRICS_PORT가 0이면 비활성화)"""
+    if not settings.CELERY_METRICS_PORT:
+        return
+
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        MultiProcessCollector(registry)
+        start_http_server(settings.CELERY_METRICS_PORT, registry=registry)
+    else:
+        start_http_server(settings.CELERY_METRICS_PORT)
+    logger.info("celery metrics server listening on :%s", settings.CELERY_METRICS_PORT)
@@ -0,0 +1,82 @@
+"""
+Keyset(커서) 페이지네이션
+
+정렬 키(예: generated_at, id)의 마지막 값을 불투명한 커서 문자열로 인코딩합니다.
+다음 페이지는 OFFSET 대신 (정렬 키) < (커서 값) 조건으로 조회하므로
+페이지 깊이와 관계없이 인덱스 범위 스캔 한 번으로 처리됩니다.
+"""
+
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Any, List, Optional, Sequence, Tuple, Type
+
+from fastapi import HTTPException
+from sqlalchemy import Select, tuple_
+
+
+def encode_cursor(*values: Any) -> str:
+    """정렬 키 값을 커서 문자열로 인코딩"""
+    raw = json.dumps(
+        [value.isoformat() if isinstance(value, date) else value for value in values],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: Type) -> Tuple[Any, ...]:
+    """
+    커서 문자열을 정렬 키 값으로 디코딩
+
+    Args:
+        cursor: encode_cursor()로 생성한 커서
+        types: 각 값의 타입 (datetime, date, int, str)
+
+    Raises:
+        HTTPException(400): 잘못된 커서
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("cursor arity mismatch")
+        return tuple(
+            value_type.fromisoformat(value) if value_type in (datetime, date) else value_type(value)
+            for value, value_type in zip(values, types)
+        )
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def keyset_page(
+    query: Select,
+    columns: Sequence,
+    cursor: Optional[str],
+    types: Sequence[Type],
+    limit: int,
+) -> Select:
+    """
+    내림차순 keyset 페이지 쿼리 구성
+
+    다음 페이지 존재 여부를 판단하기 위해 limit + 1개를 조회합니다.
+    """
+    if cursor:
+        values = decode_cursor(cursor, *types)
+        query = query.where(tuple_(*columns) < tuple_(*values))
+    return query.order_by(*(column.desc() for column in columns)).limit(limit + 1)
+
+
+def split_page(rows: List, limit: int, key) -> Tuple[List, Optional[str]]:
+    """
+    limit + 1개 조회 결과를 현재 페이지와 다음 커서로 분리
+
+    Args:
+        rows: keyset_page() 쿼리 결과
+        limit: 페이지 크기
+        key: 행에서 정렬 키 값 튜플을 꺼내는 함수
+    """
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    return page, encode_cursor(*key(page[-1]))
@@ -0,0 +1,244 @@
+"""
+Request Stage Profiling
+
+요청 처리 단계(업스트림 조회, 지표 계산, DB 저장 등)별 소요 시간을 기록합니다.
+
+- StageProfilingMiddleware가 요청마다 StageTimer를 만들어 contextvar에 설정하고,
+  응답에 Server-Timing 헤더를 붙인 뒤 완료 시 구조화된 로그 한 줄을 남깁니다.
+- 코드 어디서든 stage()/track()으로 현재 요청의 타이머에 단계를 기록합니다 (요청 밖에서는 no-op).
+- instrument_engine()은 모든 SQL 실행 시간을 "db" 단계로 누적합니다.
+- PROFILE_SLOWEST_N > 0이면 PROFILE_SAMPLE_RATE 비율의 요청을 cProfile로 측정하여
+  가장 느린 N개의 통계를 PROFILE_DUMP_DIR에 .prof 파일로 남깁니다 (snakeviz 등으로 확인).
+"""
+
+import cProfile
+import heapq
+import logging
+import os
+import random
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Awaitable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+from sqlalchemy import event
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_current_timer: ContextVar[Optional["StageTimer"]] = ContextVar("stage_timer", default=None)
+
+_SERVER_TIMING_TOKEN = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+class StageTimer:
+    """단계별 소요 시간(ms) 기록기"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.stages: Dict[str, float] = {}
+        self.context: Dict[str, Any] = {}
+        self._started = time.perf_counter()
+
+    def _record(self, stage: str, started: float) -> None:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.stages[stage] = self.stages.get(stage, 0.0) + elapsed_ms
+
+    @contextmanager
+    def stage(self, stage: str) -> Iterator[None]:
+        """동기 블록의 소요 시간 기록"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._record(stage, started)
+
+    async def track(self, stage: str, awaitable: Awaitable[T]) -> T:
+        """awaitable의 소요 시간 기록 (asyncio.gather와 함께 사용 가능)"""
+        started = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            self._record(stage, started)
+
+    def annotate(self, **context: Any) -> None:
+        """로그 한 줄에 함께 남길 값 추가 (종목, 캐시 여부 등)"""
+        self.context.update(context)
+
+    @property
+    def total_ms(self) -> float:
+        return (time.perf_counter() - self._started) * 1000
+
+    def server_timing(self) -> str:
+        """Server-Timing 헤더 값 (단계별 + 응답 시작까지의 total)"""
+        metrics = [
+            f"{_SERVER_TIMING_TOKEN.sub('_', stage)};dur={ms:.1f}"
+            for stage, ms in self.stages.items()
+        ]
+        metrics.append(f"total;dur={self.total_ms:.1f}")
+        return ", ".join(metrics)
+
+    def log(self, **context: Any) -> None:
+        """단계별 소요 시간을 구조화된 로그 한 줄로 출력"""
+        context = {**self.context, **context}
+        logger.info(
+            "stage_timings name=%s total_ms=%.1f %s %s",
+            self.name,
+            self.total_ms,
+            " ".join(f"{key}={value}" for key, value in context.items()),
+            " ".join(f"{stage}_ms={ms:.1f}" for stage, ms in self.stages.items()),
+        )
+
+
+def current_timer() -> Optional[StageTimer]:
+    """현재 요청의 타이머 (요청 밖이면 None)"""
+    return _current_timer.get()
+
+
+def request_timer(name: str) -> StageTimer:
+    """현재 요청의 타이머, 없으면 새 타이머 (미들웨어 없이 호출되는 경우)"""
+    return _current_timer.get() or StageTimer(name)
+
+
+@contextmanager
+def use_timer(timer: StageTimer) -> Iterator[StageTimer]:
+    """블록 안에서 기록되는 단계를 주어진 타이머로 모음 (배치 항목별 타이머 등)"""
+    token = _current_timer.set(timer)
+    try:
+        yield timer
+    finally:
+        _current_timer.reset(token)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """현재 요청 타이머에 동기 블록 소요 시간 기록"""
+    timer = _current_timer.get()
+    if timer is None:
+        yield
+        return
+    with timer.stage(name):
+        yield
+
+
+async def track(name: str, awaitable: Awaitable[T]) -> T:
+    """현재 요청 타이머에 awaitable 소요 시간 기록"""
+    timer = _current_timer.get()
+    if timer is None:
+        return await awaitable
+    return await timer.track(name, awaitable)
+
+
+def instrument_engine(engine) -> None:
+    """SQL 실행 시간을 현재 요청 타이머의 "db" 단계로 누적 (AsyncEngine은 sync_engine 전달)"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("_query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["_query_started"].pop()
+        timer = _current_timer.get()
+        if timer is not None:
+            timer._record("db", started)
+
+
+class SlowRequestProfiler:
+    """
+    샘플링된 요청을 cProfile로 측정하고 가장 느린 N개만 파일로 보관
+
+    cProfile은 스레드 단위로 동작하므로 한 번에 한 요청만 측정하며,
+    측정 구간 동안 같은 이벤트 루프에서 실행된 다른 코루틴도 함께 기록됩니다.
+    """
+
+    def __init__(self, slowest_n: int, sample_rate: float, dump_dir: str):
+        self.slowest_n = slowest_n
+        self.sample_rate = sample_rate
+        self.dump_dir = dump_dir
+        self._active = False
+        self._slowest: List[Tuple[float, str]] = []
+
+    @property
+    def enabled(self) -> bool:
+        return self.slowest_n > 0
+
+    def start(self) -> Optional[cProfile.Profile]:
+        if not self.enabled or self._active or random.random() >= self.sample_rate:
+            return None
+        self._active = True
+        profile = cProfile.Profile()
+        profile.enable()
+        return profile
+
+    def finish(self, profile: cProfile.Profile, name: str, total_ms: float) -> None:
+        profile.disable()
+        self._active = False
+
+        if len(self._slowest) >= self.slowest_n and total_ms <= self._slowest[0][0]:
+            return
+
+        os.makedirs(self.dump_dir, exist_ok=True)
+        filename = os.path.join(
+            self.dump_dir,
+            f"{total_ms:09.1f}ms_{_SERVER_TIMING_TOKEN.sub('_', name)}_"
+            f"{datetime.now():%Y%m%dT%H%M%S%f}.prof",
+        )
+        profile.dump_stats(filename)
+
+        heapq.heappush(self._slowest, (total_ms, filename))
+        if len(self._slowest) > self.slowest_n:
+            _, evicted = heapq.heappop(self._slowest)
+            try:
+                os.remove(evicted)
+            except OSError:
+                pass
+
+
+slow_request_profiler = SlowRequestProfiler(
+    slowest_n=settings.PROFILE_SLOWEST_N,
+    sample_rate=settings.PROFILE_SAMPLE_RATE,
+    dump_dir=settings.PROFILE_DUMP_DIR,
+)
+
+
+class StageProfilingMiddleware:
+    """요청별 단계 타이머 설정, Server-Timing 헤더 추가, 완료 로그 (ASGI, 스트리밍 응답 지원)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timer = StageTimer(f"{scope['method']} {scope['path']}")
+        profile = slow_request_profiler.start()
+        status_code = 500
+
+        async def _send(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"server-timing", timer.server_timing().encode("latin-1"))
+                ]
+            await send(message)
+
+        try:
+            with use_timer(timer):
+                await self.app(scope, receive, _send)
+        finally:
+            # 라우팅 후에는 엔드포인트 함수명으로 기록 (경로 파라미터별로 흩어지지 않도록)
+            endpoint = scope.get("endpoint")
+            if endpoint is not None:
+                timer.name = endpoint.__name__
+            timer.log(status=status_code, path=scope["path"])
+            if profile is not None:
+                slow_request_profiler.finish(profile, timer.name, timer.total_ms)
@@ -0,0 +1,209 @@
+"""
+사용자별 비용 가중 요청 제한 (Redis 토큰 버킷)
+
+사용자마다 RATE_LIMIT_CAPACITY 토큰의 버킷을 두고 초당 RATE_LIMIT_REFILL_PER_SECOND씩 채웁니다.
+요청은 작업 비용만큼 토큰을 소비합니다. 저장된 결과 조회는 싸고, 업스트림 조회와 지표 계산이
+필요한 콜드 분석은 비쌉니다.
+
+- 토큰이 부족해도 RATE_LIMIT_MAX_WAIT_SECONDS 안에 채워지면 잠시 대기 후 처리합니다.
+- 그보다 오래 기다려야 하면 429와 Retry-After를 반환합니다.
+- 응답에는 X-RateLimit-Limit / X-RateLimit-Remaining / X-RateLimit-Reset 헤더를 붙입니다.
+
+    current_user: User = Depends(rate_limited(COST_CACHED_READ))
+    ...
+    await rate_limiter.charge(request, current_user.id, COST_COLD_SIGNAL)  # 콜드 경로 진입 시
+"""
+
+import asyncio
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from fastapi import Depends, Request
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.deps import get_current_user
+from app.core.redis import get_async_redis
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+# 요청 비용 (토큰)
+COST_CACHED_READ = 1  # 저장된 스냅샷/시그널 조회
+COST_COLD_SYMBOL = 5  # 가격 + VIX 조회 후 지표 계산 (종목 상세)
+COST_COLD_SIGNAL = 10  # 프로필 + F-Score + 가격 조회 후 지표/다중 타임프레임 분석 (시그널)
+
+_TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local now = tonumber(ARGV[4])
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+local allowed = 0
+local wait = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+else
+    wait = (cost - tokens) / rate
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000) + 1000)
+return {allowed, tostring(tokens), tostring(wait)}
+"""
+
+
+@dataclass
+class RateLimitState:
+    """버킷 상태 (응답 헤더 생성용)"""
+
+    limit: int
+    remaining: float
+    reset_seconds: float
+    retry_after: float = 0.0
+
+    def headers(self) -> dict:
+        headers = {
+            "X-RateLimit-Limit": str(self.limit),
+            "X-RateLimit-Remaining": str(int(self.remaining)),
+            "X-RateLimit-Reset": str(math.ceil(self.reset_seconds)),
+        }
+        if self.retry_after:
+            headers["Retry-After"] = str(math.ceil(self.retry_after))
+        return headers
+
+
+class RateLimitExceeded(Exception):
+    """토큰 부족 (대기 한도 초과)"""
+
+    def __init__(self, state: RateLimitState):
+        super().__init__(f"Rate limit exceeded, retry after {math.ceil(state.retry_after)}s")
+        self.state = state
+
+
+class RateLimiter:
+    """
+    Redis 토큰 버킷 기반 요청 제한기
+
+    Args:
+        capacity: 버킷 크기 (최대 버스트 비용)
+        refill_per_second: 초당 충전 토큰 수
+        max_wait_seconds: 토큰 부족 시 대기할 최대 시간 (초과 시 거절)
+    """
+
+    def __init__(self, capacity: int, refill_per_second: float, max_wait_seconds: float):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.max_wait_seconds = max_wait_seconds
+        self._script = None
+
+    @staticmethod
+    def bucket_key(user_id) -> str:
+        return f"ratelimit:user:{user_id}"
+
+    def _state(self, tokens: float, retry_after: float = 0.0) -> RateLimitState:
+        return RateLimitState(
+            limit=self.capacity,
+            remaining=tokens,
+            reset_seconds=(self.capacity - tokens) / self.refill_per_second,
+            retry_after=retry_after,
+        )
+
+    async def _take(self, key: str, cost: int) -> tuple[bool, float, float]:
+        if self._script is None:
+            self._script = get_async_redis().register_script(_TOKEN_BUCKET_SCRIPT)
+        allowed, tokens, wait = await self._script(
+            keys=[key],
+            args=[self.capacity, self.refill_per_second, cost, time.time()],
+        )
+        return bool(allowed), float(tokens), float(wait)
+
+    async def acquire(self, user_id, cost: int) -> Optional[RateLimitState]:
+        """
+        cost만큼 토큰 소비 (부족하면 대기 한도 내에서 기다린 후 재시도)
+
+        Returns:
+            소비 후 버킷 상태 (비활성화 또는 Redis 사용 불가 시 None — 제한 없이 통과)
+
+        Raises:
+            RateLimitExceeded: 대기 한도 안에 토큰이 채워지지 않음
+        """
+        if not settings.RATE_LIMIT_ENABLED:
+            return None
+
+        key = self.bucket_key(user_id)
+        deadline = time.monotonic() + self.max_wait_seconds
+        while True:
+            try:
+                allowed, tokens, wait = await self._take(key, cost)
+            except RedisError as e:
+                logger.warning("rate limiter unavailable for user_id=%s: %s", user_id, e)
+                return None
+
+            if allowed:
+                return self._state(tokens)
+            if cost > self.capacity or time.monotonic() + wait > deadline:
+                raise RateLimitExceeded(self._state(tokens, retry_after=wait))
+            await asyncio.sleep(wait)
+
+    async def charge(self, request: Request, user_id, cost: int) -> None:
+        """토큰 소비 후 응답 헤더용 상태를 request.state에 기록"""
+        state = await self.acquire(user_id, cost)
+        if state is not None:
+            request.state.rate_limit = state
+
+
+def rate_limited(cost: int = COST_CACHED_READ):
+    """인증 + 기본 비용 차감 의존성 (get_current_user 대신 사용)"""
+
+    async def _dependency(
+        request: Request, current_user: User = Depends(get_current_user)
+    ) -> User:
+        await rate_limiter.charge(request, current_user.id, cost)
+        return current_user
+
+    return _dependency
+
+
+class RateLimitHeadersMiddleware:
+    """request.state.rate_limit이 있으면 응답에 X-RateLimit-* 헤더 추가 (ASGI, 스트리밍 응답 지원)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def _send(message):
+            if message["type"] == "http.response.start":
+                state = scope.get("state", {}).get("rate_limit")
+                headers = list(message.get("headers", []))
+                # 429 응답은 예외 처리기가 이미 헤더를 설정함
+                if state is not None and not any(
+                    name == b"x-ratelimit-limit" for name, _ in headers
+                ):
+                    message["headers"] = headers + [
+                        (name.lower().encode("latin-1"), value.encode("latin-1"))
+                        for name, value in state.headers().items()
+                    ]
+            await send(message)
+
+        await self.app(scope, receive, _send)
+
+
+rate_limiter = RateLimiter(
+    capacity=settings.RATE_LIMIT_CAPACITY,
+    refill_per_second=settings.RATE_LIMIT_REFILL_PER_SECOND,
+    max_wait_seconds=settings.RATE_LIMIT_MAX_WAIT_SECONDS,
+)
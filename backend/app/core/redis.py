@@ -0,0 +1,30 @@
+"""
+Redis 클라이언트 (지연 생성)
+
+- get_redis(): 동기 클라이언트 (Celery 태스크용)
+- get_async_redis(): 비동기 클라이언트 (FastAPI 엔드포인트용)
+"""
+
+from typing import Optional
+
+import redis
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+
+_redis: Optional[redis.Redis] = None
+_async_redis: Optional[aioredis.Redis] = None
+
+
+def get_redis() -> redis.Redis:
+    global _redis
+    if _redis is None:
+        _redis = redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _redis
+
+
+def get_async_redis() -> aioredis.Redis:
+    global _async_redis
+    if _async_redis is None:
+        _async_redis = aioredis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _async_redis
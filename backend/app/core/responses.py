@@ -0,0 +1,54 @@
+"""
+JSON 응답 직렬화 (orjson)
+
+- dumps(): numpy/Decimal/날짜 값을 포함한 응답 데이터를 UTF-8 JSON 바이트로 직렬화
+- FastJSONResponse: 앱 기본 응답 클래스
+- json_bytes_response(): 이미 직렬화된 JSON 바이트를 그대로 반환 (jsonable_encoder 생략)
+"""
+
+from decimal import Decimal
+from typing import Any, Optional
+
+import orjson
+from fastapi import Response
+from fastapi.responses import JSONResponse
+
+from app.core.profiling import stage
+
+# NaN/Inf는 null로 직렬화됨 (orjson 기본 동작)
+JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if hasattr(value, "item"):
+        # numpy 스칼라 (bool_ 등 OPT_SERIALIZE_NUMPY가 처리하지 않는 타입)
+        return value.item()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """응답 데이터를 JSON 바이트로 직렬화"""
+    return orjson.dumps(content, default=_default, option=JSON_OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson 기반 JSON 응답"""
+
+    def render(self, content: Any) -> bytes:
+        with stage("serialize"):
+            return dumps(content)
+
+
+def json_bytes_response(
+    body: bytes, status_code: int = 200, headers: Optional[dict] = None
+) -> Response:
+    """미리 직렬화된 JSON 바이트 응답"""
+    return Response(
+        content=body, status_code=status_code, headers=headers, media_type="application/json"
+    )
@@ -1,14 +1,35 @@
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
+from app.core.executor import ExecutorSaturatedError, analytics_executor
+from app.core.metrics import (
+    MetricsMiddleware,
+    register_api_collectors,
+    render_metrics,
+    require_metrics_token,
+)
+from app.core.profiling import StageProfilingMiddleware, instrument_engine
+from app.core.rate_limit import RateLimitExceeded, RateLimitHeadersMiddleware
+from app.core.responses import FastJSONResponse
+from app.db.session import async_engine, get_async_db
 from app.api.v1 import api_router
 
 app = FastAPI(
     title="Market State Analysis API",
     version="2.0.0",
     description="시장 상태 분석 시스템 API",
+    default_response_class=FastJSONResponse,
 )
 
+# 큰 응답(시그널 분석, 관심 종목 목록)만 압축 (Accept-Encoding: gzip 협상)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# 요청 제한 상태 헤더 (X-RateLimit-*)
+app.add_middleware(RateLimitHeadersMiddleware)
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -18,6 +39,40 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청별 단계 소요 시간 (Server-Timing 헤더 + 로그), 가장 바깥에서 측정
+app.add_middleware(StageProfilingMiddleware)
+instrument_engine(async_engine.sync_engine)
+
+# 라우트별 요청 처리 시간 히스토그램 (Prometheus, GET /metrics)
+app.add_middleware(MetricsMiddleware)
+register_api_collectors()
+
+@app.exception_handler(ExecutorSaturatedError)
+async def executor_saturated_handler(request: Request, exc: ExecutorSaturatedError):
+    """분석 워커 풀 포화 시 503 반환 (클라이언트 재시도 유도)"""
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Analysis capacity exhausted, please retry shortly"},
+        headers={"Retry-After": "5"},
+    )
+
+
+@app.exception_handler(RateLimitExceeded)
+async def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded):
+    """요청 제한 초과 시 429 반환 (Retry-After 포함)"""
+    return JSONResponse(
+        status_code=429,
+        content={"detail": str(exc)},
+        headers=exc.state.headers(),
+    )
+
+
+@app.on_event("shutdown")
+async def shutdown_resources():
+    analytics_executor.shutdown()
+    await async_engine.dispose()
+
+
 # API Router 등록
 app.include_router(api_router, prefix="/api/v1")
 
@@ -30,3 +85,10 @@ async def root():
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
+
+
+@app.get("/metrics", include_in_schema=False, dependencies=[Depends(require_metrics_token)])
+async def metrics(db: AsyncSession = Depends(get_async_db)):
+    """Prometheus 지표 (요청 지연, 업스트림, 캐시, Celery 대기열, 종목 갱신 지연, DB 풀)"""
+    body, content_type = await render_metrics(db)
+    return Response(content=body, media_type=content_type)
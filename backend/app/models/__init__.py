@@ -8,6 +8,8 @@ from app.models.analysis_history import AnalysisHistory
 from app.models.data_update_log import DataUpdateLog
 from app.models.fundamental_score import FundamentalScore
 from app.models.trading_signal import TradingSignal
+from app.models.symbol_latest_snapshot import SymbolLatestSnapshot
+from app.models.price_bar import PriceBar
 
 __all__ = [
     "User",
@@ -20,4 +22,6 @@ __all__ = [
     "DataUpdateLog",
     "FundamentalScore",
     "TradingSignal",
+    "SymbolLatestSnapshot",
+    "PriceBar",
 ]
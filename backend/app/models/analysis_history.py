@@ -1,25 +1,26 @@
-from sqlalchemy import Column, Integer, ForeignKey, Date, Text, DateTime, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, Integer, ForeignKey, Date, Boolean, LargeBinary, DateTime
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.db.base_class import Base
 
 
 class AnalysisHistory(Base):
+    """
+    종목별 일간 분석 이력 (사용자 간 공유)
+
+    payload는 키프레임이면 전체 분석 상태, 아니면 전날 대비 변경분입니다.
+    인코딩/복원은 app.services.analysis_history 참고.
+    """
+
     __tablename__ = "analysis_history"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    symbol_id = Column(Integer, ForeignKey("symbols.id", ondelete="CASCADE"), nullable=False)
-    analysis_date = Column(Date, nullable=False)
+    symbol_id = Column(Integer, ForeignKey("symbols.id", ondelete="CASCADE"), primary_key=True)
+    analysis_date = Column(Date, primary_key=True)
 
-    # Analysis Results
-    market_state_snapshot = Column(JSON, nullable=True)
-    indicators_snapshot = Column(JSON, nullable=True)
-    recommendations = Column(Text, nullable=True)
+    is_keyframe = Column(Boolean, nullable=False)
+    payload = Column(LargeBinary, nullable=False)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationships
-    user = relationship("User")
     symbol = relationship("Symbol")
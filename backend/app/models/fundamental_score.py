@@ -9,9 +9,10 @@ class FundamentalScore(Base):
 
     __tablename__ = "fundamental_scores"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     symbol_id = Column(Integer, ForeignKey("symbols.id"), nullable=False)
-    date = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    # 월 단위 파티션 키 (app.services.partitions)
+    date = Column(DateTime, default=datetime.utcnow, primary_key=True, index=True)
 
     # Piotroski F-Score
     f_score = Column(Integer, nullable=False)  # 0-9점
@@ -37,5 +38,12 @@ class FundamentalScore(Base):
     # Relationships
     symbol = relationship("Symbol", back_populates="fundamental_scores")
     trading_signals = relationship(
-        "TradingSignal", back_populates="fundamental_score", cascade="all, delete-orphan"
+        "TradingSignal",
+        primaryjoin="FundamentalScore.id == foreign(TradingSignal.fundamental_score_id)",
+        back_populates="fundamental_score",
+        cascade="all, delete-orphan",
+    )
+
+    __table_args__ = (
+        {"postgresql_partition_by": "RANGE (date)"},
     )
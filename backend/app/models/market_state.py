@@ -6,9 +6,9 @@ from app.db.base_class import Base
 class MarketState(Base):
     __tablename__ = "market_states"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     symbol_id = Column(Integer, ForeignKey("symbols.id", ondelete="CASCADE"), nullable=False)
-    date = Column(Date, nullable=False)
+    date = Column(Date, primary_key=True)  # 월 단위 파티션 키 (app.services.partitions)
 
     # Market State Classification
     trend_type = Column(String, nullable=False)  # 'uptrend', 'downtrend', 'range'
@@ -25,4 +25,5 @@ class MarketState(Base):
     # Unique constraint on symbol_id and date
     __table_args__ = (
         Index('idx_market_state_symbol_date', 'symbol_id', 'date', unique=True),
+        {"postgresql_partition_by": "RANGE (date)"},
     )
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer, ForeignKey, Date, Float, BigInteger
+from app.db.base_class import Base
+
+
+class PriceBar(Base):
+    """일봉 가격 데이터 (차트 시계열 조회용)"""
+
+    __tablename__ = "price_bars"
+
+    symbol_id = Column(Integer, ForeignKey("symbols.id", ondelete="CASCADE"), primary_key=True)
+    date = Column(Date, primary_key=True)
+
+    open = Column(Float, nullable=False)
+    high = Column(Float, nullable=False)
+    low = Column(Float, nullable=False)
+    close = Column(Float, nullable=False)
+    volume = Column(BigInteger, nullable=True)
@@ -0,0 +1,64 @@
+from sqlalchemy import Column, Integer, ForeignKey, Date, DateTime, String, Float, Index
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+from app.db.base_class import Base
+
+
+class SymbolLatestSnapshot(Base):
+    """종목별 최신 상태 스냅샷 (목록/대시보드 조회용 비정규화 테이블, 종목당 1행)"""
+
+    __tablename__ = "symbol_latest_snapshot"
+
+    symbol_id = Column(Integer, ForeignKey("symbols.id", ondelete="CASCADE"), primary_key=True)
+
+    # 최신 종가
+    close = Column(Float, nullable=True)
+
+    # 최신 기술적 지표
+    indicator_date = Column(Date, nullable=True)
+    indicators_updated_at = Column(DateTime(timezone=True), nullable=True)  # 지표를 계산한 시각
+    atr = Column(Float, nullable=True)
+    atr_ratio = Column(Float, nullable=True)
+    bb_upper = Column(Float, nullable=True)
+    bb_middle = Column(Float, nullable=True)
+    bb_lower = Column(Float, nullable=True)
+    bb_width = Column(Float, nullable=True)
+    bb_width_ratio = Column(Float, nullable=True)
+    adx = Column(Float, nullable=True)
+    plus_di = Column(Float, nullable=True)
+    minus_di = Column(Float, nullable=True)
+    std_dev = Column(Float, nullable=True)
+    vix = Column(Float, nullable=True)
+
+    # 최신 시장 상태
+    market_state_date = Column(Date, nullable=True)
+    trend_type = Column(String, nullable=True)
+    volatility_level = Column(String, nullable=True)
+    risk_level = Column(String, nullable=True)
+    recommended_strategy = Column(String, nullable=True)
+    position_sizing_ratio = Column(Float, nullable=True)
+
+    # 최신 F-Score
+    f_score = Column(Integer, nullable=True)
+    f_score_max = Column(Integer, nullable=True)
+    f_score_calculated_at = Column(DateTime, nullable=True)
+
+    # 최신 매매 시그널
+    signal_id = Column(Integer, nullable=True)
+    signal_type = Column(String(20), nullable=True)
+    signal_strength = Column(String(20), nullable=True)
+    signal_price = Column(Float, nullable=True)
+    signal_risk_level = Column(String(20), nullable=True)
+    signal_generated_at = Column(DateTime, nullable=True)
+    signal_bar_date = Column(Date, nullable=True)  # 시그널 생성에 사용된 최신 일봉 날짜
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    # Relationships
+    symbol = relationship("Symbol")
+
+    __table_args__ = (
+        # keyset 페이지네이션 정렬 키
+        Index('idx_snapshot_signal_generated', 'signal_generated_at', 'symbol_id'),
+        Index('idx_snapshot_updated', 'updated_at', 'symbol_id'),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, Date, Numeric, Index
+from sqlalchemy import Column, Integer, BigInteger, ForeignKey, Date, Float, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.db.base_class import Base
@@ -7,31 +7,34 @@ from app.db.base_class import Base
 class TechnicalIndicator(Base):
     __tablename__ = "technical_indicators"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     symbol_id = Column(Integer, ForeignKey("symbols.id", ondelete="CASCADE"), nullable=False)
-    date = Column(Date, nullable=False)
+    date = Column(Date, primary_key=True)  # 월 단위 파티션 키 (app.services.partitions)
 
     # ATR (Average True Range)
-    atr = Column(Numeric(10, 4))
-    atr_ratio = Column(Numeric(10, 6))  # ATR / Price
+    atr = Column(Float)
+    atr_ratio = Column(Float)  # ATR / Price
 
     # Bollinger Bands
-    bb_upper = Column(Numeric(10, 4))
-    bb_middle = Column(Numeric(10, 4))
-    bb_lower = Column(Numeric(10, 4))
-    bb_width = Column(Numeric(10, 4))
-    bb_width_ratio = Column(Numeric(10, 6))  # BB Width / Price
+    bb_upper = Column(Float)
+    bb_middle = Column(Float)
+    bb_lower = Column(Float)
+    bb_width = Column(Float)
+    bb_width_ratio = Column(Float)  # BB Width / Price
 
     # ADX (Average Directional Index)
-    adx = Column(Numeric(10, 4))
-    plus_di = Column(Numeric(10, 4))
-    minus_di = Column(Numeric(10, 4))
+    adx = Column(Float)
+    plus_di = Column(Float)
+    minus_di = Column(Float)
 
     # VIX (for market-wide volatility)
-    vix = Column(Numeric(10, 4), nullable=True)
+    vix = Column(Float, nullable=True)
 
     # Standard Deviation
-    std_dev = Column(Numeric(10, 4))
+    std_dev = Column(Float)
+
+    # 지표 값 내용 해시 (같은 값이면 갱신 생략)
+    content_hash = Column(BigInteger, nullable=True)
 
     # Relationships
     symbol = relationship("Symbol")
@@ -39,4 +42,5 @@ class TechnicalIndicator(Base):
     # Unique constraint on symbol_id and date
     __table_args__ = (
         Index('idx_symbol_date', 'symbol_id', 'date', unique=True),
+        {"postgresql_partition_by": "RANGE (date)"},
     )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, Date, String, Numeric, Text, DateTime
+from sqlalchemy import Column, Integer, ForeignKey, Date, String, Numeric, Text, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -34,3 +34,8 @@ class Trade(Base):
     # Relationships
     user = relationship("User")
     symbol = relationship("Symbol")
+
+    __table_args__ = (
+        # 사용자별 매매 기록 keyset 페이지네이션 / 포트폴리오 분석 조회
+        Index('idx_trade_user_entry', 'user_id', 'entry_date', 'id'),
+    )
@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, JSON, Boolean
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, JSON, Boolean, Index, LargeBinary
+from sqlalchemy.orm import deferred, relationship
 from datetime import datetime
 from app.db.base_class import Base
 
@@ -9,12 +9,12 @@ class TradingSignal(Base):
 
     __tablename__ = "trading_signals"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     symbol_id = Column(Integer, ForeignKey("symbols.id"), nullable=False)
-    fundamental_score_id = Column(
-        Integer, ForeignKey("fundamental_scores.id"), nullable=True
-    )
-    date = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    # fundamental_scores는 파티션 테이블이라 id 단독 외래 키를 둘 수 없음 (보존 기한이 같아 함께 정리됨)
+    fundamental_score_id = Column(Integer, nullable=True)
+    # 월 단위 파티션 키 (app.services.partitions)
+    date = Column(DateTime, default=datetime.utcnow, primary_key=True, index=True)
 
     # 시그널 정보
     signal_type = Column(
@@ -42,6 +42,9 @@ class TradingSignal(Base):
     # 다중 타임프레임 분석
     timeframe_analysis = Column(JSON, nullable=True)  # 타임프레임 정렬 상태, 거래 적합성, 진입점 분석
 
+    # 직렬화된 API 응답 (GET /signals/{symbol}에서 그대로 반환, 목록 조회 시에는 로드하지 않음)
+    response_json = deferred(Column(LargeBinary, nullable=True))
+
     # 시그널 활성화 여부
     is_active = Column(Boolean, default=True, nullable=False)
 
@@ -49,4 +52,14 @@ class TradingSignal(Base):
 
     # Relationships
     symbol = relationship("Symbol", back_populates="trading_signals")
-    fundamental_score = relationship("FundamentalScore", back_populates="trading_signals")
+    fundamental_score = relationship(
+        "FundamentalScore",
+        primaryjoin="foreign(TradingSignal.fundamental_score_id) == FundamentalScore.id",
+        back_populates="trading_signals",
+    )
+
+    __table_args__ = (
+        # 종목별 이력 keyset 페이지네이션 (generated_at, id)
+        Index('idx_trading_signal_symbol_generated', 'symbol_id', 'generated_at', 'id'),
+        {"postgresql_partition_by": "RANGE (date)"},
+    )
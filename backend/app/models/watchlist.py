@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -16,3 +16,7 @@ class Watchlist(Base):
     # Relationships
     user = relationship("User")
     symbol = relationship("Symbol")
+
+    __table_args__ = (
+        Index('idx_watchlist_user_created', 'user_id', 'created_at'),
+    )
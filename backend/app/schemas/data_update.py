@@ -0,0 +1,28 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+
+class DataUpdateRequest(BaseModel):
+    """수동 데이터 갱신 요청 (symbols 생략 시 사용자의 관심 종목 전체)"""
+    symbols: Optional[List[str]] = Field(None, min_length=1, max_length=200)
+
+
+class DataUpdateProgress(BaseModel):
+    """갱신 작업 진행률"""
+    job_id: str
+    status: str  # running, completed, stalled
+    total: int
+    queued: int  # 이 요청으로 새로 예약한 종목 수
+    deduplicated: int  # 이미 진행 중이던 갱신을 기다리는 종목 수
+    done: int
+    failed: int
+    remaining: int
+    elapsed_seconds: float
+    throughput_per_second: Optional[float] = None
+    eta_seconds: Optional[float] = None
+    started_at: float
+    finished_at: Optional[float] = None
+
+
+class DataUpdateResponse(DataUpdateProgress):
+    not_found: List[str] = []
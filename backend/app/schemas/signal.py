@@ -0,0 +1,7 @@
+from pydantic import BaseModel, Field
+from typing import List
+
+
+class SignalBatchRequest(BaseModel):
+    """여러 종목의 매매 시그널 일괄 요청"""
+    symbols: List[str] = Field(..., min_length=1, max_length=200)
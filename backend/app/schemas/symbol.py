@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from datetime import date, datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 
 class SymbolBase(BaseModel):
@@ -21,6 +21,12 @@ class SymbolResponse(SymbolBase):
         from_attributes = True
 
 
+class SymbolListResponse(BaseModel):
+    """종목 목록 응답 (keyset 페이지네이션)"""
+    items: List[SymbolResponse]
+    next_cursor: Optional[str] = None
+
+
 class TechnicalIndicatorResponse(BaseModel):
     """기술적 지표 응답"""
     date: date
@@ -54,12 +60,22 @@ class MarketStateResponse(BaseModel):
         from_attributes = True
 
 
+class FreshnessInfo(BaseModel):
+    """응답 데이터의 신선도 정보"""
+    source: str  # snapshot (저장된 결과), live (즉시 계산)
+    as_of: Optional[date] = None  # 최신 일봉 날짜
+    updated_at: Optional[datetime] = None
+    is_stale: bool = False
+    refresh_enqueued: bool = False
+
+
 class SymbolDetailResponse(BaseModel):
     """심볼 상세 정보 (지표 + 시장 상태 포함)"""
     symbol: SymbolResponse
     current_price: Optional[float] = None
     latest_indicator: Optional[TechnicalIndicatorResponse] = None
     latest_market_state: Optional[MarketStateResponse] = None
+    freshness: Optional[FreshnessInfo] = None
 
     class Config:
         from_attributes = True
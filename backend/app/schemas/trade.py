@@ -0,0 +1,48 @@
+from pydantic import BaseModel, Field, UUID4
+from datetime import date, datetime
+from typing import List, Literal, Optional
+
+
+class TradeBase(BaseModel):
+    symbol_id: int
+    trade_type: Literal["buy", "sell"]  # buy: 롱, sell: 숏
+    entry_date: date
+    entry_price: float = Field(..., gt=0)
+    quantity: int = Field(..., gt=0)
+    exit_date: Optional[date] = None
+    exit_price: Optional[float] = Field(None, gt=0)
+    strategy_used: Optional[str] = None
+    notes: Optional[str] = None
+
+
+class TradeCreate(TradeBase):
+    pass
+
+
+class TradeUpdate(BaseModel):
+    trade_type: Optional[Literal["buy", "sell"]] = None
+    entry_date: Optional[date] = None
+    entry_price: Optional[float] = Field(None, gt=0)
+    quantity: Optional[int] = Field(None, gt=0)
+    exit_date: Optional[date] = None
+    exit_price: Optional[float] = Field(None, gt=0)
+    strategy_used: Optional[str] = None
+    notes: Optional[str] = None
+
+
+class TradeResponse(TradeBase):
+    id: int
+    user_id: UUID4
+    symbol: str
+    profit_loss: Optional[float] = None
+    profit_loss_percent: Optional[float] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class TradeListResponse(BaseModel):
+    """매매 기록 목록 응답 (keyset 페이지네이션)"""
+    items: List[TradeResponse]
+    next_cursor: Optional[str] = None
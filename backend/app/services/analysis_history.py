@@ -0,0 +1,233 @@
+"""
+Analysis History Service
+
+종목별 일간 분석 결과(지표 + 시장 상태)를 analysis_history 테이블에 저장하고 기간 조회 시 복원합니다.
+분석 결과는 사용자와 무관하므로 (symbol_id, analysis_date)당 한 행만 저장합니다.
+
+저장 형식:
+- 키프레임: 전체 필드 값
+- 델타: 전날 대비 바뀐 필드 값만 (시장 상태 분류처럼 며칠씩 유지되는 값은 생략됨)
+- payload: orjson 직렬화 후 필드명 사전(zdict)으로 zlib 압축한 바이너리
+
+KEYFRAME_INTERVAL 행마다 키프레임을 두어, 임의 날짜 복원 시 읽는 행 수를 제한합니다.
+
+    rows = db.execute(history_chain_query(symbol_id, day)).all()
+    stmt = history_upsert(symbol_id, day, analysis_state(indicators, market_state), rows)
+    if stmt is not None:
+        db.execute(stmt)
+"""
+
+import zlib
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import orjson
+from sqlalchemy import Select, func, select
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlalchemy.orm import aliased
+
+from app.models.analysis_history import AnalysisHistory
+from app.services.snapshot import INDICATOR_FIELDS
+
+MARKET_STATE_FIELDS = (
+    "trend_type",
+    "volatility_level",
+    "risk_level",
+    "recommended_strategy",
+    "position_sizing_ratio",
+)
+
+# 저장 필드 (순서는 압축 사전에도 사용되므로 변경 시 기존 payload를 읽을 수 없음)
+ANALYSIS_FIELDS = INDICATOR_FIELDS + ("close", "vix") + MARKET_STATE_FIELDS
+
+# 키프레임 간격 (행 수)
+KEYFRAME_INTERVAL = 30
+
+# 이력 payload에 저장할 float 반올림 자릿수 (델타 인코딩 시 부동소수점 잡음 제거)
+FLOAT_DIGITS = 6
+
+_ZDICT = orjson.dumps({field: None for field in ANALYSIS_FIELDS})
+
+
+def analysis_state(indicators: Dict[str, Any], market_state: Dict[str, Any]) -> Dict[str, Any]:
+    """스냅샷 컬럼 값(indicator_values, market_state_values)에서 저장할 분석 상태 추출"""
+    merged = {**indicators, **market_state}
+    return {
+        field: round(value, FLOAT_DIGITS) if isinstance(value, float) else value
+        for field, value in ((field, merged.get(field)) for field in ANALYSIS_FIELDS)
+    }
+
+
+def encode_payload(values: Dict[str, Any]) -> bytes:
+    compressor = zlib.compressobj(level=9, zdict=_ZDICT)
+    return compressor.compress(orjson.dumps(values)) + compressor.flush()
+
+
+def decode_payload(payload: bytes) -> Dict[str, Any]:
+    decompressor = zlib.decompressobj(zdict=_ZDICT)
+    return orjson.loads(decompressor.decompress(payload) + decompressor.flush())
+
+
+def delta(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    """전날 상태 대비 바뀐 필드만 추출"""
+    return {
+        field: value
+        for field, value in current.items()
+        if field not in previous or previous[field] != value
+    }
+
+
+def replay(rows: Sequence[Tuple[date, bool, bytes]]) -> List[Tuple[date, Dict[str, Any]]]:
+    """
+    (analysis_date, is_keyframe, payload) 행(날짜순)을 날짜별 전체 상태로 복원
+
+    첫 행이 키프레임이 아니면 그 앞의 키프레임까지 포함해 조회해야 합니다.
+    """
+    states: List[Tuple[date, Dict[str, Any]]] = []
+    state: Dict[str, Any] = {}
+    for analysis_date, is_keyframe, payload in rows:
+        values = decode_payload(payload)
+        state = values if is_keyframe else {**state, **values}
+        states.append((analysis_date, state))
+    return states
+
+
+def _keyframe_floor(symbol_id, day: date, inclusive: bool):
+    """
+    day 이전(inclusive면 day 포함) 가장 최근 키프레임 날짜 (없으면 day)
+
+    symbol_id에 AnalysisHistory.symbol_id를 주면 바깥 쿼리 행의 종목 기준 상관 서브쿼리가 됩니다.
+    """
+    keyframes = aliased(AnalysisHistory)
+    condition = keyframes.analysis_date <= day if inclusive else keyframes.analysis_date < day
+    latest_keyframe = (
+        select(func.max(keyframes.analysis_date))
+        .where(
+            keyframes.symbol_id == symbol_id,
+            keyframes.is_keyframe.is_(True),
+            condition,
+        )
+        .scalar_subquery()
+    )
+    return func.coalesce(latest_keyframe, day)
+
+
+def history_chain_query(symbol_id: int, day: date) -> Select:
+    """day 저장에 필요한 행 조회 (day 이전 마지막 키프레임부터 이후 전체)"""
+    return (
+        select(AnalysisHistory.analysis_date, AnalysisHistory.is_keyframe, AnalysisHistory.payload)
+        .where(
+            AnalysisHistory.symbol_id == symbol_id,
+            AnalysisHistory.analysis_date >= _keyframe_floor(symbol_id, day, inclusive=False),
+        )
+        .order_by(AnalysisHistory.analysis_date)
+    )
+
+
+def history_chains_query(symbol_ids: Sequence[int], day: date) -> Select:
+    """여러 종목의 day 저장에 필요한 행을 한 번에 조회 (symbol_id, 날짜 순, 첫 컬럼이 symbol_id)"""
+    return (
+        select(
+            AnalysisHistory.symbol_id,
+            AnalysisHistory.analysis_date,
+            AnalysisHistory.is_keyframe,
+            AnalysisHistory.payload,
+        )
+        .where(
+            AnalysisHistory.symbol_id.in_(symbol_ids),
+            AnalysisHistory.analysis_date
+            >= _keyframe_floor(AnalysisHistory.symbol_id, day, inclusive=False),
+        )
+        .order_by(AnalysisHistory.symbol_id, AnalysisHistory.analysis_date)
+    )
+
+
+def history_range_query(symbol_id: int, from_date: date, to_date: date) -> Select:
+    """기간 복원에 필요한 행 조회 (from_date 이하 마지막 키프레임부터 to_date까지)"""
+    return (
+        select(AnalysisHistory.analysis_date, AnalysisHistory.is_keyframe, AnalysisHistory.payload)
+        .where(
+            AnalysisHistory.symbol_id == symbol_id,
+            AnalysisHistory.analysis_date >= _keyframe_floor(symbol_id, from_date, inclusive=True),
+            AnalysisHistory.analysis_date <= to_date,
+        )
+        .order_by(AnalysisHistory.analysis_date)
+    )
+
+
+def history_row(
+    symbol_id: int,
+    day: date,
+    state: Dict[str, Any],
+    chain_rows: Sequence[Tuple[date, bool, bytes]],
+) -> Optional[Dict[str, Any]]:
+    """
+    day의 분석 상태 행 생성
+
+    이후 날짜 행이 이미 있으면 그 행들의 델타 기준이 바뀌므로 저장하지 않습니다 (None).
+
+    Args:
+        chain_rows: (날짜, 키프레임 여부, payload) 행 — history_chain_query() 결과,
+            또는 history_chains_query() 결과를 종목별로 나누고 symbol_id를 뗀 행
+    """
+    if chain_rows and chain_rows[-1][0] > day:
+        return None
+
+    previous_rows = [row for row in chain_rows if row[0] < day]
+    is_keyframe = not previous_rows or len(previous_rows) >= KEYFRAME_INTERVAL
+    if is_keyframe:
+        values = state
+    else:
+        values = delta(replay(previous_rows)[-1][1], state)
+
+    return {
+        "symbol_id": symbol_id,
+        "analysis_date": day,
+        "is_keyframe": is_keyframe,
+        "payload": encode_payload(values),
+    }
+
+
+def history_upsert(
+    symbol_id: int,
+    day: date,
+    state: Dict[str, Any],
+    chain_rows: Sequence[Tuple[date, bool, bytes]],
+) -> Optional[Insert]:
+    """
+    day의 분석 상태 저장 구문 생성 (저장하지 않아야 하면 None, 같은 날 재분석은 덮어씀)
+
+    Args:
+        chain_rows: history_chain_query() 결과
+    """
+    row = history_row(symbol_id, day, state, chain_rows)
+    return history_rows_upsert([row]) if row is not None else None
+
+
+def history_rows_upsert(rows: Sequence[Dict[str, Any]]) -> Optional[Insert]:
+    """history_row() 결과 일괄 upsert 구문 (행이 없으면 None)"""
+    if not rows:
+        return None
+
+    stmt = insert(AnalysisHistory).values(list(rows))
+    return stmt.on_conflict_do_update(
+        index_elements=[AnalysisHistory.symbol_id, AnalysisHistory.analysis_date],
+        set_={
+            "is_keyframe": stmt.excluded.is_keyframe,
+            "payload": stmt.excluded.payload,
+            "created_at": func.now(),
+        },
+    )
+
+
+def history_columns(
+    rows: Sequence[Tuple[date, bool, bytes]],
+    from_date: date,
+    fields: Sequence[str] = ANALYSIS_FIELDS,
+) -> Dict[str, Any]:
+    """history_range_query() 결과를 열 단위 배열로 복원 (from_date 이전 행 제외)"""
+    states = [(day, state) for day, state in replay(rows) if day >= from_date]
+    return {
+        "date": [day.isoformat() for day, _ in states],
+        "values": {field: [state.get(field) for _, state in states] for field in fields},
+    }
@@ -0,0 +1,139 @@
+"""
+Analysis Store Service
+
+기술적 지표(technical_indicators)와 시장 상태(market_states)를 (symbol_id, date) 고유 인덱스 기준
+INSERT ... ON CONFLICT DO UPDATE로 일괄 저장하는 구문을 생성합니다.
+여러 종목/날짜의 행을 한 구문에 담으므로, 전체 종목 갱신도 종목 수와 관계없이 몇 번의 왕복으로 끝납니다.
+
+    for chunk in batched(rows):
+        db.execute(indicators_upsert(chunk))
+
+지표 값이 None(NaN)이면 기존 값을 유지합니다 (계산 구간이 짧아 일부 지표가 비는 경우).
+
+기술적 지표는 최신 행만이 아니라 계산 구간 전체(초기 수렴 구간 제외)를 저장합니다.
+수렴 구간을 제외한 값은 조회 시작일과 무관하게 같으므로,
+행마다 값의 content_hash를 함께 저장하고 해시가 같은 행은 갱신하지 않으면
+매 갱신에서 실제로 기록되는 행은 새 거래일과 값이 바뀐 날짜뿐입니다.
+갱신이 누락된 날짜나 새로 추가된 종목의 이력은 다음 갱신에서 추가 업스트림 조회 없이 채워집니다.
+"""
+
+from datetime import date
+from typing import Any, Dict, Iterator, List, Optional, Sequence, TypeVar
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import Insert, insert
+
+from app.models.market_state import MarketState
+from app.models.technical_indicator import TechnicalIndicator
+from app.services.snapshot import INDICATOR_FIELDS
+
+T = TypeVar("T")
+
+# 구문당 최대 행 수 (PostgreSQL 바인드 파라미터 한도 65535 이내로 유지)
+UPSERT_BATCH_ROWS = 1000
+
+INDICATOR_COLUMNS = INDICATOR_FIELDS + ("vix",)
+
+# 지표 계산용 가격 조회 기간 (일) - 업스트림 호출 수는 기간과 무관하게 종목당 1회
+PRICE_LOOKBACK_DAYS = 365
+
+# 계산 구간 앞부분에서 저장하지 않는 행 수 (약 250거래일 중 최근 약 130행만 저장)
+# ATR/ADX의 EWM(span=14)은 시작값의 영향이 행마다 약 13%씩 줄어들므로, 이 구간 이전 값은
+# 조회 시작일에 따라 달라져 매 갱신마다 해시가 바뀜 (120행 이후 상대 오차 1e-7 미만)
+INDICATOR_WARMUP_ROWS = 120
+
+# 내용 해시 계산 전 반올림 유효 자릿수 (수렴 오차/부동소수점 오차로 같은 행이 다시 기록되지 않도록)
+HASH_SIGNIFICANT_DIGITS = 5
+
+MARKET_STATE_COLUMNS = (
+    "trend_type",
+    "volatility_level",
+    "risk_level",
+    "recommended_strategy",
+    "position_sizing_ratio",
+)
+
+
+def batched(rows: Sequence[T], size: int = UPSERT_BATCH_ROWS) -> Iterator[Sequence[T]]:
+    """행 목록을 size개씩 나눔"""
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def indicator_rows(symbol_id: int, indicators_df, vix_by_date: Dict[str, float]) -> List[Dict[str, Any]]:
+    """
+    지표 데이터프레임의 수렴 구간 이후 전체 행으로부터 technical_indicators 행 생성 (CPU 연산)
+
+    Args:
+        symbol_id: Symbol ID
+        indicators_df: TechnicalIndicators.calculate_all_indicators() 결과 (날짜 오름차순)
+        vix_by_date: 날짜(YYYY-MM-DD) -> VIX 종가 (휴장일 등 빠진 날짜는 직전 값 사용)
+
+    Returns:
+        날짜 오름차순 행 목록 (가격 이력이 짧아도 최신 행은 항상 포함)
+    """
+    # 지표 계산 시에만 호출되므로 pandas/numpy는 여기서 import (API 기동 시간 단축)
+    import numpy as np
+    import pandas as pd
+
+    vix = indicators_df["date"].dt.strftime("%Y-%m-%d").map(vix_by_date).astype(float).ffill()
+    window = indicators_df.iloc[min(INDICATOR_WARMUP_ROWS, len(indicators_df) - 1):]
+
+    values = window[list(INDICATOR_FIELDS)].astype(float)
+    values["vix"] = vix.loc[window.index]
+    values = values.replace([np.inf, -np.inf], np.nan)
+
+    # 행별 내용 해시 (유효 자릿수로 반올림한 값 기준, uint64 -> PostgreSQL BIGINT 범위의 int64로 재해석)
+    magnitude = (10.0 ** np.floor(np.log10(values.abs().where(values != 0)))).fillna(1.0)
+    rounded = (values / magnitude).round(HASH_SIGNIFICANT_DIGITS - 1) * magnitude
+    hashes = pd.util.hash_pandas_object(rounded, index=False).to_numpy().view(np.int64)
+    records = values.astype(object).where(values.notna(), None).to_dict("records")
+
+    return [
+        {"symbol_id": symbol_id, "date": day.date(), **record, "content_hash": int(content_hash)}
+        for day, record, content_hash in zip(window["date"], records, hashes)
+    ]
+
+
+def market_state_row(symbol_id: int, state_date: date, classification: Dict[str, Any]) -> Dict[str, Any]:
+    """시장 상태 분류 결과로부터 market_states 행 생성"""
+    return {
+        "symbol_id": symbol_id,
+        "date": state_date,
+        **{column: classification[column] for column in MARKET_STATE_COLUMNS},
+    }
+
+
+def indicators_upsert(rows: Sequence[Dict[str, Any]]) -> Optional[Insert]:
+    """
+    technical_indicators 일괄 upsert 구문 (행이 없으면 None, None 값은 기존 값 유지)
+
+    content_hash가 저장된 값과 같은 행은 갱신하지 않습니다 (RETURNING에도 포함되지 않음).
+    """
+    if not rows:
+        return None
+
+    stmt = insert(TechnicalIndicator).values(list(rows))
+    return stmt.on_conflict_do_update(
+        index_elements=[TechnicalIndicator.symbol_id, TechnicalIndicator.date],
+        set_={
+            **{
+                column: func.coalesce(stmt.excluded[column], getattr(TechnicalIndicator, column))
+                for column in INDICATOR_COLUMNS
+            },
+            "content_hash": stmt.excluded.content_hash,
+        },
+        where=TechnicalIndicator.content_hash.is_distinct_from(stmt.excluded.content_hash),
+    )
+
+
+def market_states_upsert(rows: Sequence[Dict[str, Any]]) -> Optional[Insert]:
+    """market_states 일괄 upsert 구문 (행이 없으면 None)"""
+    if not rows:
+        return None
+
+    stmt = insert(MarketState).values(list(rows))
+    return stmt.on_conflict_do_update(
+        index_elements=[MarketState.symbol_id, MarketState.date],
+        set_={column: stmt.excluded[column] for column in MARKET_STATE_COLUMNS},
+    )
@@ -0,0 +1,95 @@
+"""
+Time-Series Downsampling Service
+
+차트용 시계열을 LTTB(Largest-Triangle-Three-Buckets)로 다운샘플링합니다.
+버킷마다 이전 선택점·다음 버킷 평균점과 이루는 삼각형 넓이가 가장 큰 점을 골라
+고점/저점 같은 시각적 형태를 유지하면서 점 개수를 줄입니다.
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    LTTB로 선택할 점의 인덱스 반환
+
+    Args:
+        x: 정렬된 x 값 (예: 날짜 ordinal)
+        y: y 값 (NaN은 선형 보간하여 선택 기준으로만 사용)
+        threshold: 반환할 최대 점 개수 (첫 점과 마지막 점 포함)
+
+    Returns:
+        선택된 인덱스 배열 (오름차순)
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    missing = np.isnan(y)
+    if missing.all():
+        y = np.zeros(n)
+    elif missing.any():
+        y = y.copy()
+        y[missing] = np.interp(x[missing], x[~missing], y[~missing])
+
+    # 첫/마지막 점을 제외한 나머지를 threshold - 2개 버킷으로 분할
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+
+        # 다음 버킷의 평균점 (마지막 버킷이면 마지막 점)
+        if bucket + 2 < len(edges):
+            next_start, next_end = edges[bucket + 1], edges[bucket + 2]
+            avg_x = x[next_start:next_end].mean()
+            avg_y = y[next_start:next_end].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+
+        px, py = x[previous], y[previous]
+        areas = np.abs(
+            (px - avg_x) * (y[start:end] - py) - (px - x[start:end]) * (avg_y - py)
+        )
+        previous = start + int(np.argmax(areas))
+        selected[bucket + 1] = previous
+
+    return selected
+
+
+def downsample_columns(
+    dates: np.ndarray,
+    columns: Dict[str, np.ndarray],
+    max_points: int,
+    primary: Optional[str] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    여러 필드를 같은 인덱스로 다운샘플링 (열 간 정렬 유지)
+
+    Args:
+        dates: 날짜 배열 (datetime64[D])
+        columns: 필드명 -> 값 배열
+        max_points: 최대 점 개수
+        primary: 점 선택 기준 필드 (없으면 첫 번째 필드)
+
+    Returns:
+        "date"와 각 필드를 키로 하는 다운샘플링된 배열
+    """
+    fields: List[str] = list(columns)
+    if not fields or len(dates) <= max_points:
+        return {"date": dates, **columns}
+
+    basis = columns[primary] if primary in columns else columns[fields[0]]
+    indices = lttb_indices(dates.astype(np.int64), basis, max_points)
+    return {
+        "date": dates[indices],
+        **{field: values[indices] for field, values in columns.items()},
+    }
@@ -0,0 +1,192 @@
+"""
+Bulk Export Service
+
+종목 집합과 기간에 대한 일봉/지표/시장 상태/시그널 데이터를 CSV 또는 Arrow로 내보냅니다.
+서버 측 커서로 EXPORT_CHUNK_ROWS 단위씩 읽고 바로 인코딩하므로 결과 크기와 관계없이
+메모리 사용량이 청크 크기로 제한됩니다.
+
+- API: GET /api/v1/data/export/{dataset} (CSV, Arrow IPC 스트림)
+- CLI: python export_data.py (DB 직접 조회, CSV/Parquet/Arrow 파일)
+"""
+
+import csv
+import io
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import BigInteger, Date, DateTime, Float, Integer, Numeric, Select, cast, select
+
+from app.models.market_state import MarketState
+from app.models.price_bar import PriceBar
+from app.models.symbol import Symbol
+from app.models.technical_indicator import TechnicalIndicator
+from app.models.trading_signal import TradingSignal
+
+# 서버 측 커서에서 한 번에 읽어 인코딩하는 행 수
+EXPORT_CHUNK_ROWS = 5000
+
+EXPORT_FORMATS = ("csv", "arrow")
+
+# 데이터셋 -> (모델, 날짜 컬럼, 내보낼 컬럼)
+EXPORT_DATASETS: Dict[str, tuple] = {
+    "bars": (PriceBar, "date", ("open", "high", "low", "close", "volume")),
+    "indicators": (
+        TechnicalIndicator,
+        "date",
+        (
+            "atr",
+            "atr_ratio",
+            "bb_upper",
+            "bb_middle",
+            "bb_lower",
+            "bb_width",
+            "bb_width_ratio",
+            "adx",
+            "plus_di",
+            "minus_di",
+            "std_dev",
+            "vix",
+        ),
+    ),
+    "market_states": (
+        MarketState,
+        "date",
+        (
+            "trend_type",
+            "volatility_level",
+            "risk_level",
+            "recommended_strategy",
+            "position_sizing_ratio",
+        ),
+    ),
+    "signals": (
+        TradingSignal,
+        "generated_at",
+        (
+            "id",
+            "signal_type",
+            "signal_strength",
+            "current_price",
+            "target_price",
+            "stop_loss",
+            "risk_level",
+        ),
+    ),
+}
+
+EOS_MARKER = b"\xff\xff\xff\xff\x00\x00\x00\x00"
+
+
+class ExportUnavailableError(Exception):
+    """요청한 형식에 필요한 선택 의존성이 설치되지 않음"""
+
+
+def export_columns(dataset: str) -> List[str]:
+    """내보내기 결과 컬럼명 (symbol, 날짜, 데이터 컬럼 순)"""
+    _, date_column, columns = EXPORT_DATASETS[dataset]
+    return ["symbol", date_column, *columns]
+
+
+def export_query(
+    dataset: str,
+    symbols: Optional[Sequence[str]] = None,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None,
+) -> Select:
+    """
+    내보내기 쿼리 (종목, 날짜 순 정렬)
+
+    Numeric 컬럼은 float으로 변환하여 Decimal 생성 비용을 없앱니다.
+    """
+    model, date_column, columns = EXPORT_DATASETS[dataset]
+    date_attr = getattr(model, date_column)
+
+    selected = []
+    for name in columns:
+        column = getattr(model, name)
+        if isinstance(column.type, Numeric) and not isinstance(column.type, Float):
+            column = cast(column, Float)
+        selected.append(column.label(name))
+
+    query = (
+        select(Symbol.symbol, date_attr.label(date_column), *selected)
+        .join(Symbol, Symbol.id == model.symbol_id)
+        .order_by(Symbol.symbol, date_attr)
+    )
+    if symbols:
+        query = query.where(Symbol.symbol.in_([s.upper() for s in symbols]))
+    if from_date:
+        query = query.where(date_attr >= from_date)
+    if to_date:
+        # DateTime 컬럼(시그널)도 종료일 전체를 포함
+        if isinstance(date_attr.type, DateTime):
+            query = query.where(date_attr < to_date + timedelta(days=1))
+        else:
+            query = query.where(date_attr <= to_date)
+    return query
+
+
+def encode_csv_chunk(rows: Sequence[Sequence[Any]], header: Optional[List[str]] = None) -> bytes:
+    """행 묶음을 CSV 바이트로 인코딩 (header가 주어지면 맨 앞에 포함)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(header)
+    writer.writerows(rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def _pyarrow():
+    """pyarrow 모듈 (선택 의존성, 무거우므로 첫 Arrow 내보내기 요청 시 import)"""
+    try:
+        import pyarrow
+    except ImportError:  # pragma: no cover - 선택 의존성
+        raise ExportUnavailableError("Arrow export requires pyarrow")
+    return pyarrow
+
+
+def _arrow_type(pa, column_type):
+    if isinstance(column_type, DateTime):
+        return pa.timestamp("us")
+    if isinstance(column_type, Date):
+        return pa.date32()
+    if isinstance(column_type, (Integer, BigInteger)):
+        return pa.int64()
+    if isinstance(column_type, (Float, Numeric)):
+        return pa.float64()
+    return pa.string()
+
+
+def arrow_schema(dataset: str):
+    """데이터셋의 Arrow 스키마"""
+    pa = _pyarrow()
+    model, date_column, columns = EXPORT_DATASETS[dataset]
+    return pa.schema(
+        [("symbol", pa.string())]
+        + [
+            (name, _arrow_type(pa, getattr(model, name).type))
+            for name in (date_column, *columns)
+        ]
+    )
+
+
+def arrow_batch(rows: Sequence[Sequence[Any]], schema):
+    """행 묶음을 Arrow RecordBatch로 변환"""
+    pa = _pyarrow()
+    columns = list(zip(*rows)) if rows else [[] for _ in schema.names]
+    return pa.RecordBatch.from_arrays(
+        [pa.array(values, type=field.type) for values, field in zip(columns, schema)],
+        schema=schema,
+    )
+
+
+def encode_arrow_chunk(rows: Sequence[Sequence[Any]], schema, with_schema: bool = False) -> bytes:
+    """
+    행 묶음을 Arrow IPC 스트림 메시지로 인코딩
+
+    첫 청크에는 스키마 메시지를 앞에 붙이고, 스트림 끝에는 EOS_MARKER를 보내야 합니다.
+    """
+    data = arrow_batch(rows, schema).serialize().to_pybytes()
+    if with_schema:
+        return schema.serialize().to_pybytes() + data
+    return data
@@ -1,20 +1,52 @@
-import yfinance as yf
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
 
+from app.core.cache import TTLCache
+from app.core.metrics import observe_upstream
+from app.core.profiling import track
+
+
+def yf_ticker(symbol: str):
+    """yfinance Ticker 생성 (yfinance는 pandas 등을 끌어오므로 첫 업스트림 호출 시 import)"""
+    import yfinance as yf
+
+    return yf.Ticker(symbol)
+
 
 class YFinanceClient:
     """Yahoo Finance API Client using yfinance library"""
 
+    # 가격 데이터 캐시 유지 시간 (초) - 같은 종목의 반복 조회(배치 시그널 등)에서 재사용
+    PRICE_CACHE_TTL_SECONDS = 300
+
+    MAX_WORKERS = 5
+
     def __init__(self):
-        self.executor = ThreadPoolExecutor(max_workers=5)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._price_cache: TTLCache[List[Dict[str, Any]]] = TTLCache(
+            ttl_seconds=self.PRICE_CACHE_TTL_SECONDS, maxsize=512, name="prices"
+        )
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """업스트림 호출용 스레드 풀 (첫 사용 시 생성)"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.MAX_WORKERS, thread_name_prefix="yfinance"
+            )
+        return self._executor
 
     async def _run_in_executor(self, func, *args):
-        """비동기 실행을 위한 헬퍼 메서드"""
+        """비동기 실행을 위한 헬퍼 메서드 (현재 요청의 "upstream" 단계 + 메서드별 업스트림 지표로 기록)"""
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(self.executor, func, *args)
+        return await track(
+            "upstream",
+            observe_upstream(
+                "yfinance", func.__name__, loop.run_in_executor(self.executor, func, *args)
+            ),
+        )
 
     async def get_historical_prices(
         self, symbol: str, from_date: str = None, to_date: str = None
@@ -30,8 +62,13 @@ class YFinanceClient:
         Returns:
             가격 데이터 리스트 (FMP 형식과 호환)
         """
+        cache_key = (symbol, from_date, to_date)
+        cached = self._price_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         def fetch_data():
-            ticker = yf.Ticker(symbol)
+            ticker = yf_ticker(symbol)
 
             # 기간 설정
             if from_date and to_date:
@@ -64,7 +101,16 @@ class YFinanceClient:
             result.reverse()
             return result
 
-        return await self._run_in_executor(fetch_data)
+        result = await self._run_in_executor(fetch_data)
+        if result:
+            self._price_cache.set(cache_key, result)
+        return result
+
+    def cached_historical_prices(
+        self, symbol: str, from_date: str = None, to_date: str = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """get_historical_prices() 캐시에 있는 가격 데이터 (없으면 None, 업스트림 조회 없음)"""
+        return self._price_cache.peek((symbol, from_date, to_date))
 
     async def get_quote(self, symbol: str) -> Dict[str, Any]:
         """
@@ -77,7 +123,7 @@ class YFinanceClient:
             실시간 시세 데이터
         """
         def fetch_quote():
-            ticker = yf.Ticker(symbol)
+            ticker = yf_ticker(symbol)
             info = ticker.info
 
             return {
@@ -110,7 +156,7 @@ class YFinanceClient:
             기업 프로필 데이터
         """
         def fetch_profile():
-            ticker = yf.Ticker(symbol)
+            ticker = yf_ticker(symbol)
             info = ticker.info
 
             return {
@@ -148,24 +194,24 @@ class YFinanceClient:
             # yfinance는 직접 검색 기능이 없으므로,
             # 주요 종목 리스트에서 매칭하거나 단순히 심볼로 조회
             # 여기서는 단순히 쿼리를 심볼로 가정하고 조회
-            try:
-                ticker = yf.Ticker(query.upper())
-                info = ticker.info
-
-                if info.get("regularMarketPrice") or info.get("currentPrice"):
-                    return [{
-                        "symbol": query.upper(),
-                        "name": info.get("longName", query.upper()),
-                        "stockExchange": info.get("exchange", ""),
-                        "currency": info.get("currency", "USD"),
-                        "exchangeShortName": info.get("exchange", ""),
-                    }]
-            except Exception:
-                pass
+            ticker = yf_ticker(query.upper())
+            info = ticker.info
 
+            if info.get("regularMarketPrice") or info.get("currentPrice"):
+                return [{
+                    "symbol": query.upper(),
+                    "name": info.get("longName", query.upper()),
+                    "stockExchange": info.get("exchange", ""),
+                    "currency": info.get("currency", "USD"),
+                    "exchangeShortName": info.get("exchange", ""),
+                }]
             return []
 
-        return await self._run_in_executor(search)
+        # 조회 실패는 빈 결과로 처리 (업스트림 오류 지표에는 기록됨)
+        try:
+            return await self._run_in_executor(search)
+        except Exception:
+            return []
 
     async def get_market_index(self, index: str = "^GSPC") -> Dict[str, Any]:
         """
@@ -178,7 +224,7 @@ class YFinanceClient:
             지수 데이터
         """
         def fetch_index():
-            ticker = yf.Ticker(index)
+            ticker = yf_ticker(index)
             info = ticker.info
 
             return {
@@ -199,12 +245,28 @@ class YFinanceClient:
             VIX 값
         """
         def fetch_vix():
-            ticker = yf.Ticker("^VIX")
+            ticker = yf_ticker("^VIX")
             info = ticker.info
             return float(info.get("regularMarketPrice", 0))
 
         return await self._run_in_executor(fetch_vix)
 
+    async def get_vix_history(self, from_date: str = None, to_date: str = None) -> Dict[str, float]:
+        """
+        VIX 일별 종가 조회 (지표 계산 구간의 날짜별 VIX)
+
+        get_historical_prices()의 캐시를 공유하므로 같은 기간을 분석하는 종목들은 한 번만 조회합니다.
+
+        Args:
+            from_date: 시작일 (YYYY-MM-DD)
+            to_date: 종료일 (YYYY-MM-DD)
+
+        Returns:
+            날짜(YYYY-MM-DD) -> VIX 종가
+        """
+        prices = await self.get_historical_prices("^VIX", from_date=from_date, to_date=to_date)
+        return {bar["date"]: bar["close"] for bar in prices}
+
 
 # FMP Client를 YFinance Client로 교체 (하위 호환성 유지)
 fmp_client = YFinanceClient()
@@ -5,23 +5,41 @@ Piotroski F-Score는 9가지 재무 지표를 평가하여 기업의 재무 건
 각 지표당 1점씩, 총 0-9점 범위입니다.
 """
 
-import yfinance as yf
 from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
 import asyncio
+import logging
 from concurrent.futures import ThreadPoolExecutor
 
+from app.core.metrics import observe_upstream
+from app.services.fmp_client import yf_ticker
+
+logger = logging.getLogger(__name__)
+
 
 class FundamentalAnalysis:
     """재무제표 분석 및 Piotroski F-Score 계산"""
 
+    MAX_WORKERS = 3
+
     def __init__(self):
-        self.executor = ThreadPoolExecutor(max_workers=3)
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """재무제표 조회용 스레드 풀 (첫 사용 시 생성)"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.MAX_WORKERS, thread_name_prefix="fundamentals"
+            )
+        return self._executor
 
     async def _run_in_executor(self, func, *args):
-        """비동기 실행을 위한 헬퍼 메서드"""
+        """비동기 실행을 위한 헬퍼 메서드 (메서드별 업스트림 지표로 기록)"""
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(self.executor, func, *args)
+        return await observe_upstream(
+            "yfinance", func.__name__, loop.run_in_executor(self.executor, func, *args)
+        )
 
     def _calculate_f_score(self, ticker_info: Dict[str, Any], financials: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -133,7 +151,7 @@ class FundamentalAnalysis:
                 details["turnover_improved"] = False
 
         except Exception as e:
-            print(f"F-Score 계산 중 오류: {e}")
+            logger.warning("F-Score 계산 중 오류: %s", e)
             # 오류 발생 시 부분 점수라도 반환
 
         return {
@@ -155,41 +173,40 @@ class FundamentalAnalysis:
         """
 
         def fetch_fundamentals():
-            try:
-                ticker = yf.Ticker(symbol)
-                info = ticker.info
-                financials = ticker.financials
-
-                # F-Score 계산
-                f_score_result = self._calculate_f_score(info, financials)
-
-                # 기본 재무 정보 추가
-                f_score_result["fundamentals"] = {
-                    "market_cap": info.get("marketCap", 0),
-                    "pe_ratio": info.get("trailingPE", 0),
-                    "pb_ratio": info.get("priceToBook", 0),
-                    "debt_to_equity": info.get("debtToEquity", 0),
-                    "current_ratio": info.get("currentRatio", 0),
-                    "roe": info.get("returnOnEquity", 0),
-                    "roa": info.get("returnOnAssets", 0),
-                    "profit_margin": info.get("profitMargins", 0),
-                    "operating_margin": info.get("operatingMargins", 0),
-                    "gross_margin": info.get("grossMargins", 0),
-                }
-
-                return f_score_result
-
-            except Exception as e:
-                print(f"재무제표 조회 실패 ({symbol}): {e}")
-                return {
-                    "f_score": 0,
-                    "max_score": 9,
-                    "details": {},
-                    "error": str(e),
-                    "calculated_at": datetime.now().isoformat(),
-                }
-
-        return await self._run_in_executor(fetch_fundamentals)
+            ticker = yf_ticker(symbol)
+            info = ticker.info
+            financials = ticker.financials
+
+            # F-Score 계산
+            f_score_result = self._calculate_f_score(info, financials)
+
+            # 기본 재무 정보 추가
+            f_score_result["fundamentals"] = {
+                "market_cap": info.get("marketCap", 0),
+                "pe_ratio": info.get("trailingPE", 0),
+                "pb_ratio": info.get("priceToBook", 0),
+                "debt_to_equity": info.get("debtToEquity", 0),
+                "current_ratio": info.get("currentRatio", 0),
+                "roe": info.get("returnOnEquity", 0),
+                "roa": info.get("returnOnAssets", 0),
+                "profit_margin": info.get("profitMargins", 0),
+                "operating_margin": info.get("operatingMargins", 0),
+                "gross_margin": info.get("grossMargins", 0),
+            }
+
+            return f_score_result
+
+        try:
+            return await self._run_in_executor(fetch_fundamentals)
+        except Exception as e:
+            logger.warning("재무제표 조회 실패 (%s): %s", symbol, e)
+            return {
+                "f_score": 0,
+                "max_score": 9,
+                "details": {},
+                "error": str(e),
+                "calculated_at": datetime.now().isoformat(),
+            }
 
     async def get_financial_summary(self, symbol: str) -> Dict[str, Any]:
         """
@@ -203,35 +220,34 @@ class FundamentalAnalysis:
         """
 
         def fetch_summary():
-            try:
-                ticker = yf.Ticker(symbol)
-                info = ticker.info
-
-                return {
-                    "symbol": symbol,
-                    "company_name": info.get("longName", symbol),
-                    "sector": info.get("sector", "Unknown"),
-                    "industry": info.get("industry", "Unknown"),
-                    "market_cap": info.get("marketCap", 0),
-                    "pe_ratio": info.get("trailingPE", 0),
-                    "forward_pe": info.get("forwardPE", 0),
-                    "peg_ratio": info.get("pegRatio", 0),
-                    "pb_ratio": info.get("priceToBook", 0),
-                    "ps_ratio": info.get("priceToSalesTrailing12Months", 0),
-                    "dividend_yield": info.get("dividendYield", 0),
-                    "beta": info.get("beta", 1.0),
-                    "52_week_high": info.get("fiftyTwoWeekHigh", 0),
-                    "52_week_low": info.get("fiftyTwoWeekLow", 0),
-                }
-
-            except Exception as e:
-                print(f"재무 요약 조회 실패 ({symbol}): {e}")
-                return {
-                    "symbol": symbol,
-                    "error": str(e),
-                }
-
-        return await self._run_in_executor(fetch_summary)
+            ticker = yf_ticker(symbol)
+            info = ticker.info
+
+            return {
+                "symbol": symbol,
+                "company_name": info.get("longName", symbol),
+                "sector": info.get("sector", "Unknown"),
+                "industry": info.get("industry", "Unknown"),
+                "market_cap": info.get("marketCap", 0),
+                "pe_ratio": info.get("trailingPE", 0),
+                "forward_pe": info.get("forwardPE", 0),
+                "peg_ratio": info.get("pegRatio", 0),
+                "pb_ratio": info.get("priceToBook", 0),
+                "ps_ratio": info.get("priceToSalesTrailing12Months", 0),
+                "dividend_yield": info.get("dividendYield", 0),
+                "beta": info.get("beta", 1.0),
+                "52_week_high": info.get("fiftyTwoWeekHigh", 0),
+                "52_week_low": info.get("fiftyTwoWeekLow", 0),
+            }
+
+        try:
+            return await self._run_in_executor(fetch_summary)
+        except Exception as e:
+            logger.warning("재무 요약 조회 실패 (%s): %s", symbol, e)
+            return {
+                "symbol": symbol,
+                "error": str(e),
+            }
 
 
 # 서비스 인스턴스
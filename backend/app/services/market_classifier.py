@@ -1,4 +1,4 @@
-from typing import Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
 from enum import Enum
 
 
@@ -40,6 +40,9 @@ class MarketClassifier:
     VIX_CAUTION = 20           # 주의
     VIX_ALERT = 30             # 경고
 
+    # classify_market_state() 입력 지표 (vix는 선택)
+    INPUT_FIELDS = ("adx", "plus_di", "minus_di", "atr_ratio", "bb_width_ratio", "std_dev")
+
     @staticmethod
     def classify_trend(
         adx: float,
@@ -180,6 +183,24 @@ class MarketClassifier:
             else:
                 return ("wait_and_see", base_position_size * 0.3)
 
+    @staticmethod
+    def classifier_inputs(values: Dict[str, Any], close: float) -> Dict[str, float]:
+        """
+        지표 값(indicator_rows() 행 등)에서 classify_market_state() 입력 생성
+
+        계산되지 않은 지표(None)는 NaN으로 넘겨 임계값 비교에서 모두 거짓이 되게 하고,
+        VIX가 없으면 키를 빼서 기본값을 사용합니다.
+        """
+        inputs = {
+            field: float("nan") if values.get(field) is None else float(values[field])
+            for field in MarketClassifier.INPUT_FIELDS
+        }
+        inputs["close"] = float(close)
+        vix: Optional[float] = values.get("vix")
+        if vix is not None:
+            inputs["vix"] = float(vix)
+        return inputs
+
     @staticmethod
     def classify_market_state(indicators: Dict) -> Dict:
         """
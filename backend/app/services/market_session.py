@@ -0,0 +1,92 @@
+"""
+Market Session Service
+
+미국 주식시장 정규장(09:30-16:00 ET, 평일) 기준으로 최신 일봉 날짜와
+저장된 분석 결과의 신선도를 판단합니다. (공휴일은 고려하지 않음)
+"""
+
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Optional
+from zoneinfo import ZoneInfo
+
+MARKET_TZ = ZoneInfo("America/New_York")
+MARKET_OPEN = time(9, 30)
+MARKET_CLOSE = time(16, 0)
+
+# 장중에는 일봉이 계속 변하므로 이 시간 이내에 갱신된 결과만 신선한 것으로 간주
+INTRADAY_MAX_AGE = timedelta(minutes=15)
+
+
+def _now_market(now: Optional[datetime] = None) -> datetime:
+    now = now or datetime.now(timezone.utc)
+    if now.tzinfo is None:
+        now = now.replace(tzinfo=timezone.utc)
+    return now.astimezone(MARKET_TZ)
+
+
+def _previous_weekday(day: date) -> date:
+    day -= timedelta(days=1)
+    while day.weekday() >= 5:
+        day -= timedelta(days=1)
+    return day
+
+
+def is_market_open(now: Optional[datetime] = None) -> bool:
+    """정규장 운영 중인지 여부"""
+    local = _now_market(now)
+    return local.weekday() < 5 and MARKET_OPEN <= local.time() < MARKET_CLOSE
+
+
+def expected_bar_date(now: Optional[datetime] = None) -> date:
+    """현재 시점에 존재해야 하는 최신 일봉 날짜 (장 시작 전이면 직전 거래일)"""
+    local = _now_market(now)
+    if local.weekday() < 5 and local.time() >= MARKET_OPEN:
+        return local.date()
+    return _previous_weekday(local.date())
+
+
+def session_close_at(bar_date: date) -> datetime:
+    """해당 일봉이 확정되는 시각 (장 마감)"""
+    return datetime.combine(bar_date, MARKET_CLOSE, tzinfo=MARKET_TZ)
+
+
+def next_bar_change_at(now: Optional[datetime] = None) -> datetime:
+    """다음으로 일봉 데이터가 바뀌기 시작하는 시각 (장중이면 현재, 아니면 다음 장 시작)"""
+    local = _now_market(now)
+    if is_market_open(local):
+        return local
+
+    day = local.date()
+    if local.weekday() >= 5 or local.time() >= MARKET_OPEN:
+        day += timedelta(days=1)
+        while day.weekday() >= 5:
+            day += timedelta(days=1)
+    return datetime.combine(day, MARKET_OPEN, tzinfo=MARKET_TZ)
+
+
+def is_fresh(
+    bar_date: Optional[date],
+    updated_at: Optional[datetime],
+    now: Optional[datetime] = None,
+) -> bool:
+    """
+    저장된 분석 결과가 현재 장 세션 기준으로 충분히 최신인지 판단
+
+    - 최신 일봉 날짜가 기대 날짜 이상이어야 함
+    - 장 마감 이후 갱신되었거나, 장중이면 INTRADAY_MAX_AGE 이내에 갱신되었어야 함
+    """
+    if bar_date is None or updated_at is None:
+        return False
+
+    local = _now_market(now)
+    expected = expected_bar_date(local)
+    if bar_date < expected:
+        return False
+
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+
+    if updated_at >= session_close_at(expected):
+        return True
+
+    return is_market_open(local) and local - updated_at <= INTRADAY_MAX_AGE
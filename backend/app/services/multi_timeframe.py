@@ -111,15 +111,11 @@ class MultiTimeframeAnalyzer:
 
         return TrendDirection.SIDEWAYS
 
-    async def _get_timeframe_data(
-        self, symbol: str, days: int
+    def _build_timeframe_data(
+        self, price_data: List[Dict[str, Any]], days: int
     ) -> pd.DataFrame:
-        """특정 일수의 가격 데이터 조회 및 지표 계산"""
+        """가격 데이터에서 특정 일수만큼 잘라 지표 계산"""
         try:
-            price_data = await fmp_client.get_historical_prices(
-                symbol=symbol, from_date=None, to_date=None
-            )
-
             # 요청한 일수만큼만 가져오기
             if len(price_data) > days:
                 price_data = price_data[-days:]
@@ -128,13 +124,14 @@ class MultiTimeframeAnalyzer:
             df = TechnicalIndicators.calculate_all_indicators(price_data)
             return df
         except Exception as e:
-            print(f"Error fetching timeframe data for {symbol}: {e}")
+            print(f"Error building timeframe data ({days} days): {e}")
             return pd.DataFrame()
 
     async def analyze_multiple_timeframes(
         self,
         symbol: str,
         trading_style: str = "swing_trading",
+        price_data: Optional[List[Dict[str, Any]]] = None,
     ) -> Dict[str, Any]:
         """
         다중 타임프레임 분석 수행
@@ -142,10 +139,37 @@ class MultiTimeframeAnalyzer:
         Args:
             symbol: 종목 심볼
             trading_style: 트레이딩 스타일 (day_trading, swing_trading, vwap_strategy)
+            price_data: 이미 조회한 가격 데이터 (없으면 한 번 조회하여 모든 타임프레임에 재사용)
 
         Returns:
             타임프레임별 추세, 정렬 상태, 진입 적합성 등
         """
+        if price_data is None:
+            try:
+                price_data = await fmp_client.get_historical_prices(
+                    symbol=symbol, from_date=None, to_date=None
+                )
+            except Exception as e:
+                print(f"Error fetching timeframe data for {symbol}: {e}")
+                price_data = []
+
+        return self.analyze_price_data(price_data, trading_style)
+
+    def analyze_price_data(
+        self,
+        price_data: List[Dict[str, Any]],
+        trading_style: str = "swing_trading",
+    ) -> Dict[str, Any]:
+        """
+        조회된 가격 데이터로 다중 타임프레임 분석 수행 (CPU 연산만 수행)
+
+        Args:
+            price_data: 가격 데이터 리스트
+            trading_style: 트레이딩 스타일
+
+        Returns:
+            analyze_multiple_timeframes와 동일한 형식의 분석 결과
+        """
 
         # 타임프레임별 데이터 수집 (일수 기준)
         timeframe_configs = {
@@ -159,7 +183,7 @@ class MultiTimeframeAnalyzer:
 
         # 각 타임프레임별 분석
         for tf_key, config in timeframe_configs.items():
-            df = await self._get_timeframe_data(symbol, config["days"])
+            df = self._build_timeframe_data(price_data or [], config["days"])
 
             if df.empty or len(df) < 20:
                 results[tf_key] = {
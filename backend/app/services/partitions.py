@@ -0,0 +1,153 @@
+"""
+Partition Service
+
+시계열 테이블은 date 컬럼 기준 월 단위 RANGE 파티션으로 저장됩니다.
+- <테이블>_pYYYY_MM   — [해당 월 1일, 다음 달 1일) 구간의 행
+- <테이블>_default    — 월 파티션이 없는 날짜의 행 (평소에는 비어 있음)
+
+- ensure_partitions(): 보존 기간 시작 월부터 PARTITION_MONTHS_AHEAD개월 뒤까지 파티션 생성
+  (이미 있으면 건너뜀, Celery Beat에서 매일 실행)
+- drop_expired_partitions(): 보존 기한 이전 월의 파티션을 통째로 분리(DETACH) 후 삭제
+  DELETE와 달리 테이블 팽창, 인덱스 갱신, VACUUM 부담이 없습니다.
+  PARTITION_DETACH_ONLY=True이면 분리만 하고 테이블은 남겨 둡니다 (보관/내보내기용).
+"""
+
+import logging
+import re
+from datetime import date, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 월 단위 파티션 테이블 (파티션 키는 모두 date 컬럼)
+PARTITIONED_TABLES = (
+    "technical_indicators",
+    "market_states",
+    "trading_signals",
+    "fundamental_scores",
+)
+
+_PARTITION_NAME = re.compile(r"_p(\d{4})_(\d{2})$")
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def next_month(month: date) -> date:
+    return (month.replace(day=1) + timedelta(days=32)).replace(day=1)
+
+
+def months(first: date, last: date) -> Iterator[Tuple[date, date]]:
+    """first가 속한 월부터 last가 속한 월까지 (월 시작일, 다음 달 시작일) 구간"""
+    month = month_start(first)
+    while month <= last:
+        upper = next_month(month)
+        yield month, upper
+        month = upper
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month:%Y_%m}"
+
+
+def partition_bounds(name: str) -> Optional[Tuple[date, date]]:
+    """월 파티션 이름에서 [시작일, 종료일) 구간 추출 (기본 파티션 등은 None)"""
+    match = _PARTITION_NAME.search(name)
+    if not match:
+        return None
+    month = date(int(match.group(1)), int(match.group(2)), 1)
+    return month, next_month(month)
+
+
+def ensure_partitions(
+    db: Session,
+    first: date,
+    months_ahead: Optional[int] = None,
+    today: Optional[date] = None,
+) -> List[str]:
+    """
+    first가 속한 월부터 이번 달 + months_ahead개월까지 월 파티션 생성
+
+    기본 파티션에 이미 같은 월의 행이 있으면 해당 파티션은 만들지 못하므로 경고만 남기고 건너뜁니다.
+
+    Returns:
+        새로 만든 파티션 이름 목록
+    """
+    if months_ahead is None:
+        months_ahead = settings.PARTITION_MONTHS_AHEAD
+    last = month_start(today or date.today())
+    for _ in range(months_ahead):
+        last = next_month(last)
+
+    created = []
+    for table in PARTITIONED_TABLES:
+        existing = set(_partitions(db, table))
+        for month, upper in months(first, last):
+            name = partition_name(table, month)
+            if name in existing:
+                continue
+            try:
+                with db.begin_nested():
+                    db.execute(
+                        text(
+                            f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} "
+                            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+                        )
+                    )
+            except DBAPIError as e:
+                logger.warning("Could not create partition %s: %s", name, e.orig)
+                continue
+            created.append(name)
+    return created
+
+
+def drop_expired_partitions(
+    db: Session, cutoff: date, detach_only: Optional[bool] = None
+) -> Dict[str, List[str]]:
+    """
+    구간 전체가 cutoff 이전인 월 파티션을 분리 후 삭제하고, 기본 파티션의 만료 행은 DELETE로 정리
+
+    Returns:
+        테이블 -> 분리(또는 삭제)된 파티션 이름 목록
+    """
+    if detach_only is None:
+        detach_only = settings.PARTITION_DETACH_ONLY
+
+    expired: Dict[str, List[str]] = {}
+    for table in PARTITIONED_TABLES:
+        expired[table] = []
+        for name in _partitions(db, table):
+            bounds = partition_bounds(name)
+            if bounds is None or bounds[1] > cutoff:
+                continue
+            db.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+            if not detach_only:
+                db.execute(text(f"DROP TABLE {name}"))
+            expired[table].append(name)
+
+        db.execute(
+            text(f"DELETE FROM {table}_default WHERE date < :cutoff"), {"cutoff": cutoff}
+        )
+    return expired
+
+
+def _partitions(db: Session, table: str) -> List[str]:
+    """테이블에 연결된 파티션 이름 목록 (이름순)"""
+    return list(
+        db.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE parent.relname = :table ORDER BY child.relname"
+            ),
+            {"table": table},
+        ).scalars()
+    )
@@ -0,0 +1,246 @@
+"""
+Portfolio Analytics Service
+
+사용자의 전체 매매 기록과 저장된 일봉(price_bars)으로 포트폴리오 성과를 계산합니다.
+거래 단위 루프 없이 numpy/pandas 벡터 연산으로 처리합니다.
+
+- 실현/미실현 손익, 승률, 손익비
+- 일별 자산 곡선(실현 + 평가 손익)과 낙폭(drawdown)
+- 전략(strategy_used)별 성과 기여도
+
+    종목별 순보유수량 Q[d, s]와 매입원가 C[d]를 진입/청산일 차분 배열의 누적합으로 만들고
+    평가 손익 = Σ_s Q[d, s] · P[d, s] − C[d] 로 계산합니다.
+"""
+
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.core.cache import TTLCache
+
+# 사용자별 계산 결과 캐시 (매매 기록 변경 시 무효화, 가격 갱신은 TTL 이내 반영)
+PORTFOLIO_CACHE_TTL_SECONDS = 300
+_portfolio_cache: TTLCache[dict] = TTLCache(
+    ttl_seconds=PORTFOLIO_CACHE_TTL_SECONDS, maxsize=1024, name="portfolio"
+)
+
+# compute_portfolio()에 전달하는 매매 기록 컬럼 순서
+TRADE_COLUMNS = (
+    "id",
+    "symbol_id",
+    "symbol",
+    "trade_type",
+    "entry_date",
+    "entry_price",
+    "exit_date",
+    "exit_price",
+    "quantity",
+    "strategy_used",
+)
+
+UNASSIGNED_STRATEGY = "unassigned"
+
+
+def get_cached_portfolio(user_id) -> Optional[dict]:
+    return _portfolio_cache.get(str(user_id))
+
+
+def set_cached_portfolio(user_id, result: dict) -> None:
+    _portfolio_cache.set(str(user_id), result)
+
+
+def invalidate_portfolio(user_id) -> None:
+    """매매 기록 생성/수정/삭제 시 호출"""
+    _portfolio_cache.invalidate(str(user_id))
+
+
+def trade_profit_loss(
+    trade_type: str, entry_price: float, exit_price: Optional[float], quantity: int
+) -> Tuple[Optional[float], Optional[float]]:
+    """청산된 거래의 손익 및 손익률(%) (미청산이면 None)"""
+    if exit_price is None:
+        return None, None
+    direction = 1.0 if trade_type == "buy" else -1.0
+    profit_loss = (exit_price - entry_price) * quantity * direction
+    profit_loss_percent = (exit_price / entry_price - 1.0) * 100.0 * direction
+    return round(profit_loss, 2), round(profit_loss_percent, 4)
+
+
+def _empty_result() -> Dict[str, Any]:
+    return {
+        "summary": {
+            "total_trades": 0,
+            "open_trades": 0,
+            "closed_trades": 0,
+            "realized_pnl": 0.0,
+            "unrealized_pnl": 0.0,
+            "total_pnl": 0.0,
+            "win_rate": None,
+            "average_win": None,
+            "average_loss": None,
+            "profit_factor": None,
+            "max_drawdown": 0.0,
+        },
+        "equity_curve": {"date": [], "realized": [], "unrealized": [], "equity": [], "drawdown": []},
+        "by_strategy": [],
+        "as_of": None,
+    }
+
+
+def compute_portfolio(
+    trade_rows: Sequence[Sequence[Any]],
+    bar_rows: Sequence[Tuple[int, date, float]],
+    as_of: Optional[date] = None,
+) -> Dict[str, Any]:
+    """
+    포트폴리오 성과 계산 (CPU 연산)
+
+    Args:
+        trade_rows: TRADE_COLUMNS 순서의 매매 기록
+        bar_rows: (symbol_id, date, close) 일봉
+        as_of: 평가 기준일 (기본값: 오늘)
+
+    Returns:
+        summary, equity_curve(열 지향 배열), by_strategy
+    """
+    if not trade_rows:
+        return _empty_result()
+
+    # 매매 기록 CRUD만 쓰는 프로세스는 pandas를 불러오지 않도록 첫 계산 시 import
+    import numpy as np
+    import pandas as pd
+
+    as_of = as_of or date.today()
+    trades = pd.DataFrame(list(trade_rows), columns=TRADE_COLUMNS)
+    trades["entry_date"] = pd.to_datetime(trades["entry_date"])
+    trades["exit_date"] = pd.to_datetime(trades["exit_date"])
+    trades["entry_price"] = trades["entry_price"].astype(np.float64)
+    trades["exit_price"] = trades["exit_price"].astype(np.float64)
+    trades["quantity"] = trades["quantity"].astype(np.float64)
+    trades["strategy_used"] = trades["strategy_used"].fillna(UNASSIGNED_STRATEGY)
+
+    direction = np.where(trades["trade_type"].to_numpy() == "buy", 1.0, -1.0)
+    signed_qty = trades["quantity"].to_numpy() * direction
+    entry_price = trades["entry_price"].to_numpy()
+    exit_price = trades["exit_price"].to_numpy()
+    closed = ~np.isnan(exit_price) & trades["exit_date"].notna().to_numpy()
+
+    realized = np.where(closed, (exit_price - entry_price) * signed_qty, 0.0)
+
+    # 날짜 축: 첫 진입일 ~ 기준일의 평일 + 일봉 날짜
+    bars = pd.DataFrame(list(bar_rows), columns=("symbol_id", "date", "close"))
+    bars["date"] = pd.to_datetime(bars["date"])
+    start = trades["entry_date"].min()
+    dates = pd.DatetimeIndex(
+        pd.bdate_range(start, pd.Timestamp(as_of)).union(bars.loc[bars["date"] >= start, "date"])
+    ).unique().sort_values()
+
+    # 종목별 종가 행렬 P[d, s] (전일 종가로 채우고, 첫 일봉 이전은 첫 종가로 채움)
+    symbol_ids = np.unique(trades["symbol_id"].to_numpy())
+    prices = (
+        bars.pivot_table(index="date", columns="symbol_id", values="close", aggfunc="last")
+        .reindex(index=dates, columns=symbol_ids)
+        .ffill()
+        .bfill()
+    )
+    # 일봉이 전혀 없는 종목은 진입가로 평가 (평가 손익 0)
+    fallback = trades.groupby("symbol_id")["entry_price"].mean().reindex(symbol_ids)
+    prices = prices.fillna(fallback)
+    price_matrix = prices.to_numpy(dtype=np.float64)
+
+    n_dates = len(dates)
+    symbol_index = np.searchsorted(symbol_ids, trades["symbol_id"].to_numpy())
+    entry_index = np.searchsorted(dates.values, trades["entry_date"].values)
+    exit_index = np.where(
+        closed,
+        np.searchsorted(dates.values, trades["exit_date"].values.astype("datetime64[ns]")),
+        n_dates,
+    )
+
+    # 진입일 +, 청산일 − 차분 배열 → 누적합
+    quantity_delta = np.zeros((n_dates + 1, len(symbol_ids)))
+    np.add.at(quantity_delta, (entry_index, symbol_index), signed_qty)
+    np.add.at(quantity_delta, (exit_index, symbol_index), -signed_qty)
+    open_quantity = np.cumsum(quantity_delta, axis=0)[:n_dates]
+
+    cost_delta = np.zeros(n_dates + 1)
+    np.add.at(cost_delta, entry_index, signed_qty * entry_price)
+    np.add.at(cost_delta, exit_index, -signed_qty * entry_price)
+    open_cost = np.cumsum(cost_delta)[:n_dates]
+
+    realized_delta = np.zeros(n_dates + 1)
+    np.add.at(realized_delta, exit_index[closed], realized[closed])
+    realized_curve = np.cumsum(realized_delta)[:n_dates]
+
+    unrealized_curve = (open_quantity * price_matrix).sum(axis=1) - open_cost
+    equity = realized_curve + unrealized_curve
+    peak = np.maximum.accumulate(equity)
+    drawdown = equity - peak
+
+    # 미청산 거래의 평가 손익 (마지막 종가 기준)
+    last_prices = price_matrix[-1, symbol_index]
+    unrealized = np.where(closed, 0.0, (last_prices - entry_price) * signed_qty)
+
+    wins = closed & (realized > 0)
+    losses = closed & (realized < 0)
+    gross_profit = realized[wins].sum()
+    gross_loss = -realized[losses].sum()
+
+    # 전략별 기여도
+    trades["closed"] = closed
+    trades["win"] = wins
+    trades["realized_pnl"] = realized
+    trades["unrealized_pnl"] = unrealized
+    grouped = trades.groupby("strategy_used").agg(
+        trades=("id", "size"),
+        closed_trades=("closed", "sum"),
+        wins=("win", "sum"),
+        realized_pnl=("realized_pnl", "sum"),
+        unrealized_pnl=("unrealized_pnl", "sum"),
+    )
+    total_pnl = realized.sum() + unrealized.sum()
+    by_strategy: List[Dict[str, Any]] = []
+    for strategy, row in grouped.sort_values("realized_pnl", ascending=False).iterrows():
+        strategy_pnl = row["realized_pnl"] + row["unrealized_pnl"]
+        by_strategy.append(
+            {
+                "strategy": strategy,
+                "trades": int(row["trades"]),
+                "closed_trades": int(row["closed_trades"]),
+                "win_rate": (
+                    float(row["wins"] / row["closed_trades"] * 100.0)
+                    if row["closed_trades"]
+                    else None
+                ),
+                "realized_pnl": round(float(row["realized_pnl"]), 2),
+                "unrealized_pnl": round(float(row["unrealized_pnl"]), 2),
+                "contribution_percent": (
+                    float(strategy_pnl / total_pnl * 100.0) if total_pnl else None
+                ),
+            }
+        )
+
+    closed_count = int(closed.sum())
+    return {
+        "summary": {
+            "total_trades": len(trades),
+            "open_trades": len(trades) - closed_count,
+            "closed_trades": closed_count,
+            "realized_pnl": round(float(realized.sum()), 2),
+            "unrealized_pnl": round(float(unrealized.sum()), 2),
+            "total_pnl": round(float(total_pnl), 2),
+            "win_rate": float(wins.sum() / closed_count * 100.0) if closed_count else None,
+            "average_win": float(realized[wins].mean()) if wins.any() else None,
+            "average_loss": float(realized[losses].mean()) if losses.any() else None,
+            "profit_factor": float(gross_profit / gross_loss) if gross_loss > 0 else None,
+            "max_drawdown": round(float(drawdown.min()), 2),
+        },
+        "equity_curve": {
+            "date": np.datetime_as_string(dates.values, unit="D").tolist(),
+            "realized": np.round(realized_curve, 2),
+            "unrealized": np.round(unrealized_curve, 2),
+            "equity": np.round(equity, 2),
+            "drawdown": np.round(drawdown, 2),
+        },
+        "by_strategy": by_strategy,
+        "as_of": as_of.isoformat(),
+    }
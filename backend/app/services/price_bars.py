@@ -0,0 +1,47 @@
+"""
+Price Bar Service
+
+업스트림에서 받은 일봉 데이터를 price_bars 테이블에 upsert하는 구문을 생성합니다.
+같은 (symbol_id, date) 행은 최신 값으로 덮어씁니다 (장중 갱신 반영).
+"""
+
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.dialects.postgresql import Insert, insert
+
+from app.models.price_bar import PriceBar
+
+
+def price_bar_rows(symbol_id: int, price_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """fmp_client 가격 데이터(날짜 역순)를 price_bars 행으로 변환"""
+    return [
+        {
+            "symbol_id": symbol_id,
+            "date": date.fromisoformat(bar["date"][:10]),
+            "open": bar["open"],
+            "high": bar["high"],
+            "low": bar["low"],
+            "close": bar["close"],
+            "volume": bar.get("volume"),
+        }
+        for bar in price_data
+    ]
+
+
+def price_bars_upsert(rows: List[Dict[str, Any]]) -> Optional[Insert]:
+    """price_bars 일괄 upsert 구문 (행이 없으면 None)"""
+    if not rows:
+        return None
+
+    stmt = insert(PriceBar).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=[PriceBar.symbol_id, PriceBar.date],
+        set_={
+            "open": stmt.excluded.open,
+            "high": stmt.excluded.high,
+            "low": stmt.excluded.low,
+            "close": stmt.excluded.close,
+            "volume": stmt.excluded.volume,
+        },
+    )
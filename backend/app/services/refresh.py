@@ -0,0 +1,239 @@
+"""
+Symbol Refresh Service
+
+Celery 종목 갱신 작업을 중복 없이 예약합니다.
+Redis 키(SET NX + TTL)로 종목별 진행 중인 갱신을 표시하고, 작업 종료 시 해제합니다.
+
+여러 종목을 묶은 갱신 요청(job)은 Redis 해시 카운터로 진행률을 추적합니다.
+- refresh:job:{job_id}          — total/done/failed/queued/deduplicated, 시작/갱신/완료 시각
+- refresh:symbol:{id}:jobs      — 해당 종목 갱신 완료를 기다리는 job ID 집합
+- updates:job:{job_id}          — 종목 하나가 끝날 때마다 진행률 발행 (pub/sub)
+
+이미 진행 중인 종목은 새로 예약하지 않고 기다리는 job 집합에만 추가하므로,
+다른 요청이 예약한 갱신이 끝나도 진행률에 반영됩니다.
+"""
+
+import json
+import logging
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Sequence
+
+from fastapi.concurrency import run_in_threadpool
+from redis.exceptions import RedisError
+
+from app.core.celery_app import celery_app
+from app.core.redis import get_async_redis, get_redis
+
+logger = logging.getLogger(__name__)
+
+# 작업이 비정상 종료되어 키가 해제되지 않더라도 이 시간이 지나면 다시 예약 가능
+REFRESH_DEDUP_TTL_SECONDS = 600
+
+# 갱신 작업 진행률 보관 기간
+REFRESH_JOB_TTL_SECONDS = 24 * 60 * 60
+
+UPDATE_SYMBOL_TASK = "app.tasks.data_update.update_symbol_data"
+
+
+def refresh_lock_key(symbol_id: int) -> str:
+    return f"refresh:symbol:{symbol_id}"
+
+
+def refresh_waiters_key(symbol_id: int) -> str:
+    return f"refresh:symbol:{symbol_id}:jobs"
+
+
+def refresh_job_key(job_id: str) -> str:
+    return f"refresh:job:{job_id}"
+
+
+def job_channel(job_id: str) -> str:
+    return f"updates:job:{job_id}"
+
+
+def _send_refresh_tasks(symbol_ids: Sequence[int]) -> None:
+    for symbol_id in symbol_ids:
+        celery_app.send_task(UPDATE_SYMBOL_TASK, args=[symbol_id])
+
+
+async def enqueue_symbol_refreshes(
+    symbol_ids: Sequence[int], job_id: Optional[str] = None
+) -> List[int]:
+    """
+    여러 종목 갱신 작업 예약 (이미 예약/진행 중인 종목은 건너뜀)
+
+    Args:
+        job_id: 진행률을 추적할 갱신 작업 ID (건너뛴 종목도 완료 시 반영됨)
+
+    Returns:
+        새로 예약한 종목 ID 목록
+
+    Raises:
+        RedisError: Redis 사용 불가
+    """
+    if not symbol_ids:
+        return []
+
+    redis = get_async_redis()
+    async with redis.pipeline(transaction=False) as pipe:
+        # 잠금보다 먼저 대기 집합에 등록해야, 그 사이 끝난 갱신의 완료 통지를 놓치지 않음
+        if job_id:
+            for symbol_id in symbol_ids:
+                pipe.sadd(refresh_waiters_key(symbol_id), job_id)
+                pipe.expire(refresh_waiters_key(symbol_id), REFRESH_JOB_TTL_SECONDS)
+        for symbol_id in symbol_ids:
+            pipe.set(refresh_lock_key(symbol_id), "1", nx=True, ex=REFRESH_DEDUP_TTL_SECONDS)
+        results = await pipe.execute()
+
+    acquired = results[-len(symbol_ids):]
+    queued = [symbol_id for symbol_id, ok in zip(symbol_ids, acquired) if ok]
+    if queued:
+        await run_in_threadpool(_send_refresh_tasks, queued)
+    return queued
+
+
+async def enqueue_symbol_refresh(symbol_id: int) -> bool:
+    """
+    종목 갱신 작업 예약 (이미 예약/진행 중이면 건너뜀)
+
+    Returns:
+        새로 예약했으면 True
+    """
+    try:
+        return bool(await enqueue_symbol_refreshes([symbol_id]))
+    except RedisError as e:
+        logger.warning("refresh dedup unavailable for symbol_id=%s: %s", symbol_id, e)
+        return False
+
+
+def job_progress(job_id: str, fields: Dict[str, str], now: Optional[float] = None) -> Dict[str, Any]:
+    """
+    진행률 해시로부터 진행 상태 계산
+
+    Returns:
+        total/done/failed/remaining, 처리량(symbols/s), 예상 남은 시간(초), status
+        (running | completed | stalled)
+    """
+    now = now or time.time()
+    total = int(fields.get("total", 0))
+    done = int(fields.get("done", 0))
+    failed = int(fields.get("failed", 0))
+    remaining = max(total - done - failed, 0)
+
+    started_at = float(fields.get("started_at", now))
+    updated_at = float(fields.get("updated_at", started_at))
+    finished_at = float(fields["finished_at"]) if fields.get("finished_at") else None
+    elapsed = max((finished_at or now) - started_at, 0.0)
+    throughput = (done + failed) / elapsed if elapsed > 0 else None
+
+    if remaining == 0:
+        status = "completed"
+    elif now - updated_at > REFRESH_DEDUP_TTL_SECONDS:
+        # 중복 방지 키가 만료될 동안 진행이 없으면 워커 비정상 종료로 간주
+        status = "stalled"
+    else:
+        status = "running"
+
+    return {
+        "job_id": job_id,
+        "status": status,
+        "total": total,
+        "queued": int(fields.get("queued", 0)),
+        "deduplicated": int(fields.get("deduplicated", 0)),
+        "done": done,
+        "failed": failed,
+        "remaining": remaining,
+        "elapsed_seconds": round(elapsed, 1),
+        "throughput_per_second": round(throughput, 3) if throughput else None,
+        "eta_seconds": round(remaining / throughput, 1) if throughput and remaining else None,
+        "started_at": started_at,
+        "finished_at": finished_at,
+    }
+
+
+async def create_refresh_job(user_id, symbol_ids: Sequence[int]) -> Dict[str, Any]:
+    """
+    종목 묶음 갱신 작업 생성 및 예약
+
+    Raises:
+        RedisError: Redis 사용 불가
+    """
+    job_id = uuid.uuid4().hex
+    key = refresh_job_key(job_id)
+    now = time.time()
+    fields = {
+        "user_id": str(user_id),
+        "total": len(symbol_ids),
+        "done": 0,
+        "failed": 0,
+        "started_at": now,
+        "updated_at": now,
+    }
+    if not symbol_ids:
+        fields["finished_at"] = now
+
+    redis = get_async_redis()
+    await redis.hset(key, mapping=fields)
+    await redis.expire(key, REFRESH_JOB_TTL_SECONDS)
+
+    queued = await enqueue_symbol_refreshes(symbol_ids, job_id)
+    await redis.hset(
+        key, mapping={"queued": len(queued), "deduplicated": len(symbol_ids) - len(queued)}
+    )
+    return job_progress(job_id, await redis.hgetall(key))
+
+
+async def get_refresh_job(job_id: str) -> Optional[Dict[str, str]]:
+    """진행률 해시 조회 (없거나 만료되었으면 None)"""
+    fields = await get_async_redis().hgetall(refresh_job_key(job_id))
+    return fields or None
+
+
+def _record_job_progress(redis, job_ids: Sequence[str], succeeded: bool) -> None:
+    counter = "done" if succeeded else "failed"
+    now = time.time()
+
+    pipe = redis.pipeline(transaction=False)
+    for job_id in job_ids:
+        pipe.exists(refresh_job_key(job_id))
+    alive = [job_id for job_id, exists in zip(job_ids, pipe.execute()) if exists]
+    if not alive:
+        return
+
+    pipe = redis.pipeline(transaction=False)
+    for job_id in alive:
+        pipe.hincrby(refresh_job_key(job_id), counter, 1)
+        pipe.hset(refresh_job_key(job_id), "updated_at", now)
+        pipe.hgetall(refresh_job_key(job_id))
+    results = pipe.execute()
+
+    pipe = redis.pipeline(transaction=False)
+    for index, job_id in enumerate(alive):
+        fields = results[index * 3 + 2]
+        progress = job_progress(job_id, fields, now)
+        if progress["status"] == "completed" and not fields.get("finished_at"):
+            pipe.hsetnx(refresh_job_key(job_id), "finished_at", now)
+            progress = job_progress(job_id, {**fields, "finished_at": now}, now)
+        pipe.publish(job_channel(job_id), json.dumps(progress))
+    pipe.execute()
+
+
+def release_symbol_refresh(symbol_id: int, succeeded: bool = True) -> None:
+    """
+    종목 갱신 완료 후 중복 방지 키 해제 (Celery 태스크에서 호출)
+
+    이 종목을 기다리던 갱신 작업의 done/failed 카운터를 올리고 진행률을 발행합니다.
+    """
+    try:
+        redis = get_redis()
+        # 잠금 해제와 대기 집합 비우기를 한 트랜잭션으로 처리 (그 사이 등록된 job 유실 방지)
+        pipe = redis.pipeline(transaction=True)
+        pipe.delete(refresh_lock_key(symbol_id))
+        pipe.smembers(refresh_waiters_key(symbol_id))
+        pipe.delete(refresh_waiters_key(symbol_id))
+        _, job_ids, _ = pipe.execute()
+        if job_ids:
+            _record_job_progress(redis, sorted(job_ids), succeeded)
+    except RedisError as e:
+        logger.warning("failed to release refresh lock for symbol_id=%s: %s", symbol_id, e)
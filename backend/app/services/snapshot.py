@@ -0,0 +1,132 @@
+"""
+Symbol Latest Snapshot Service
+
+종목별 최신 상태(종가, 지표, 시장 상태, F-Score, 시그널)를 symbol_latest_snapshot 테이블에
+upsert하는 구문을 생성합니다. 호출하는 쪽은 원본 테이블 저장과 같은 트랜잭션에서 실행합니다.
+
+    db.execute(snapshot_upsert(symbol_id, indicator_values(...), market_state_values(...)))
+"""
+
+import math
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Optional, Sequence
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import Insert, insert
+
+from app.models.symbol_latest_snapshot import SymbolLatestSnapshot
+
+INDICATOR_FIELDS = (
+    "atr",
+    "atr_ratio",
+    "bb_upper",
+    "bb_middle",
+    "bb_lower",
+    "bb_width",
+    "bb_width_ratio",
+    "adx",
+    "plus_di",
+    "minus_di",
+    "std_dev",
+)
+
+
+def _to_float(value: Any) -> Optional[float]:
+    """Decimal/numpy 값을 float으로 변환 (None/NaN/Inf는 None)"""
+    if value is None:
+        return None
+    try:
+        result = float(value)
+    except (TypeError, ValueError):
+        return None
+    if math.isnan(result) or math.isinf(result):
+        return None
+    return result
+
+
+def indicator_values(latest_row, indicator_date: date, vix: Optional[float]) -> Dict[str, Any]:
+    """
+    지표 데이터프레임의 최신 행으로부터 스냅샷 컬럼 값 생성
+
+    indicators_updated_at은 지표를 계산한 시각으로, 신선도 판단에 사용합니다.
+    (updated_at은 시그널/F-Score 갱신 시에도 바뀌므로 지표 신선도를 나타내지 않음)
+    """
+    values = {field: _to_float(latest_row.get(field)) for field in INDICATOR_FIELDS}
+    values["close"] = _to_float(latest_row.get("close"))
+    values["vix"] = _to_float(vix)
+    values["indicator_date"] = indicator_date
+    values["indicators_updated_at"] = datetime.now(timezone.utc)
+    return values
+
+
+def market_state_values(classification: Dict[str, Any], state_date: date) -> Dict[str, Any]:
+    """시장 상태 분류 결과로부터 스냅샷 컬럼 값 생성"""
+    return {
+        "market_state_date": state_date,
+        "trend_type": classification["trend_type"],
+        "volatility_level": classification["volatility_level"],
+        "risk_level": classification["risk_level"],
+        "recommended_strategy": classification["recommended_strategy"],
+        "position_sizing_ratio": _to_float(classification["position_sizing_ratio"]),
+    }
+
+
+def f_score_values(db_f_score) -> Dict[str, Any]:
+    """FundamentalScore 행으로부터 스냅샷 컬럼 값 생성"""
+    return {
+        "f_score": db_f_score.f_score,
+        "f_score_max": db_f_score.max_score,
+        "f_score_calculated_at": db_f_score.calculated_at,
+    }
+
+
+def signal_values(db_signal, bar_date: Optional[date] = None) -> Dict[str, Any]:
+    """TradingSignal 행(및 생성에 사용된 최신 일봉 날짜)으로부터 스냅샷 컬럼 값 생성"""
+    return {
+        "signal_id": db_signal.id,
+        "signal_type": db_signal.signal_type,
+        "signal_strength": db_signal.signal_strength,
+        "signal_price": db_signal.current_price,
+        "signal_risk_level": db_signal.risk_level,
+        "signal_generated_at": db_signal.generated_at,
+        "signal_bar_date": bar_date,
+    }
+
+
+def snapshot_upsert(symbol_id: int, *value_groups: Dict[str, Any]) -> Insert:
+    """
+    스냅샷 upsert 구문 생성 (주어진 컬럼만 갱신)
+
+    값이 없으면 빈 스냅샷 행만 보장합니다 (이미 있으면 아무것도 하지 않음).
+    """
+    values: Dict[str, Any] = {}
+    for group in value_groups:
+        values.update(group)
+
+    stmt = insert(SymbolLatestSnapshot).values(symbol_id=symbol_id, **values)
+    if not values:
+        return stmt.on_conflict_do_nothing(index_elements=[SymbolLatestSnapshot.symbol_id])
+
+    return stmt.on_conflict_do_update(
+        index_elements=[SymbolLatestSnapshot.symbol_id],
+        set_={**{key: stmt.excluded[key] for key in values}, "updated_at": func.now()},
+    )
+
+
+def snapshots_upsert(rows: Sequence[Dict[str, Any]]) -> Optional[Insert]:
+    """
+    여러 종목 스냅샷 일괄 upsert 구문 (행이 없으면 None)
+
+    모든 행은 symbol_id와 같은 컬럼 집합을 가져야 하며, 그 컬럼만 갱신합니다.
+    """
+    if not rows:
+        return None
+
+    stmt = insert(SymbolLatestSnapshot).values(list(rows))
+    return stmt.on_conflict_do_update(
+        index_elements=[SymbolLatestSnapshot.symbol_id],
+        set_={
+            **{key: stmt.excluded[key] for key in rows[0] if key != "symbol_id"},
+            "updated_at": func.now(),
+        },
+    )
@@ -0,0 +1,141 @@
+"""
+Symbol Update Fan-out Service
+
+시장 상태/매매 시그널이 실제로 바뀌었을 때만 변경된 필드(diff)를 Redis pub/sub 채널에
+발행합니다. 종목별 채널(updates:symbol:{id})을 구독하는 SSE 연결이 이를 클라이언트로 전달합니다.
+
+- Celery 태스크(동기): publish_symbol_update()
+- FastAPI 엔드포인트(비동기): publish_symbol_update_async()
+"""
+
+import json
+import logging
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Optional
+
+from redis.exceptions import RedisError
+
+from app.core.redis import get_async_redis, get_redis
+
+logger = logging.getLogger(__name__)
+
+# diff 계산 대상 필드 (날짜/ID/가격처럼 매번 바뀌는 값은 제외)
+MARKET_STATE_DIFF_FIELDS = (
+    "trend_type",
+    "volatility_level",
+    "risk_level",
+    "recommended_strategy",
+    "position_sizing_ratio",
+)
+SIGNAL_DIFF_FIELDS = (
+    "signal_type",
+    "signal_strength",
+    "signal_risk_level",
+)
+
+# 사용자별 관심 종목 구성 변경 알림 (SSE 연결이 구독 채널을 다시 맞춤)
+WATCHLIST_CHANGED = "watchlist_changed"
+
+
+def symbol_channel(symbol_id: int) -> str:
+    return f"updates:symbol:{symbol_id}"
+
+
+def user_channel(user_id) -> str:
+    return f"updates:user:{user_id}"
+
+
+def diff_values(previous, values: Dict[str, Any], fields: Iterable[str]) -> Dict[str, Any]:
+    """
+    이전 스냅샷 대비 바뀐 필드만 반환
+
+    Args:
+        previous: 이전 SymbolLatestSnapshot (없으면 모든 필드가 변경된 것으로 간주)
+        values: 새 스냅샷 컬럼 값
+        fields: 비교할 필드
+    """
+    return {
+        field: values.get(field)
+        for field in fields
+        if previous is None or getattr(previous, field, None) != values.get(field)
+    }
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+def build_update_message(
+    event: str,
+    symbol_id: int,
+    symbol: str,
+    changes: Dict[str, Any],
+    as_of: Optional[date] = None,
+    **extra: Any,
+) -> str:
+    """발행 메시지(JSON) 생성"""
+    return json.dumps(
+        {
+            "event": event,
+            "symbol_id": symbol_id,
+            "symbol": symbol,
+            "as_of": as_of,
+            "changes": changes,
+            **extra,
+        },
+        default=_json_default,
+    )
+
+
+def publish_symbol_update(
+    event: str,
+    symbol_id: int,
+    symbol: str,
+    changes: Dict[str, Any],
+    as_of: Optional[date] = None,
+    **extra: Any,
+) -> bool:
+    """변경 사항 발행 (동기, Celery 태스크용). 변경이 없으면 발행하지 않음"""
+    if not changes:
+        return False
+    try:
+        get_redis().publish(
+            symbol_channel(symbol_id),
+            build_update_message(event, symbol_id, symbol, changes, as_of, **extra),
+        )
+    except RedisError as e:
+        logger.warning("failed to publish %s update for symbol_id=%s: %s", event, symbol_id, e)
+        return False
+    return True
+
+
+async def publish_symbol_update_async(
+    event: str,
+    symbol_id: int,
+    symbol: str,
+    changes: Dict[str, Any],
+    as_of: Optional[date] = None,
+    **extra: Any,
+) -> bool:
+    """변경 사항 발행 (비동기, API 엔드포인트용). 변경이 없으면 발행하지 않음"""
+    if not changes:
+        return False
+    try:
+        await get_async_redis().publish(
+            symbol_channel(symbol_id),
+            build_update_message(event, symbol_id, symbol, changes, as_of, **extra),
+        )
+    except RedisError as e:
+        logger.warning("failed to publish %s update for symbol_id=%s: %s", event, symbol_id, e)
+        return False
+    return True
+
+
+async def notify_watchlist_changed(user_id) -> None:
+    """관심 종목 추가/삭제 시 해당 사용자의 구독 연결에 알림"""
+    try:
+        await get_async_redis().publish(user_channel(user_id), WATCHLIST_CHANGED)
+    except RedisError as e:
+        logger.warning("failed to publish watchlist change for user_id=%s: %s", user_id, e)
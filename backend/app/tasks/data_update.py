@@ -1,20 +1,41 @@
 from celery import Task
 from sqlalchemy.orm import Session
+from collections import defaultdict
 from datetime import datetime, timedelta, date
-from decimal import Decimal
-from typing import List
+from typing import Any, Dict, List, Tuple
 import asyncio
 
 from app.core.celery_app import celery_app
 from app.db.session import SessionLocal
 from app.models.symbol import Symbol
 from app.models.watchlist import Watchlist
-from app.models.technical_indicator import TechnicalIndicator
-from app.models.market_state import MarketState
 from app.models.data_update_log import DataUpdateLog
+from app.models.symbol_latest_snapshot import SymbolLatestSnapshot
+from app.services.analysis_history import (
+    analysis_state,
+    history_chains_query,
+    history_row,
+    history_rows_upsert,
+)
+from app.services.analysis_store import (
+    PRICE_LOOKBACK_DAYS,
+    batched,
+    indicator_rows,
+    indicators_upsert,
+    market_state_row,
+    market_states_upsert,
+)
 from app.services.fmp_client import fmp_client
 from app.services.indicators import TechnicalIndicators
 from app.services.market_classifier import MarketClassifier
+from app.services.partitions import drop_expired_partitions, ensure_partitions
+from app.services.price_bars import price_bar_rows, price_bars_upsert
+from app.services.refresh import release_symbol_refresh
+from app.services.snapshot import indicator_values, market_state_values, snapshots_upsert
+from app.services.updates import MARKET_STATE_DIFF_FIELDS, diff_values, publish_symbol_update
+
+# 전체 종목 갱신 시 한 트랜잭션에서 함께 조회/저장하는 종목 수
+REFRESH_BATCH_SYMBOLS = 100
 
 
 class DatabaseTask(Task):
@@ -45,142 +66,207 @@ def update_symbol_data(self, symbol_id: int) -> dict:
     Returns:
         업데이트 결과 딕셔너리
     """
-    db = self.db
-
+    result: dict = {"status": "error", "symbol_id": symbol_id}
     try:
-        # 1. Symbol 조회
-        symbol = db.query(Symbol).filter(Symbol.id == symbol_id).first()
-        if not symbol:
-            return {"status": "error", "message": f"Symbol {symbol_id} not found"}
-
-        # 2. FMP API에서 최근 90일 가격 데이터 가져오기
-        to_date = datetime.now().strftime("%Y-%m-%d")
-        from_date = (datetime.now() - timedelta(days=90)).strftime("%Y-%m-%d")
-
-        # asyncio.run()으로 비동기 함수 호출
-        price_data = asyncio.run(
-            fmp_client.get_historical_prices(
-                symbol=symbol.symbol,
-                from_date=from_date,
-                to_date=to_date
-            )
-        )
-
-        if not price_data or len(price_data) < 30:
-            return {
-                "status": "error",
-                "message": f"Insufficient price data for {symbol.symbol}"
-            }
-
-        # 3. 기술적 지표 계산
-        indicators_df = TechnicalIndicators.calculate_all_indicators(price_data)
-
-        # 4. VIX 가져오기
-        vix_value = asyncio.run(fmp_client.get_vix())
-
-        # 5. 최신 데이터 저장
-        latest_row = indicators_df.iloc[-1]
-        latest_date = latest_row["date"].date()
+        result = _update_symbols_data(self.db, [symbol_id])[0]
+        return result
+    finally:
+        # 중복 방지 키 해제 및 이 종목을 기다리는 갱신 작업 진행률 반영
+        release_symbol_refresh(symbol_id, succeeded=result.get("status") == "success")
+
+
+async def _fetch_market_data(symbols: List[Symbol]) -> Tuple[list, Dict[str, float]]:
+    """종목별 지표 계산 기간의 가격 데이터(실패 시 예외 객체)와 같은 기간의 날짜별 VIX를 한 이벤트 루프에서 동시 조회"""
+    to_date = datetime.now().strftime("%Y-%m-%d")
+    from_date = (datetime.now() - timedelta(days=PRICE_LOOKBACK_DAYS)).strftime("%Y-%m-%d")
+
+    price_results, vix_by_date = await asyncio.gather(
+        asyncio.gather(
+            *(
+                fmp_client.get_historical_prices(
+                    symbol=symbol.symbol, from_date=from_date, to_date=to_date
+                )
+                for symbol in symbols
+            ),
+            return_exceptions=True,
+        ),
+        fmp_client.get_vix_history(from_date=from_date, to_date=to_date),
+    )
+    return price_results, vix_by_date
+
+
+def _analyze(symbol_id: int, price_data: List[dict], vix_by_date: Dict[str, float]) -> Dict[str, Any]:
+    """기술적 지표 계산(수렴 구간 이후 전체 행) 및 시장 상태 분류 (최신 행 기준)"""
+    indicators_df = TechnicalIndicators.calculate_all_indicators(price_data)
+    latest_row = indicators_df.iloc[-1]
+    latest_date = latest_row["date"].date()
+    window_rows = indicator_rows(symbol_id, indicators_df, vix_by_date)
+
+    # 저장할 최신 행의 지표 값으로 분류 입력 생성 (None 지표/VIX 처리 포함)
+    indicators_dict = MarketClassifier.classifier_inputs(window_rows[-1], latest_row["close"])
+    classification = MarketClassifier.classify_market_state(indicators_dict)
+
+    return {
+        "date": latest_date,
+        "classification": classification,
+        "indicators": indicator_values(latest_row, latest_date, window_rows[-1]["vix"]),
+        "indicator_rows": window_rows,
+        "market_state": market_state_values(classification, latest_date),
+    }
+
+
+def _persist_analyses(
+    db: Session, analyses: List[Tuple[Symbol, List[dict], Dict[str, Any]]]
+) -> Dict[int, Dict[str, Any]]:
+    """
+    여러 종목의 일봉, 지표, 시장 상태, 스냅샷, 분석 이력을 테이블별 일괄 upsert로 저장 후 커밋
 
-        # TechnicalIndicator 저장/업데이트
-        existing_indicator = (
-            db.query(TechnicalIndicator)
-            .filter(
-                TechnicalIndicator.symbol_id == symbol.id,
-                TechnicalIndicator.date == latest_date,
-            )
-            .first()
+    Returns:
+        종목 ID -> 이전 스냅샷 대비 시장 상태 변경분
+    """
+    symbol_ids = [symbol.id for symbol, _, _ in analyses]
+
+    # 1. 일봉 (차트 시계열용)
+    bar_rows = [
+        row
+        for symbol, price_data, _ in analyses
+        for row in price_bar_rows(symbol.id, price_data)
+    ]
+    for chunk in batched(bar_rows):
+        db.execute(price_bars_upsert(chunk))
+
+    # 2. 기술적 지표 계산 구간 전체 (내용 해시가 바뀐 행만 갱신) / 최신 시장 상태
+    window_rows = [row for _, _, analysis in analyses for row in analysis["indicator_rows"]]
+    for chunk in batched(window_rows):
+        db.execute(indicators_upsert(chunk))
+
+    state_rows = [
+        market_state_row(symbol.id, analysis["date"], analysis["classification"])
+        for symbol, _, analysis in analyses
+    ]
+    for chunk in batched(state_rows):
+        db.execute(market_states_upsert(chunk))
+
+    # 3. 최신 스냅샷 (이전 스냅샷 대비 시장 상태 변경분 계산)
+    previous_snapshots = {
+        snapshot.symbol_id: snapshot
+        for snapshot in db.query(SymbolLatestSnapshot).filter(
+            SymbolLatestSnapshot.symbol_id.in_(symbol_ids)
         )
-
-        if existing_indicator:
-            # 업데이트
-            for key in ["atr", "atr_ratio", "bb_upper", "bb_middle", "bb_lower",
-                       "bb_width", "bb_width_ratio", "adx", "plus_di", "minus_di", "std_dev"]:
-                if key in latest_row and not latest_row.isna()[key]:
-                    setattr(existing_indicator, key, Decimal(str(latest_row[key])))
-            existing_indicator.vix = Decimal(str(vix_value))
-        else:
-            # 새로 생성
-            db_indicator = TechnicalIndicator(
-                symbol_id=symbol.id,
-                date=latest_date,
-                atr=Decimal(str(latest_row["atr"])),
-                atr_ratio=Decimal(str(latest_row["atr_ratio"])),
-                bb_upper=Decimal(str(latest_row["bb_upper"])),
-                bb_middle=Decimal(str(latest_row["bb_middle"])),
-                bb_lower=Decimal(str(latest_row["bb_lower"])),
-                bb_width=Decimal(str(latest_row["bb_width"])),
-                bb_width_ratio=Decimal(str(latest_row["bb_width_ratio"])),
-                adx=Decimal(str(latest_row["adx"])),
-                plus_di=Decimal(str(latest_row["plus_di"])),
-                minus_di=Decimal(str(latest_row["minus_di"])),
-                std_dev=Decimal(str(latest_row["std_dev"])),
-                vix=Decimal(str(vix_value)),
+    }
+    state_changes = {
+        symbol.id: diff_values(
+            previous_snapshots.get(symbol.id), analysis["market_state"], MARKET_STATE_DIFF_FIELDS
+        )
+        for symbol, _, analysis in analyses
+    }
+    snapshot_rows = [
+        {"symbol_id": symbol.id, **analysis["indicators"], **analysis["market_state"]}
+        for symbol, _, analysis in analyses
+    ]
+    for chunk in batched(snapshot_rows):
+        db.execute(snapshots_upsert(chunk))
+
+    # 4. 일간 분석 이력 (종목/날짜당 1행, 전날 대비 델타) - 분석 날짜별로 이력 체인을 한 번에 조회
+    by_date: Dict[date, list] = defaultdict(list)
+    for symbol, _, analysis in analyses:
+        by_date[analysis["date"]].append((symbol, analysis))
+
+    history_rows = []
+    for day, day_analyses in by_date.items():
+        chains: Dict[int, list] = defaultdict(list)
+        day_symbol_ids = [symbol.id for symbol, _ in day_analyses]
+        for chunk in batched(day_symbol_ids):
+            for symbol_id, *row in db.execute(history_chains_query(chunk, day)):
+                chains[symbol_id].append(tuple(row))
+        for symbol, analysis in day_analyses:
+            row = history_row(
+                symbol.id,
+                day,
+                analysis_state(analysis["indicators"], analysis["market_state"]),
+                chains[symbol.id],
             )
-            db.add(db_indicator)
-
-        # 6. 시장 상태 분류
-        indicators_dict = {
-            "adx": float(latest_row["adx"]),
-            "plus_di": float(latest_row["plus_di"]),
-            "minus_di": float(latest_row["minus_di"]),
-            "atr_ratio": float(latest_row["atr_ratio"]),
-            "bb_width_ratio": float(latest_row["bb_width_ratio"]),
-            "std_dev": float(latest_row["std_dev"]),
-            "close": float(latest_row["close"]),
-            "vix": vix_value,
-        }
+            if row is not None:
+                history_rows.append(row)
+    for chunk in batched(history_rows):
+        db.execute(history_rows_upsert(chunk))
 
-        classification = MarketClassifier.classify_market_state(indicators_dict)
+    # 5. Symbol의 last_updated 업데이트
+    now = datetime.now()
+    for symbol, _, _ in analyses:
+        symbol.last_updated = now
+    db.commit()
 
-        # MarketState 저장/업데이트
-        existing_state = (
-            db.query(MarketState)
-            .filter(
-                MarketState.symbol_id == symbol.id,
-                MarketState.date == latest_date,
-            )
-            .first()
-        )
+    return state_changes
 
-        if existing_state:
-            # 업데이트
-            existing_state.trend_type = classification["trend_type"]
-            existing_state.volatility_level = classification["volatility_level"]
-            existing_state.risk_level = classification["risk_level"]
-            existing_state.recommended_strategy = classification["recommended_strategy"]
-            existing_state.position_sizing_ratio = Decimal(str(classification["position_sizing_ratio"]))
-        else:
-            # 새로 생성
-            db_state = MarketState(
-                symbol_id=symbol.id,
-                date=latest_date,
-                trend_type=classification["trend_type"],
-                volatility_level=classification["volatility_level"],
-                risk_level=classification["risk_level"],
-                recommended_strategy=classification["recommended_strategy"],
-                position_sizing_ratio=Decimal(str(classification["position_sizing_ratio"])),
-            )
-            db.add(db_state)
 
-        # 7. Symbol의 last_updated 업데이트
-        symbol.last_updated = datetime.now()
-        db.commit()
+def _update_symbols_data(db: Session, symbol_ids: List[int]) -> List[dict]:
+    """
+    여러 종목의 가격 조회, 지표/시장 상태 계산 후 한 트랜잭션으로 일괄 저장
 
-        return {
-            "status": "success",
-            "symbol": symbol.symbol,
-            "updated_at": datetime.now().isoformat(),
-        }
+    가격 조회/계산 실패는 해당 종목만 실패 처리하고, 저장 실패는 묶음 전체를 실패 처리합니다.
 
-    except Exception as e:
-        db.rollback()
-        return {
+    Returns:
+        symbol_ids 순서의 종목별 결과
+    """
+    results: Dict[int, dict] = {}
+    symbols = db.query(Symbol).filter(Symbol.id.in_(symbol_ids)).all()
+    for symbol_id in set(symbol_ids) - {symbol.id for symbol in symbols}:
+        results[symbol_id] = {
             "status": "error",
             "symbol_id": symbol_id,
-            "message": str(e),
+            "message": f"Symbol {symbol_id} not found",
         }
 
+    def _error(symbol: Symbol, message: str) -> None:
+        results[symbol.id] = {"status": "error", "symbol_id": symbol.id, "message": message}
+
+    if symbols:
+        try:
+            # asyncio.run()으로 비동기 함수 호출 (VIX는 묶음당 한 번만 조회)
+            price_results, vix_by_date = asyncio.run(_fetch_market_data(symbols))
+        except Exception as e:
+            price_results, vix_by_date = [e] * len(symbols), {}
+
+        analyses = []
+        for symbol, price_data in zip(symbols, price_results):
+            if isinstance(price_data, Exception):
+                _error(symbol, str(price_data))
+            elif not price_data or len(price_data) < 30:
+                _error(symbol, f"Insufficient price data for {symbol.symbol}")
+            else:
+                try:
+                    analyses.append((symbol, price_data, _analyze(symbol.id, price_data, vix_by_date)))
+                except Exception as e:
+                    _error(symbol, str(e))
+
+        if analyses:
+            try:
+                state_changes = _persist_analyses(db, analyses)
+            except Exception as e:
+                db.rollback()
+                for symbol, _, _ in analyses:
+                    _error(symbol, str(e))
+            else:
+                updated_at = datetime.now().isoformat()
+                for symbol, _, analysis in analyses:
+                    # 시장 상태가 바뀐 경우에만 구독자에게 변경분 발행
+                    publish_symbol_update(
+                        "market_state",
+                        symbol.id,
+                        symbol.symbol,
+                        state_changes[symbol.id],
+                        as_of=analysis["date"],
+                    )
+                    results[symbol.id] = {
+                        "status": "success",
+                        "symbol_id": symbol.id,
+                        "symbol": symbol.symbol,
+                        "updated_at": updated_at,
+                    }
+
+    return [results[symbol_id] for symbol_id in symbol_ids]
+
 
 @celery_app.task(base=DatabaseTask, bind=True, name="app.tasks.data_update.update_all_watchlist_symbols")
 def update_all_watchlist_symbols(self) -> dict:
@@ -211,11 +297,10 @@ def update_all_watchlist_symbols(self) -> dict:
 
         symbol_ids = [sid[0] for sid in symbol_ids]
 
-        # 각 심볼별 업데이트 태스크 실행
+        # REFRESH_BATCH_SYMBOLS개씩 묶어 가격 조회 후 테이블별 일괄 upsert
         results = []
-        for symbol_id in symbol_ids:
-            result = update_symbol_data(symbol_id)
-            results.append(result)
+        for chunk in batched(symbol_ids, REFRESH_BATCH_SYMBOLS):
+            results.extend(_update_symbols_data(db, list(chunk)))
 
         # 성공/실패 카운트
         success_count = sum(1 for r in results if r.get("status") == "success")
@@ -257,11 +342,40 @@ def update_all_watchlist_symbols(self) -> dict:
         }
 
 
+@celery_app.task(base=DatabaseTask, bind=True, name="app.tasks.data_update.create_partitions")
+def create_partitions(self, days: int = 365) -> dict:
+    """
+    시계열 테이블 월 파티션 생성 (보존 기간 시작 월부터 PARTITION_MONTHS_AHEAD개월 뒤까지)
+
+    Args:
+        days: 유지할 일수 (cleanup_old_data와 같은 값, 기본값: 365일)
+
+    Returns:
+        생성 결과 딕셔너리
+    """
+    db = self.db
+
+    try:
+        created = ensure_partitions(db, date.today() - timedelta(days=days))
+        db.commit()
+        return {"status": "success", "created_partitions": created}
+
+    except Exception as e:
+        db.rollback()
+        return {
+            "status": "error",
+            "message": str(e),
+        }
+
+
 @celery_app.task(base=DatabaseTask, bind=True, name="app.tasks.data_update.cleanup_old_data")
 def cleanup_old_data(self, days: int = 365) -> dict:
     """
     오래된 데이터 정리 (1년 이상)
 
+    지표/시장 상태/시그널/재무 점수는 만료된 월 파티션을 통째로 분리/삭제합니다 (행 단위 DELETE 없음).
+    보존 기한이 속한 월의 파티션은 다음 달 정리 때까지 남아 있습니다.
+
     Args:
         days: 유지할 일수 (기본값: 365일)
 
@@ -273,19 +387,8 @@ def cleanup_old_data(self, days: int = 365) -> dict:
     try:
         cutoff_date = date.today() - timedelta(days=days)
 
-        # TechnicalIndicator 정리
-        deleted_indicators = (
-            db.query(TechnicalIndicator)
-            .filter(TechnicalIndicator.date < cutoff_date)
-            .delete(synchronize_session=False)
-        )
-
-        # MarketState 정리
-        deleted_states = (
-            db.query(MarketState)
-            .filter(MarketState.date < cutoff_date)
-            .delete(synchronize_session=False)
-        )
+        # TechnicalIndicator / MarketState / TradingSignal / FundamentalScore 파티션 정리
+        dropped_partitions = drop_expired_partitions(db, cutoff_date)
 
         # DataUpdateLog 정리 (90일 이상)
         log_cutoff_date = datetime.now() - timedelta(days=90)
@@ -299,8 +402,7 @@ def cleanup_old_data(self, days: int = 365) -> dict:
 
         return {
             "status": "success",
-            "deleted_indicators": deleted_indicators,
-            "deleted_market_states": deleted_states,
+            "dropped_partitions": dropped_partitions,
             "deleted_logs": deleted_logs,
             "cutoff_date": cutoff_date.isoformat(),
         }
@@ -0,0 +1,90 @@
+"""
+API 기동 import 예산 검사 - app.main import 시간과 무거운 모듈 로드 여부
+
+새 인터프리터에서 `python -X importtime -c "import app.main"`을 반복 실행하여
+import 시간(중앙값)과 누적 시간이 큰 모듈을 출력합니다.
+다음 중 하나라도 해당하면 종료 코드 1로 실패합니다.
+
+- app.main import 시간 중앙값이 --budget-ms 초과
+- 분석/업스트림 전용 모듈(pandas, numpy, yfinance, pyarrow 등)이 기동 시 import됨
+  (이 모듈은 첫 분석/업스트림 호출 시에만 import되어야 함)
+
+지연 import 회귀 검사는 tests/test_import_budget.py에서 pytest로 실행됩니다.
+
+Usage:
+    cd backend
+    python -m benchmarks.import_budget --budget-ms 2500 --repeat 5 --top 15
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# API 기동 시 import되면 안 되는 모듈 (첫 사용 시 지연 import)
+LAZY_MODULES = ("pandas", "numpy", "yfinance", "pyarrow", "talib")
+
+_PROBE = (
+    "import sys; import {target}; "
+    "print(','.join(m for m in {modules!r} if m in sys.modules))"
+)
+
+
+def _run_once(target: str) -> Tuple[Dict[str, int], List[str]]:
+    """새 인터프리터에서 target import (모듈별 누적 시간 μs, 로드된 지연 대상 모듈)"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE.format(target=target, modules=LAZY_MODULES)],
+        capture_output=True,
+        text=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"import {target} failed:\n{result.stderr[-2000:]}")
+
+    cumulative: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, module = line[len("import time:"):].split("|")
+        cumulative[module.strip()] = int(cumulative_us)
+
+    loaded = [m for m in result.stdout.strip().split(",") if m]
+    return cumulative, loaded
+
+
+def main(target: str, budget_ms: float, repeat: int, top: int) -> int:
+    runs = [_run_once(target) for _ in range(repeat)]
+    totals_ms = [cumulative[target] / 1000 for cumulative, _ in runs]
+    median_ms = statistics.median(totals_ms)
+
+    print(f"import {target}: median {median_ms:.0f} ms (min {min(totals_ms):.0f}, max {max(totals_ms):.0f})")
+    print(f"\n{'cumulative_ms':>14}  module")
+    cumulative, loaded = runs[-1]
+    top_level = {
+        module: us for module, us in cumulative.items() if "." not in module and module != target
+    }
+    for module, us in sorted(top_level.items(), key=lambda item: item[1], reverse=True)[:top]:
+        print(f"{us / 1000:>14.1f}  {module}")
+
+    failed = False
+    if median_ms > budget_ms:
+        print(f"\nFAIL: import time {median_ms:.0f} ms exceeds budget {budget_ms:.0f} ms")
+        failed = True
+    if loaded:
+        print(f"\nFAIL: modules that must be imported lazily were loaded: {', '.join(loaded)}")
+        failed = True
+    if not failed:
+        print(f"\nOK: within {budget_ms:.0f} ms budget, no lazy-only modules loaded")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--target", default="app.main")
+    parser.add_argument("--budget-ms", type=float, default=2500)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+    sys.exit(main(args.target, args.budget_ms, args.repeat, args.top))
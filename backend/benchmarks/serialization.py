@@ -0,0 +1,120 @@
+"""
+응답 직렬화 벤치마크 - 시그널 응답 크기별 직렬화/압축 비용
+
+GET /signals/{symbol} 형태의 응답(다중 타임프레임 분석 + 한글 추천 문구)을 크기별로 생성하여
+다음 경로의 1회당 비용을 비교합니다. DB/네트워크 없이 실행됩니다.
+
+- default:   jsonable_encoder + stdlib json (FastAPI 기본 JSONResponse 경로)
+- encoder+orjson: jsonable_encoder + orjson (dict 반환 + FastJSONResponse)
+- orjson:    orjson 직접 직렬화 (Response 직접 반환)
+- stored:    저장된 직렬화 응답 재사용 (trading_signals.response_json)
+- gzip:      GZipMiddleware 압축 비용 (compresslevel=5)
+
+Usage:
+    cd backend
+    python -m benchmarks.serialization --sizes 1 10 50 200 --repeat 200
+"""
+
+import argparse
+import gzip
+import json
+import statistics
+import time
+from datetime import datetime
+
+import numpy as np
+from fastapi.encoders import jsonable_encoder
+
+from app.core.responses import dumps
+
+RECOMMENDATION = "일봉 추세가 주봉과 정렬되어 있어 눌림목 분할 매수를 고려하세요"
+
+
+def build_payload(scale: int) -> dict:
+    """scale에 비례하는 크기의 시그널 응답 생성"""
+    timeframes = {
+        f"tf_{i}": {
+            "trend": "uptrend",
+            "strength": np.float64(0.5 + i / (scale * 10 + 1)),
+            "ma_alignment": [float(v) for v in np.linspace(100, 110, 10)],
+            "summary": RECOMMENDATION,
+        }
+        for i in range(scale * 3)
+    }
+    return {
+        "symbol": {"symbol": "AAPL", "name": "Apple Inc.", "exchange": "NASDAQ"},
+        "signal": {
+            "id": 123456,
+            "signal_type": "buy",
+            "signal_strength": "strong",
+            "current_price": 189.25,
+            "generated_at": datetime.utcnow().isoformat(),
+            "bar_date": "2026-10-16",
+        },
+        "f_score": {"score": 7, "max_score": 9, "details": {f"check_{i}": True for i in range(9)}},
+        "timeframe_analysis": {
+            "timeframes": timeframes,
+            "entry_analysis": {"recommendations": [RECOMMENDATION] * scale},
+        },
+        "conditions": {f"condition_{i}": bool(i % 2) for i in range(scale * 5)},
+        "recommendations": [RECOMMENDATION] * (scale * 2),
+        "risk_assessment": {"risk_level": "medium", "risk_factors": [RECOMMENDATION] * scale},
+        "technical_indicators": {"rsi": 55.2, "adx": 28.1, "sma_50": 180.3, "sma_200": 171.9},
+    }
+
+
+def _stdlib(payload: dict) -> bytes:
+    return json.dumps(
+        jsonable_encoder(payload),
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def _encoder_orjson(payload: dict) -> bytes:
+    return dumps(jsonable_encoder(payload))
+
+
+def _gzip(body: bytes) -> bytes:
+    return gzip.compress(body, compresslevel=5)
+
+
+def _time_us(func, arg, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(arg)
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 50, 200])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    print(
+        f"{'scale':>6} {'bytes':>9} {'gzip':>8} | {'default':>9} {'enc+orjson':>10} "
+        f"{'orjson':>8} {'stored':>7} {'gzip':>8}  (median µs)"
+    )
+    for scale in args.sizes:
+        payload = build_payload(scale)
+        body = dumps(payload)
+        compressed = _gzip(body)
+
+        default_us = _time_us(_stdlib, payload, args.repeat)
+        encoder_orjson_us = _time_us(_encoder_orjson, payload, args.repeat)
+        orjson_us = _time_us(dumps, payload, args.repeat)
+        stored_us = _time_us(bytes, body, args.repeat)
+        gzip_us = _time_us(_gzip, body, args.repeat)
+
+        print(
+            f"{scale:>6} {len(body):>9} {len(compressed):>8} | {default_us:>9.1f} "
+            f"{encoder_orjson_us:>10.1f} {orjson_us:>8.1f} {stored_us:>7.1f} {gzip_us:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
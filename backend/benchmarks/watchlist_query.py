@@ -0,0 +1,129 @@
+"""
+Watchlist 조회 벤치마크 - 최신 스냅샷 단일 조인 쿼리 vs 종목별 N+1 쿼리
+
+관심 종목 수를 늘려가며 두 방식의 지연 시간을 측정합니다.
+N+1 쿼리는 지표/시장 상태 이력 테이블을, 단일 쿼리는 symbol_latest_snapshot을 읽으므로
+이력과 함께 최신 행의 스냅샷도 생성합니다.
+테스트 데이터는 트랜잭션 안에서 생성되고 종료 시 롤백됩니다.
+
+Usage:
+    cd backend
+    python -m benchmarks.watchlist_query --sizes 10 50 100 300 --days 250 --repeat 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from datetime import date, timedelta
+
+from sqlalchemy import insert, select
+
+from app.api.v1.endpoints.watchlist import watchlist_detail_query
+from app.db.session import AsyncSessionLocal
+from app.models import MarketState, Symbol, TechnicalIndicator, User, Watchlist
+from app.services.snapshot import indicator_values, market_state_values, snapshot_upsert
+
+CLASSIFICATION = {
+    "trend_type": "range",
+    "volatility_level": "normal",
+    "risk_level": "stable",
+    "recommended_strategy": "range_trading",
+    "position_sizing_ratio": 1.0,
+}
+
+
+async def _seed(db, size: int, days: int) -> uuid.UUID:
+    """size개 종목 × days일 지표/시장 상태(및 최신 스냅샷)를 가진 사용자 생성"""
+    user_id = uuid.uuid4()
+    await db.execute(
+        insert(User).values(id=user_id, email=f"bench-{user_id}@example.com", hashed_password="x")
+    )
+    symbol_ids = (
+        await db.scalars(
+            insert(Symbol)
+            .values([{"symbol": f"BENCH{user_id.hex[:6]}{i}", "name": f"Bench {i}"} for i in range(size)])
+            .returning(Symbol.id)
+        )
+    ).all()
+
+    start = date.today() - timedelta(days=days)
+    indicator_rows, state_rows = [], []
+    for symbol_id in symbol_ids:
+        for offset in range(days):
+            day = start + timedelta(days=offset)
+            indicator_rows.append({"symbol_id": symbol_id, "date": day, "atr": 1.5, "adx": 25.0, "vix": 18.0})
+            state_rows.append({"symbol_id": symbol_id, "date": day, **CLASSIFICATION})
+
+    await db.execute(insert(TechnicalIndicator), indicator_rows)
+    await db.execute(insert(MarketState), state_rows)
+
+    # 최신 행 기준 스냅샷 (지표/분석 저장 경로와 같은 헬퍼 사용)
+    latest_day = start + timedelta(days=days - 1)
+    latest_row = {"close": 100.0, "atr": 1.5, "adx": 25.0}
+    for symbol_id in symbol_ids:
+        await db.execute(
+            snapshot_upsert(
+                symbol_id,
+                indicator_values(latest_row, latest_day, 18.0),
+                market_state_values(CLASSIFICATION, latest_day),
+            )
+        )
+    await db.execute(insert(Watchlist), [{"user_id": user_id, "symbol_id": sid} for sid in symbol_ids])
+    await db.flush()
+    return user_id
+
+
+async def _n_plus_one(db, user_id: uuid.UUID) -> int:
+    """이전 구현과 동일한 3N+1 쿼리 패턴"""
+    items = (await db.scalars(select(Watchlist).where(Watchlist.user_id == user_id))).all()
+    for item in items:
+        await db.get(Symbol, item.symbol_id)
+        await db.scalar(
+            select(TechnicalIndicator)
+            .where(TechnicalIndicator.symbol_id == item.symbol_id)
+            .order_by(TechnicalIndicator.date.desc())
+            .limit(1)
+        )
+        await db.scalar(
+            select(MarketState)
+            .where(MarketState.symbol_id == item.symbol_id)
+            .order_by(MarketState.date.desc())
+            .limit(1)
+        )
+    return len(items)
+
+
+async def _single_query(db, user_id: uuid.UUID) -> int:
+    return len((await db.execute(watchlist_detail_query(user_id))).all())
+
+
+async def _measure(db, func, user_id: uuid.UUID, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        db.expunge_all()
+        started = time.perf_counter()
+        await func(db, user_id)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+async def main(sizes, days: int, repeat: int) -> None:
+    print(f"{'size':>6} {'single_query_ms':>16} {'n_plus_one_ms':>14}")
+    for size in sizes:
+        async with AsyncSessionLocal() as db:
+            user_id = await _seed(db, size, days)
+            single = await _measure(db, _single_query, user_id, repeat)
+            n_plus_one = await _measure(db, _n_plus_one, user_id, repeat)
+            print(f"{size:>6} {single:>16.2f} {n_plus_one:>14.2f}")
+            await db.rollback()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 100, 300])
+    parser.add_argument("--days", type=int, default=250)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes, args.days, args.repeat))
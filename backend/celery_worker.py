@@ -6,8 +6,12 @@ Usage:
 
 For development with auto-reload:
     watchfiles 'celery -A celery_worker worker --loglevel=info' app/
+
+Metrics (aggregated across prefork child processes):
+    PROMETHEUS_MULTIPROC_DIR=/tmp/prom CELERY_METRICS_PORT=9808 celery -A celery_worker worker
 """
 
+from app.core import metrics  # noqa: F401  태스크 실행 시간 지표 + 지표 HTTP 서버
 from app.core.celery_app import celery_app
 from app.tasks import data_update  # noqa: F401
 
@@ -0,0 +1,103 @@
+"""
+Bulk Export CLI
+
+API 프로세스를 거치지 않고 DB에서 직접 서버 측 커서로 읽어 파일로 내보냅니다.
+EXPORT_CHUNK_ROWS 단위로 읽고 쓰므로 전체 종목 덤프도 메모리 사용량이 일정합니다.
+
+Usage:
+    cd backend
+    python export_data.py indicators --symbols AAPL MSFT --from 2024-01-01 --to 2024-12-31 -o indicators.csv
+    python export_data.py bars --format parquet -o bars.parquet     # 전체 종목
+    python export_data.py signals --format arrow -o signals.arrow
+"""
+
+import argparse
+import sys
+import time
+from datetime import date
+
+from app.db.session import engine
+from app.services.export import (
+    EXPORT_CHUNK_ROWS,
+    EXPORT_DATASETS,
+    arrow_batch,
+    arrow_schema,
+    encode_csv_chunk,
+    export_columns,
+    export_query,
+)
+
+
+def _iter_chunks(query, chunk_rows: int):
+    """서버 측 커서로 chunk_rows개씩 행 묶음 반환"""
+    with engine.connect() as conn:
+        result = conn.execution_options(stream_results=True, yield_per=chunk_rows).execute(query)
+        for partition in result.partitions(chunk_rows):
+            yield [tuple(row) for row in partition]
+
+
+def _write_csv(dataset: str, chunks, output) -> int:
+    total = 0
+    output.write(encode_csv_chunk([], export_columns(dataset)))
+    for rows in chunks:
+        output.write(encode_csv_chunk(rows))
+        total += len(rows)
+    return total
+
+
+def _write_arrow(dataset: str, chunks, path: str, file_format: str) -> int:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = arrow_schema(dataset)
+    if file_format == "parquet":
+        writer = pq.ParquetWriter(path, schema, compression="zstd")
+    else:
+        writer = pa.ipc.new_file(path, schema)
+
+    total = 0
+    try:
+        for rows in chunks:
+            # 청크마다 Parquet row group / Arrow 레코드 배치 하나씩 기록
+            writer.write_batch(arrow_batch(rows, schema))
+            total += len(rows)
+    finally:
+        writer.close()
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export stored market data")
+    parser.add_argument("dataset", choices=sorted(EXPORT_DATASETS))
+    parser.add_argument("--symbols", nargs="*", help="종목 목록 (생략 시 전체)")
+    parser.add_argument("--from", dest="from_date", type=date.fromisoformat)
+    parser.add_argument("--to", dest="to_date", type=date.fromisoformat)
+    parser.add_argument("--format", choices=("csv", "parquet", "arrow"), default="csv")
+    parser.add_argument("-o", "--output", help="출력 파일 (CSV는 생략 시 stdout)")
+    parser.add_argument("--chunk-rows", type=int, default=EXPORT_CHUNK_ROWS)
+    args = parser.parse_args()
+
+    if args.format != "csv" and not args.output:
+        parser.error(f"--output is required for {args.format}")
+
+    query = export_query(args.dataset, args.symbols, args.from_date, args.to_date)
+    chunks = _iter_chunks(query, args.chunk_rows)
+
+    started = time.perf_counter()
+    if args.format == "csv":
+        if args.output:
+            with open(args.output, "wb") as output:
+                total = _write_csv(args.dataset, chunks, output)
+        else:
+            total = _write_csv(args.dataset, chunks, sys.stdout.buffer)
+    else:
+        total = _write_arrow(args.dataset, chunks, args.output, args.format)
+
+    print(
+        f"exported {total} {args.dataset} rows in {time.perf_counter() - started:.1f}s",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+API 기동 import 검사
+
+분석/업스트림 전용 모듈은 첫 사용 시에만 import되어야 하고,
+지연 import 헬퍼는 실제로 호출했을 때 동작해야 합니다.
+import 시간 보고는 benchmarks/import_budget.py를 참고하세요.
+"""
+
+import os
+import subprocess
+import sys
+
+from benchmarks.import_budget import LAZY_MODULES
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run(code: str, *options: str) -> str:
+    """새 인터프리터에서 code 실행 후 표준 출력 반환"""
+    result = subprocess.run(
+        [sys.executable, *options, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=BACKEND_DIR,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    return result.stdout.strip()
+
+
+def test_app_main_does_not_import_lazy_modules():
+    loaded = _run(
+        "import sys; import app.main; "
+        f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))",
+        "-X",
+        "importtime",
+    )
+    assert loaded == ""
+
+
+def test_yf_ticker_returns_ticker():
+    returned = _run(
+        "from app.services.fmp_client import yf_ticker; print(type(yf_ticker('SPY')).__name__)"
+    )
+    assert returned == "Ticker"